@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_right, insort
+from itertools import islice
+from threading import Lock
+from typing import Any, Iterable
+
+PageKey = tuple[str, str]
+
+
+def approval_page_key(item: dict[str, Any]) -> PageKey:
+    # Same ordering as the approvals.updated_at column the stores page on.
+    return (item.get("resolved_at") or item["created_at"], item["queue_id"])
+
+
+class ApprovalIndex:
+    # Queue ids bucketed by (status, approver_group); each bucket stays sorted by the
+    # keyset (updated_at, queue_id), so a filtered page is a bisect plus a slice instead
+    # of a scan over every approval ever created.
+    def __init__(self, items: Iterable[dict[str, Any]] = ()) -> None:
+        self._lock = Lock()
+        self._buckets: dict[tuple[str, str | None], list[PageKey]] = {}
+        self._entries: dict[str, tuple[tuple[str, str | None], PageKey]] = {}
+        for item in items:
+            bucket_key = (item["status"], item.get("approver_group"))
+            page_key = approval_page_key(item)
+            self._buckets.setdefault(bucket_key, []).append(page_key)
+            self._entries[item["queue_id"]] = (bucket_key, page_key)
+        for bucket in self._buckets.values():
+            bucket.sort()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def update(self, item: dict[str, Any]) -> None:
+        bucket_key = (item["status"], item.get("approver_group"))
+        page_key = approval_page_key(item)
+        with self._lock:
+            previous = self._entries.get(item["queue_id"])
+            if previous == (bucket_key, page_key):
+                return
+            if previous is not None:
+                old_bucket = self._buckets[previous[0]]
+                del old_bucket[bisect_right(old_bucket, previous[1]) - 1]
+                if not old_bucket:
+                    del self._buckets[previous[0]]
+            insort(self._buckets.setdefault(bucket_key, []), page_key)
+            self._entries[item["queue_id"]] = (bucket_key, page_key)
+
+    def remove(self, queue_id: str) -> None:
+        with self._lock:
+            previous = self._entries.pop(queue_id, None)
+            if previous is None:
+                return
+            bucket = self._buckets[previous[0]]
+            del bucket[bisect_right(bucket, previous[1]) - 1]
+            if not bucket:
+                del self._buckets[previous[0]]
+
+    def page(
+        self,
+        status: str | None,
+        approver_group: str | None,
+        after: PageKey | None = None,
+        limit: int | None = None,
+    ) -> list[str]:
+        with self._lock:
+            slices: list[list[PageKey]] = []
+            for (bucket_status, bucket_group), bucket in self._buckets.items():
+                if status is not None and bucket_status != status:
+                    continue
+                if approver_group is not None and bucket_group != approver_group:
+                    continue
+                start = bisect_right(bucket, after) if after is not None else 0
+                slices.append(bucket[start:] if limit is None else bucket[start : start + limit])
+        merged = slices[0] if len(slices) == 1 else heapq.merge(*slices)
+        return [queue_id for _, queue_id in islice(merged, limit)]
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections import Counter
+from threading import Lock
+from typing import Any
+
+
+def event_deltas(event_type: str) -> dict[str, int]:
+    return {"events": 1, f"events:{event_type}": 1}
+
+
+def approval_deltas(previous_status: str | None, status: str) -> dict[str, int]:
+    if previous_status == status:
+        return {}
+    deltas = {f"approvals:{status}": 1}
+    if previous_status is not None:
+        deltas[f"approvals:{previous_status}"] = -1
+    return deltas
+
+
+class AuditCounters:
+    # Running totals behind GET /api/v1/audit/summary, keyed "events", "events:<event_type>"
+    # and "approvals:<status>". The store's audit_counters rows are updated in the same
+    # transaction as the event or approval write they count, so they survive a crash
+    # exactly. This is their in-memory mirror: loaded once at startup, then bumped by each
+    # committed delta, so reading the summary never touches the store. Counts written by
+    # other processes sharing the database show up here after a restart.
+    def __init__(self, initial: dict[str, int]) -> None:
+        self._lock = Lock()
+        self._values: Counter[str] = Counter(initial)
+        self._applied = 0
+
+    def apply(self, deltas: dict[str, int]) -> None:
+        if not deltas:
+            return
+        with self._lock:
+            self._values.update(deltas)
+            self._applied += 1
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._values)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"names": len(self._values), "applied": self._applied}
@@ -6,8 +6,10 @@ import hmac
 import json
 import os
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any
+from threading import Lock
+from typing import Any, Callable
 
 from fastapi import Header, HTTPException
 
@@ -29,6 +31,43 @@ def _is_enabled(name: str, *, default: bool = False) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+@dataclass(frozen=True)
+class AuthSettings:
+    mode: str
+    role_claim: str
+    idp_jwks_path: str
+    idp_issuer: str | None
+    idp_audience: str | None
+    local_secret: str
+    allow_trusted_sso_headers: bool
+    allow_compat_headers: bool
+    # Bumped on every reload; keys the token cache so nothing verified under older
+    # settings is served afterwards.
+    generation: int = 0
+
+    @classmethod
+    def from_env(cls, generation: int = 0) -> AuthSettings:
+        return cls(
+            mode=os.getenv("NEWCLAW_AUTH_MODE", "mixed").strip().lower(),
+            role_claim=os.getenv("NEWCLAW_IDP_ROLE_CLAIM", "role").strip() or "role",
+            idp_jwks_path=os.getenv("NEWCLAW_IDP_JWKS_PATH", "").strip(),
+            idp_issuer=os.getenv("NEWCLAW_IDP_ISSUER", "").strip() or None,
+            idp_audience=os.getenv("NEWCLAW_IDP_AUDIENCE", "").strip() or None,
+            local_secret=os.getenv("NEWCLAW_JWT_SECRET", "newclaw-dev-secret-change"),
+            allow_trusted_sso_headers=_is_enabled("NEWCLAW_ALLOW_TRUSTED_SSO_HEADERS", default=False),
+            allow_compat_headers=_is_enabled("NEWCLAW_ALLOW_COMPAT_HEADERS", default=True),
+            generation=generation,
+        )
+
+
+# Read once at import; call reload_auth_settings() after changing the environment.
+_AUTH_SETTINGS = AuthSettings.from_env()
+
+
+def auth_settings() -> AuthSettings:
+    return _AUTH_SETTINGS
+
+
 def _b64url_decode(value: str) -> bytes:
     padding = "=" * (-len(value) % 4)
     return base64.urlsafe_b64decode(value + padding)
@@ -49,6 +88,19 @@ def _split_jwt(token: str) -> tuple[str, str, str]:
     return parts[0], parts[1], parts[2]
 
 
+@dataclass(frozen=True)
+class _ParsedJwt:
+    header_b64: str
+    payload_b64: str
+    signature_b64: str
+    header: dict[str, Any]
+    payload: dict[str, Any]
+
+    @property
+    def signing_input(self) -> bytes:
+        return f"{self.header_b64}.{self.payload_b64}".encode("utf-8")
+
+
 def _decode_json_part(value: str) -> dict[str, Any]:
     try:
         return json.loads(_b64url_decode(value).decode("utf-8"))
@@ -85,61 +137,117 @@ def _validate_common_claims(payload: dict[str, Any], *, expected_issuer: str | N
             raise _auth_error("audience mismatch")
 
 
-def _decode_local_jwt_hs256(token: str, secret: str) -> dict[str, Any]:
+def _parse_jwt(token: str) -> _ParsedJwt:
     header_b64, payload_b64, signature_b64 = _split_jwt(token)
-    header = _decode_json_part(header_b64)
-    payload = _decode_json_part(payload_b64)
+    return _ParsedJwt(
+        header_b64=header_b64,
+        payload_b64=payload_b64,
+        signature_b64=signature_b64,
+        header=_decode_json_part(header_b64),
+        payload=_decode_json_part(payload_b64),
+    )
+
 
-    if header.get("alg") != "HS256":
+def _decode_local_jwt_hs256(token: _ParsedJwt, secret: str) -> dict[str, Any]:
+    if token.header.get("alg") != "HS256":
         raise _auth_error("unsupported token alg for local auth")
 
-    signing_input = f"{header_b64}.{payload_b64}".encode("utf-8")
-    expected_sig = hmac.new(secret.encode("utf-8"), signing_input, hashlib.sha256).digest()
+    expected_sig = hmac.new(secret.encode("utf-8"), token.signing_input, hashlib.sha256).digest()
     expected_b64 = _b64url_encode(expected_sig)
-    if not hmac.compare_digest(signature_b64, expected_b64):
+    if not hmac.compare_digest(token.signature_b64, expected_b64):
         raise _auth_error("invalid bearer token signature")
 
-    _validate_common_claims(payload, expected_issuer=None, expected_audience=None)
-    return payload
+    _validate_common_claims(token.payload, expected_issuer=None, expected_audience=None)
+    return token.payload
+
+
+# Parsed JWKS files by path. An entry is reused while the file's (mtime, size, inode) is
+# unchanged, so a request costs one stat() instead of open + read + JSON parse. A file
+# modified within JWKS_RACY_WINDOW_NS of the last check is re-read and compared by digest:
+# a same-size rewrite inside one filesystem timestamp tick would otherwise look unchanged,
+# and a rotated-out key must stop verifying immediately.
+JWKS_RACY_WINDOW_NS = 2_000_000_000
+
+
+class _JwksEntry:
+    def __init__(self, file_state: tuple[int, int, int], digest: bytes, checked_at_ns: int, jwks: Any) -> None:
+        self.file_state = file_state
+        self.digest = digest
+        self.checked_at_ns = checked_at_ns
+        keys = jwks.get("keys") if isinstance(jwks, dict) else None
+        self.keys: list[dict[str, Any]] = keys if isinstance(keys, list) else []
+        self.index_by_kid: dict[str, int] = {}
+        for index, key in enumerate(self.keys):
+            if isinstance(key, dict) and isinstance(key.get("kid"), str):
+                self.index_by_kid.setdefault(key["kid"], index)
+        # (key index, alg) -> verification key, built on first use.
+        self.prepared: dict[tuple[int, str], Any] = {}
+
 
+_JWKS_CACHE: dict[str, _JwksEntry] = {}
+_JWKS_CACHE_LOCK = Lock()
 
-def _load_jwks_from_file(path: str) -> dict[str, Any]:
+
+def _load_jwks(path: str) -> _JwksEntry:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError as exc:
+        raise _auth_error(f"jwks file not found: {path}") from exc
+    except OSError as exc:  # pragma: no cover - defensive
+        raise _auth_error(f"failed to read jwks: {exc}") from exc
+    file_state = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    entry = _JWKS_CACHE.get(path)
+    if (
+        entry is not None
+        and entry.file_state == file_state
+        and stat.st_mtime_ns + JWKS_RACY_WINDOW_NS < entry.checked_at_ns
+    ):
+        return entry
+
+    checked_at_ns = time.time_ns()
     try:
-        with open(path, "r", encoding="utf-8") as fh:
-            return json.loads(fh.read())
+        with open(path, "rb") as fh:
+            content = fh.read()
     except FileNotFoundError as exc:
         raise _auth_error(f"jwks file not found: {path}") from exc
     except Exception as exc:  # pragma: no cover - defensive
         raise _auth_error(f"failed to read jwks: {exc}") from exc
+    digest = hashlib.sha256(content).digest()
+    if entry is not None and entry.digest == digest:
+        entry.file_state = file_state
+        entry.checked_at_ns = checked_at_ns
+        return entry
+    try:
+        jwks = json.loads(content.decode("utf-8"))
+    except Exception as exc:  # pragma: no cover - defensive
+        raise _auth_error(f"failed to read jwks: {exc}") from exc
+    entry = _JwksEntry(file_state, digest, checked_at_ns, jwks)
+    with _JWKS_CACHE_LOCK:
+        _JWKS_CACHE[path] = entry
+    return entry
 
 
-def _lookup_jwk(jwks: dict[str, Any], kid: str | None) -> dict[str, Any]:
-    keys = jwks.get("keys")
-    if not isinstance(keys, list) or not keys:
+def _lookup_jwk(entry: _JwksEntry, kid: str | None) -> int:
+    if not entry.keys:
         raise _auth_error("jwks has no keys")
     if kid:
-        for key in keys:
-            if key.get("kid") == kid:
-                return key
-        raise _auth_error("jwks key not found for kid")
-    return keys[0]
+        index = entry.index_by_kid.get(kid)
+        if index is None:
+            raise _auth_error("jwks key not found for kid")
+        return index
+    return 0
 
 
-def _verify_jwk_hs256(header_b64: str, payload_b64: str, signature_b64: str, jwk: dict[str, Any]) -> None:
+def _build_hs256_key(jwk: dict[str, Any]) -> bytes:
     if jwk.get("kty") != "oct":
         raise _auth_error("invalid jwk type for hs256")
     encoded_key = jwk.get("k")
     if not isinstance(encoded_key, str):
         raise _auth_error("jwks key missing 'k'")
-
-    secret = _b64url_decode(encoded_key)
-    signing_input = f"{header_b64}.{payload_b64}".encode("utf-8")
-    expected_sig = hmac.new(secret, signing_input, hashlib.sha256).digest()
-    if not hmac.compare_digest(signature_b64, _b64url_encode(expected_sig)):
-        raise _auth_error("invalid idp token signature")
+    return _b64url_decode(encoded_key)
 
 
-def _verify_jwk_rs256(header_b64: str, payload_b64: str, signature_b64: str, jwk: dict[str, Any]) -> None:
+def _build_rs256_key(jwk: dict[str, Any]) -> Any:
     if jwk.get("kty") != "RSA":
         raise _auth_error("invalid jwk type for rs256")
     n_b64 = jwk.get("n")
@@ -148,41 +256,57 @@ def _verify_jwk_rs256(header_b64: str, payload_b64: str, signature_b64: str, jwk
         raise _auth_error("jwks rsa key missing n/e")
 
     try:
-        from cryptography.hazmat.primitives import hashes
-        from cryptography.hazmat.primitives.asymmetric import padding, rsa
+        from cryptography.hazmat.primitives.asymmetric import rsa
     except Exception as exc:  # pragma: no cover - optional dependency
         raise _auth_error("rs256 verification requires cryptography package") from exc
 
     n = int.from_bytes(_b64url_decode(n_b64), byteorder="big")
     e = int.from_bytes(_b64url_decode(e_b64), byteorder="big")
-    public_key = rsa.RSAPublicNumbers(e=e, n=n).public_key()
-    signature = _b64url_decode(signature_b64)
-    signing_input = f"{header_b64}.{payload_b64}".encode("utf-8")
+    return rsa.RSAPublicNumbers(e=e, n=n).public_key()
+
+
+def _prepared_key(entry: _JwksEntry, index: int, alg: str) -> Any:
+    key = entry.prepared.get((index, alg))
+    if key is None:
+        jwk = entry.keys[index]
+        if not isinstance(jwk, dict):
+            raise _auth_error("invalid jwk entry")
+        key = _build_hs256_key(jwk) if alg == "HS256" else _build_rs256_key(jwk)
+        entry.prepared[(index, alg)] = key
+    return key
+
+
+def _verify_hs256(token: _ParsedJwt, secret: bytes) -> None:
+    expected_sig = hmac.new(secret, token.signing_input, hashlib.sha256).digest()
+    if not hmac.compare_digest(token.signature_b64, _b64url_encode(expected_sig)):
+        raise _auth_error("invalid idp token signature")
+
+
+def _verify_rs256(token: _ParsedJwt, public_key: Any) -> None:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+
+    signature = _b64url_decode(token.signature_b64)
     try:
-        public_key.verify(signature, signing_input, padding.PKCS1v15(), hashes.SHA256())
+        public_key.verify(signature, token.signing_input, padding.PKCS1v15(), hashes.SHA256())
     except Exception as exc:  # pragma: no cover - defensive
         raise _auth_error(f"invalid idp token signature: {exc}") from exc
 
 
-def _decode_idp_jwt(token: str, *, jwks_path: str, issuer: str | None, audience: str | None) -> dict[str, Any]:
-    header_b64, payload_b64, signature_b64 = _split_jwt(token)
-    header = _decode_json_part(header_b64)
-    payload = _decode_json_part(payload_b64)
-    alg = header.get("alg")
-    kid = header.get("kid")
-
-    jwks = _load_jwks_from_file(jwks_path)
-    jwk = _lookup_jwk(jwks, kid)
+def _decode_idp_jwt(token: _ParsedJwt, settings: AuthSettings) -> tuple[dict[str, Any], _JwksEntry]:
+    alg = token.header.get("alg")
+    jwks = _load_jwks(settings.idp_jwks_path)
+    index = _lookup_jwk(jwks, token.header.get("kid"))
 
     if alg == "HS256":
-        _verify_jwk_hs256(header_b64, payload_b64, signature_b64, jwk)
+        _verify_hs256(token, _prepared_key(jwks, index, alg))
     elif alg == "RS256":
-        _verify_jwk_rs256(header_b64, payload_b64, signature_b64, jwk)
+        _verify_rs256(token, _prepared_key(jwks, index, alg))
     else:
         raise _auth_error(f"unsupported idp token alg: {alg}")
 
-    _validate_common_claims(payload, expected_issuer=issuer, expected_audience=audience)
-    return payload
+    _validate_common_claims(token.payload, expected_issuer=settings.idp_issuer, expected_audience=settings.idp_audience)
+    return token.payload, jwks
 
 
 def _claims_to_actor(payload: dict[str, Any], *, role_claim: str, source: str) -> ActorContext:
@@ -193,52 +317,169 @@ def _claims_to_actor(payload: dict[str, Any], *, role_claim: str, source: str) -
     return ActorContext(actor_id=sub, actor_role=role, source=source)
 
 
-def _resolve_bearer_actor(token: str) -> ActorContext:
-    mode = os.getenv("NEWCLAW_AUTH_MODE", "mixed").strip().lower()
-    role_claim = os.getenv("NEWCLAW_IDP_ROLE_CLAIM", "role").strip() or "role"
-    idp_jwks_path = os.getenv("NEWCLAW_IDP_JWKS_PATH", "").strip()
-    idp_issuer = os.getenv("NEWCLAW_IDP_ISSUER", "").strip() or None
-    idp_audience = os.getenv("NEWCLAW_IDP_AUDIENCE", "").strip() or None
-    local_secret = os.getenv("NEWCLAW_JWT_SECRET", "newclaw-dev-secret-change")
+# What a successful verification produced: the actor, the verified claims, and the JWKS
+# (path, entry) it was checked against (None for locally signed tokens).
+VerifiedToken = tuple[ActorContext, dict[str, Any], tuple[str, _JwksEntry] | None]
 
-    if mode == "local":
-        return _claims_to_actor(_decode_local_jwt_hs256(token, local_secret), role_claim="role", source="jwt")
 
-    if mode == "idp":
-        if not idp_jwks_path:
+def _resolve_bearer_actor(token: str, settings: AuthSettings) -> VerifiedToken:
+    # The token is split and decoded once; mixed-mode routing and the chosen verifier
+    # share the parsed parts.
+    parsed = _parse_jwt(token)
+    if settings.mode == "local":
+        use_idp = False
+    elif settings.mode == "idp":
+        if not settings.idp_jwks_path:
             raise _auth_error("idp mode requires NEWCLAW_IDP_JWKS_PATH")
-        return _claims_to_actor(
-            _decode_idp_jwt(token, jwks_path=idp_jwks_path, issuer=idp_issuer, audience=idp_audience),
-            role_claim=role_claim,
-            source="idp",
-        )
+        use_idp = True
+    else:
+        # mixed mode: if token issuer matches configured IdP issuer, enforce IdP verification.
+        use_idp = False
+        if settings.idp_jwks_path:
+            if settings.idp_issuer:
+                use_idp = str(parsed.payload.get("iss") or "").strip() == settings.idp_issuer
+            else:
+                use_idp = bool(parsed.header.get("kid"))
+
+    if use_idp:
+        payload, jwks = _decode_idp_jwt(parsed, settings)
+        actor = _claims_to_actor(payload, role_claim=settings.role_claim, source="idp")
+        return actor, payload, (settings.idp_jwks_path, jwks)
+
+    payload = _decode_local_jwt_hs256(parsed, settings.local_secret)
+    return _claims_to_actor(payload, role_claim="role", source="jwt"), payload, None
+
+
+def _resolve_sso_token_actor(token: str, settings: AuthSettings) -> VerifiedToken:
+    if not settings.idp_jwks_path:
+        raise _auth_error("sso token provided but NEWCLAW_IDP_JWKS_PATH is not configured")
+    payload, jwks = _decode_idp_jwt(_parse_jwt(token), settings)
+    actor = _claims_to_actor(payload, role_claim=settings.role_claim, source="idp")
+    return actor, payload, (settings.idp_jwks_path, jwks)
+
+
+class TokenCache:
+    # Verified tokens (by digest) -> ActorContext, bounded with LRU eviction. An entry is
+    # served until the token's exp (ttl_seconds when it has none) and, for IdP tokens, only
+    # while the JWKS entry it was verified against is still current for that path.
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max(max_entries, 0)
+        self.ttl_seconds = ttl_seconds
+        self._lock = Lock()
+        self._entries: OrderedDict[Any, tuple[ActorContext, float, tuple[str, _JwksEntry] | None]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._verify_count = 0
+        self._verify_total = 0.0
+        self._verify_max = 0.0
+
+    def get(self, key: Any) -> ActorContext | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None:
+            actor, expires_at, jwks = entry
+            valid = time.time() < expires_at
+            if valid and jwks is not None:
+                try:
+                    valid = _load_jwks(jwks[0]) is jwks[1]
+                except HTTPException:
+                    valid = False
+            if valid:
+                with self._lock:
+                    self._hits += 1
+                return actor
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+                    self._invalidations += 1
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(self, key: Any, verified: VerifiedToken, verify_seconds: float) -> None:
+        actor, payload, jwks = verified
+        try:
+            # Same rule as _validate_common_claims: valid through the whole second of exp.
+            expires_at = float(int(payload["exp"]) + 1) if payload.get("exp") is not None else None
+        except (TypeError, ValueError):
+            return
+        if expires_at is None:
+            expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._verify_count += 1
+            self._verify_total += verify_seconds
+            self._verify_max = max(self._verify_max, verify_seconds)
+            self._entries[key] = (actor, expires_at, jwks)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "verify_seconds_avg": round(self._verify_total / self._verify_count, 6) if self._verify_count else 0.0,
+                "verify_seconds_max": round(self._verify_max, 6),
+            }
+
+
+TOKEN_CACHE = TokenCache(
+    int(os.getenv("NEWCLAW_AUTH_TOKEN_CACHE_SIZE", "4096")),
+    float(os.getenv("NEWCLAW_AUTH_TOKEN_CACHE_TTL_SECONDS", "300")),
+)
+
+
+def _cached_actor(
+    kind: str,
+    token: str,
+    settings: AuthSettings,
+    resolve: Callable[[str, AuthSettings], VerifiedToken],
+) -> ActorContext:
+    if not TOKEN_CACHE.max_entries:
+        return resolve(token, settings)[0]
+    key = (kind, hashlib.sha256(token.encode("utf-8")).digest(), settings.generation)
+    actor = TOKEN_CACHE.get(key)
+    if actor is not None:
+        return actor
+    started = time.perf_counter()
+    verified = resolve(token, settings)
+    TOKEN_CACHE.put(key, verified, time.perf_counter() - started)
+    return verified[0]
 
-    # mixed mode: if token issuer matches configured IdP issuer, enforce IdP verification.
-    header_b64, payload_b64, _ = _split_jwt(token)
-    header = _decode_json_part(header_b64)
-    payload = _decode_json_part(payload_b64)
-    token_iss = str(payload.get("iss") or "").strip()
-    should_try_idp = False
-    if idp_jwks_path:
-        if idp_issuer:
-            should_try_idp = token_iss == idp_issuer
-        else:
-            should_try_idp = bool(header.get("kid"))
-
-    if should_try_idp:
-        return _claims_to_actor(
-            _decode_idp_jwt(token, jwks_path=idp_jwks_path, issuer=idp_issuer, audience=idp_audience),
-            role_claim=role_claim,
-            source="idp",
-        )
 
-    return _claims_to_actor(_decode_local_jwt_hs256(token, local_secret), role_claim="role", source="jwt")
+def reload_auth_settings() -> AuthSettings:
+    # Re-reads the NEWCLAW_AUTH_* / NEWCLAW_IDP_* / NEWCLAW_JWT_SECRET environment and
+    # drops every cached token verified under the previous settings.
+    global _AUTH_SETTINGS
+    _AUTH_SETTINGS = AuthSettings.from_env(generation=_AUTH_SETTINGS.generation + 1)
+    TOKEN_CACHE.clear()
+    return _AUTH_SETTINGS
+
+
+def token_cache_stats() -> dict[str, Any]:
+    return TOKEN_CACHE.stats()
 
 
 def issue_dev_jwt(sub: str, role: str, *, expires_in_seconds: int = 3600, secret: str | None = None) -> str:
     if role not in VALID_ROLES:
         raise ValueError(f"unsupported role: {role}")
-    secret_value = secret or os.getenv("NEWCLAW_JWT_SECRET", "newclaw-dev-secret-change")
+    secret_value = secret or _AUTH_SETTINGS.local_secret
     now = int(time.time())
     payload = {"sub": sub, "role": role, "iat": now, "exp": now + expires_in_seconds}
     header = {"alg": "HS256", "typ": "JWT"}
@@ -258,35 +499,25 @@ def resolve_actor_context(
     sso_role: str | None,
     sso_token: str | None,
 ) -> ActorContext:
-    auth_mode = os.getenv("NEWCLAW_AUTH_MODE", "mixed").strip().lower()
+    settings = _AUTH_SETTINGS
 
     if authorization and authorization.lower().startswith("bearer "):
         token = authorization.split(" ", 1)[1].strip()
-        return _resolve_bearer_actor(token)
+        return _cached_actor("bearer", token, settings, _resolve_bearer_actor)
 
     if sso_token:
-        idp_jwks_path = os.getenv("NEWCLAW_IDP_JWKS_PATH", "").strip()
-        if not idp_jwks_path:
-            raise _auth_error("sso token provided but NEWCLAW_IDP_JWKS_PATH is not configured")
-        role_claim = os.getenv("NEWCLAW_IDP_ROLE_CLAIM", "role").strip() or "role"
-        claims = _decode_idp_jwt(
-            sso_token.strip(),
-            jwks_path=idp_jwks_path,
-            issuer=os.getenv("NEWCLAW_IDP_ISSUER", "").strip() or None,
-            audience=os.getenv("NEWCLAW_IDP_AUDIENCE", "").strip() or None,
-        )
-        return _claims_to_actor(claims, role_claim=role_claim, source="idp")
+        return _cached_actor("sso", sso_token.strip(), settings, _resolve_sso_token_actor)
 
-    if auth_mode == "idp":
+    if settings.mode == "idp":
         raise _auth_error("idp mode requires token-based authentication")
 
-    if sso_user and sso_role and _is_enabled("NEWCLAW_ALLOW_TRUSTED_SSO_HEADERS", default=False):
+    if sso_user and sso_role and settings.allow_trusted_sso_headers:
         role = sso_role.strip().lower()
         if role not in VALID_ROLES:
             raise _auth_error("invalid sso role")
         return ActorContext(actor_id=sso_user.strip(), actor_role=role, source="sso")
 
-    if actor_id and actor_role and _is_enabled("NEWCLAW_ALLOW_COMPAT_HEADERS", default=True):
+    if actor_id and actor_role and settings.allow_compat_headers:
         role = actor_role.strip().lower()
         if role not in VALID_ROLES:
             raise _auth_error("invalid header role")
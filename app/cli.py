@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 import sys
-from pathlib import Path
 from typing import Any
 from urllib import error, request
 
@@ -136,16 +135,13 @@ def show_result() -> None:
     _print_status(resp)
     if resp.get("status") != "DONE":
         return
-    result = resp.get("result") or {}
-    report_path = result.get("report_path")
-    if not report_path:
-        return
-    path = Path(report_path)
-    if not path.exists():
-        print("결과 파일이 아직 로컬에 없습니다.\n")
+    # The server reads the report through its storage backend (local or s3).
+    report = _http_json("GET", f"/api/v1/task/result/{task_id}", actor_id=ACTOR_ID, actor_role=ACTOR_ROLE)
+    if "content" not in report:
+        print("결과 파일을 읽을 수 없습니다.\n")
         return
     print("[결과 미리보기]")
-    preview = path.read_text(encoding="utf-8").splitlines()[:20]
+    preview = report["content"].splitlines()[:20]
     for line in preview:
         print(line)
     print()
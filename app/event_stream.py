@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Callable, Iterator
+
+
+class StreamCapacityExceeded(RuntimeError):
+    pass
+
+
+class EventBroker:
+    # Wakes up readers awaiting a key (task_id) when a new event is published for it.
+    # Readers wait on the event loop, not on a worker thread, so an idle long-poll or SSE
+    # client costs an asyncio.Event instead of a threadpool slot. publish() is called from
+    # pipeline and handler threads and hands the wake-up to each waiter's loop. Entries
+    # exist only while someone is waiting, so publishing to an unwatched task costs a
+    # single dict lookup.
+    def __init__(self, max_waiters: int = 1000) -> None:
+        self.max_waiters = max(max_waiters, 1)
+        self._lock = Lock()
+        self._subscribers: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._waiters = 0
+
+    def at_capacity(self) -> bool:
+        with self._lock:
+            return self._waiters >= self.max_waiters
+
+    @contextmanager
+    def _subscribe(self, key: str) -> Iterator[asyncio.Event]:
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            if self._waiters >= self.max_waiters:
+                raise StreamCapacityExceeded(f"event stream waiters exceeded {self.max_waiters}")
+            self._subscribers.setdefault(key, []).append(waiter)
+            self._waiters += 1
+        try:
+            yield waiter[1]
+        finally:
+            with self._lock:
+                waiters = self._subscribers[key]
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._subscribers[key]
+                self._waiters -= 1
+
+    def publish(self, key: str) -> None:
+        with self._lock:
+            waiters = list(self._subscribers.get(key, ()))
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The waiter's loop has shut down; its subscription goes away with it.
+                continue
+
+    async def wait_for(self, key: str, fetch: Callable[[], list[Any]], timeout: float) -> list[Any]:
+        # Returns fetch()'s first non-empty result, or [] once the timeout passes. fetch runs
+        # on the event loop and must not block. The event is cleared before each fetch, so
+        # an event published between the check and the wait is never missed (publishers
+        # make the event visible before calling publish()).
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(timeout, 0.0)
+        with self._subscribe(key) as notified:
+            while True:
+                notified.clear()
+                items = fetch()
+                if items:
+                    return items
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return []
+                try:
+                    await asyncio.wait_for(notified.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "watched_keys": len(self._subscribers),
+                "waiters": self._waiters,
+                "max_waiters": self.max_waiters,
+            }
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import time
+import zlib
+from contextlib import contextmanager
+from threading import Lock
+from typing import Callable, Iterable, Iterator
+
+
+class StripedLock:
+    # Maps each task_id onto one of a fixed set of locks so unrelated tasks do not
+    # serialize on a single global lock. A task always hashes to the same stripe, so
+    # every state transition for that task is still applied one at a time.
+    def __init__(self, stripes: int = 64, observer: Callable[[float, float], None] | None = None) -> None:
+        if stripes < 1:
+            raise ValueError("stripes must be >= 1")
+        self._locks = tuple(Lock() for _ in range(stripes))
+        # Called with (wait_seconds, hold_seconds) after every hold()/hold_many().
+        self._observer = observer
+
+    @property
+    def stripes(self) -> int:
+        return len(self._locks)
+
+    def _index(self, key: str) -> int:
+        return zlib.crc32(key.encode("utf-8")) % len(self._locks)
+
+    def for_key(self, key: str) -> Lock:
+        return self._locks[self._index(key)]
+
+    @contextmanager
+    def hold(self, key: str) -> Iterator[None]:
+        lock = self.for_key(key)
+        if self._observer is None:
+            with lock:
+                yield
+            return
+        requested = time.perf_counter()
+        with lock:
+            acquired = time.perf_counter()
+            try:
+                yield
+            finally:
+                released = time.perf_counter()
+        self._observer(acquired - requested, released - acquired)
+
+    @contextmanager
+    def hold_many(self, keys: Iterable[str]) -> Iterator[None]:
+        # Stripes are always taken in ascending index order, so two bulk holders can never
+        # deadlock each other, and a plain hold() only ever waits on a single stripe.
+        locks = [self._locks[idx] for idx in sorted({self._index(key) for key in keys})]
+        acquired: list[Lock] = []
+        requested = time.perf_counter()
+        held_at = requested
+        try:
+            for lock in locks:
+                lock.acquire()
+                acquired.append(lock)
+            held_at = time.perf_counter()
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+            if self._observer is not None and len(acquired) == len(locks):
+                self._observer(held_at - requested, time.perf_counter() - held_at)
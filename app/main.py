@@ -1,17 +1,39 @@
 from __future__ import annotations
 
+import base64
+import itertools
+import json
+import os
+import re
+import time
+from bisect import bisect_right
+from contextlib import asynccontextmanager, contextmanager, nullcontext
 from datetime import datetime, timezone
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from threading import Lock, Thread
-from typing import Any
+from threading import Lock, Timer, local
+from typing import Any, AsyncIterator, Callable, Iterator, Literal
 from uuid import uuid4
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Query
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
+from fastapi.routing import APIRoute
 from pydantic import BaseModel, Field
-
-from app.auth import ActorContext, VALID_ROLES, actor_context_dependency
+from starlette.concurrency import run_in_threadpool
+
+from app.approval_index import ApprovalIndex, PageKey, approval_page_key
+from app.audit_counters import AuditCounters, approval_deltas, event_deltas
+from app.auth import ActorContext, VALID_ROLES, actor_context_dependency, token_cache_stats
+from app.event_stream import EventBroker, StreamCapacityExceeded
+from app.locking import StripedLock
+from app.metrics import GaugeCallback, Histogram, InstrumentedStateStore, MetricsRegistry
 from app.persistence import create_state_store
+from app.policy import DEFAULT_POLICY_RULES_PATH, PolicyStore
+from app.profiling import create_profiler
+from app.render_cache import RenderCache, render_cache_key
+from app.report_storage import ReportWriter, create_report_storage
+from app.scheduler import PipelineScheduler, SchedulerSaturated
 
 
 class TaskStatus(str, Enum):
@@ -36,6 +58,11 @@ class CreateTaskRequest(BaseModel):
     requested_by: str = Field(min_length=1, max_length=100)
 
 
+class BatchCreateTaskRequest(BaseModel):
+    items: list[CreateTaskRequest] = Field(min_length=1, max_length=1000)
+    start: bool = False
+
+
 class RunTaskRequest(BaseModel):
     task_id: str = Field(min_length=1)
     idempotency_key: str | None = None
@@ -47,29 +74,215 @@ class ApprovalDecisionRequest(BaseModel):
     comment: str | None = None
 
 
-APP = FastAPI(title="Local Work Delegation Orchestrator", version="0.1.0")
+class BulkApprovalDecisionRequest(BaseModel):
+    queue_ids: list[str] = Field(min_length=1, max_length=10000)
+    action: Literal["APPROVE", "REJECT"]
+    acted_by: str = Field(min_length=1, max_length=100)
+    comment: str | None = None
 
-STORE_LOCK = Lock()
-STATE_STORE = create_state_store()
-TASKS, TASK_EVENTS, APPROVAL_QUEUE, APPROVAL_ACTIONS, RUN_IDEMPOTENCY = STATE_STORE.load_state()
 
-REPORTS_ROOT = Path("reports")
+# Opt-in (NEWCLAW_PROFILING / NEWCLAW_PROFILE_SAMPLE_RATE). Must be installed before any
+# route is declared; when disabled, routes and the pipeline run exactly as before.
+PROFILER = create_profiler()
+ROUTER = APIRouter(route_class=PROFILER.route_class() if PROFILER is not None else APIRoute)
+
+METRICS = MetricsRegistry()
+STAGE_SECONDS = METRICS.register(
+    Histogram("newclaw_stage_duration_seconds", "Time a task spends in each pipeline stage.", ("stage",))
+)
+RUN_SECONDS = METRICS.register(
+    Histogram(
+        "newclaw_run_duration_seconds",
+        "Task run latency from RUNNING until DONE or NEEDS_HUMAN_APPROVAL, retries included.",
+        ("outcome",),
+    )
+)
+LOCK_WAIT_SECONDS = METRICS.register(
+    Histogram("newclaw_task_lock_wait_seconds", "Time spent waiting to acquire a task lock stripe.")
+)
+LOCK_HOLD_SECONDS = METRICS.register(
+    Histogram("newclaw_task_lock_hold_seconds", "Time a task lock stripe is held.")
+)
+STORE_SECONDS = METRICS.register(
+    Histogram("newclaw_state_store_seconds", "StateStore call latency; transaction covers the commit.", ("method",))
+)
+
+
+def _observe_lock(wait_seconds: float, hold_seconds: float) -> None:
+    LOCK_WAIT_SECONDS.observe(wait_seconds)
+    LOCK_HOLD_SECONDS.observe(hold_seconds)
+
+
+TASK_LOCKS = StripedLock(int(os.getenv("NEWCLAW_LOCK_STRIPES", "64")), observer=_observe_lock)
+SCHEDULER = PipelineScheduler(
+    workers=int(os.getenv("NEWCLAW_SCHEDULER_WORKERS", "4")),
+    queue_size=int(os.getenv("NEWCLAW_SCHEDULER_QUEUE_SIZE", "256")),
+    backlog_size=int(os.getenv("NEWCLAW_SCHEDULER_BACKLOG_SIZE", "10000")),
+)
+# Backoff between attempts to requeue a retry while the scheduler backlog is full.
+REQUEUE_BACKOFF_SECONDS = float(os.getenv("NEWCLAW_REQUEUE_BACKOFF_SECONDS", "0.5"))
+REQUEUE_BACKOFF_MAX_SECONDS = float(os.getenv("NEWCLAW_REQUEUE_BACKOFF_MAX_SECONDS", "30"))
+# Lazy hydration keeps only non-terminal tasks and pending approvals in memory; terminal
+# history is read from the store on demand so cold start does not grow with history.
+LAZY_HYDRATION = os.getenv("NEWCLAW_STATE_HYDRATION", "eager").strip().lower() == "lazy"
+
+
+def _build_event_index(events: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    index: dict[str, list[dict[str, Any]]] = {}
+    for event in events:
+        index.setdefault(event["task_id"], []).append(event)
+    return index
+
+
+# Built by init_runtime(), not at import: opening the store runs its DDL and hydration
+# reads state, and importing this module (tests, tools, `--factory` servers) should not.
+STATE_STORE: InstrumentedStateStore
+TASKS: dict[str, dict[str, Any]]
+TASK_EVENTS: list[dict[str, Any]]
+APPROVAL_QUEUE: dict[str, dict[str, Any]]
+APPROVAL_ACTIONS: list[dict[str, Any]]
+RUN_IDEMPOTENCY: dict[tuple[str, str], str]
+# task_id -> that task's events in log order; shares the event dicts with TASK_EVENTS.
+TASK_EVENT_INDEX: dict[str, list[dict[str, Any]]]
+APPROVAL_INDEX: ApprovalIndex
+# In-memory mirror of the audit_counters rows, which commit with the writes they count.
+AUDIT_COUNTERS: AuditCounters
+# Events get a global, strictly increasing seq that continues from the highest persisted
+# value. Allocation and the in-memory appends share one lock so log order == seq order
+# (per task for events staged by _staged_commit(), which are appended after the commit).
+EVENT_SEQ: Iterator[int]
+EVENT_LOG_LOCK = Lock()
+# Events of tasks evicted from memory (lazy hydration) that are still in TASK_EVENTS.
+_EVICTED_EVENTS = 0
+EVENT_BROKER = EventBroker(int(os.getenv("NEWCLAW_STREAM_MAX_WAITERS", "1000")))
+STREAM_EVENT_TYPES = frozenset({"STATUS_CHANGED", "STAGE_CHANGED"})
+STREAM_HEARTBEAT_SECONDS = float(os.getenv("NEWCLAW_STREAM_HEARTBEAT_SECONDS", "15"))
+# SSE streams end after this long; clients reconnect with Last-Event-ID.
+STREAM_MAX_SECONDS = float(os.getenv("NEWCLAW_STREAM_MAX_SECONDS", "600"))
+
+REPORTS_ROOT = Path(os.getenv("NEWCLAW_REPORTS_ROOT", "reports"))
+# Also built by init_runtime(): the storage backend may import boto3, and the render cache
+# scans its directory.
+REPORT_WRITER: ReportWriter
+# Rendered reports keyed by template type + canonical input hash; 0 disables the cache.
+RENDER_CACHE: RenderCache
+NOTE_LINE_PATTERN = re.compile(r"[^\r\n]+")
 MAX_RETRY = 1
 
-TEMPLATE_REQUIRED_FIELDS: dict[str, tuple[str, ...]] = {
-    "meeting_summary": ("meeting_title", "meeting_date", "participants", "notes"),
-}
-
-POLICY_BLOCK_PATTERNS: dict[str, tuple[str, ...]] = {
-    "external_send_requested": (
-        "외부 전송",
-        "external send",
-        "메일 발송",
-        "send externally",
-        "http://",
-        "https://",
+# task_id -> (stage, perf_counter at entry) and task_id -> perf_counter at run start. Each
+# entry is only touched under that task's stripe.
+STAGE_STARTED: dict[str, tuple[str, float]] = {}
+RUN_STARTED: dict[str, float] = {}
+
+
+def _task_status_counts() -> list[tuple[tuple[str, ...], float]]:
+    counts = {status.value: 0 for status in TaskStatus}
+    for task in list(TASKS.values()):
+        counts[task["status"]] = counts.get(task["status"], 0) + 1
+    return [((status,), count) for status, count in counts.items()]
+
+
+METRICS.register(
+    GaugeCallback(
+        "newclaw_tasks",
+        "Tasks held in memory by status (all tasks with eager hydration, non-terminal ones with lazy).",
+        _task_status_counts,
+        ("status",),
+    )
+)
+METRICS.register(
+    GaugeCallback(
+        "newclaw_scheduler_queue_depth",
+        "Pipeline runs waiting for a worker.",
+        lambda: [((), SCHEDULER.stats()["queue_depth"])],
+    )
+)
+METRICS.register(
+    GaugeCallback(
+        "newclaw_scheduler_busy_workers",
+        "Pipeline workers currently running a task.",
+        lambda: [((), SCHEDULER.stats()["busy_workers"])],
+    )
+)
+METRICS.register(
+    GaugeCallback(
+        "newclaw_report_writes_pending",
+        "Report writes queued or running on the report I/O pool.",
+        lambda: [((), REPORT_WRITER.stats()["pending"])],
     )
-}
+)
+METRICS.register(
+    GaugeCallback(
+        "newclaw_event_stream_waiters",
+        "Long-poll and SSE clients waiting for task events.",
+        lambda: [((), EVENT_BROKER.stats()["waiters"])],
+    )
+)
+
+# Blocked patterns and template required fields; edits to the file are picked up within
+# NEWCLAW_POLICY_RELOAD_SECONDS (negative disables the check) without a restart.
+POLICY_RULES_PATH = os.getenv("NEWCLAW_POLICY_RULES_PATH", str(DEFAULT_POLICY_RULES_PATH))
+POLICY_STORE = PolicyStore(POLICY_RULES_PATH, float(os.getenv("NEWCLAW_POLICY_RELOAD_SECONDS", "2")))
+
+_RUNTIME_NAMES = frozenset(
+    {
+        "STATE_STORE",
+        "TASKS",
+        "TASK_EVENTS",
+        "APPROVAL_QUEUE",
+        "APPROVAL_ACTIONS",
+        "RUN_IDEMPOTENCY",
+        "TASK_EVENT_INDEX",
+        "APPROVAL_INDEX",
+        "AUDIT_COUNTERS",
+        "EVENT_SEQ",
+        "REPORT_WRITER",
+        "RENDER_CACHE",
+    }
+)
+_RUNTIME_LOCK = Lock()
+_RUNTIME_READY = False
+
+
+def init_runtime() -> None:
+    # Opens the store and loads state once per process: at lifespan startup, or on the
+    # first request when the app is driven without lifespan (e.g. TestClient outside `with`).
+    global STATE_STORE, TASKS, TASK_EVENTS, APPROVAL_QUEUE, APPROVAL_ACTIONS, RUN_IDEMPOTENCY
+    global TASK_EVENT_INDEX, APPROVAL_INDEX, AUDIT_COUNTERS, EVENT_SEQ, REPORT_WRITER, RENDER_CACHE, _RUNTIME_READY
+    if _RUNTIME_READY:
+        return
+    with _RUNTIME_LOCK:
+        if _RUNTIME_READY:
+            return
+        store = InstrumentedStateStore(create_state_store(), STORE_SECONDS)
+        tasks, events, approvals, actions, idempotency = (
+            store.load_active_state() if LAZY_HYDRATION else store.load_state()
+        )
+        STATE_STORE = store
+        TASKS, TASK_EVENTS, APPROVAL_QUEUE, APPROVAL_ACTIONS = tasks, events, approvals, actions
+        RUN_IDEMPOTENCY = idempotency
+        TASK_EVENT_INDEX = _build_event_index(events)
+        APPROVAL_INDEX = ApprovalIndex(approvals.values())
+        AUDIT_COUNTERS = AuditCounters(store.load_audit_counters())
+        EVENT_SEQ = itertools.count(store.max_event_seq() + 1)
+        REPORT_WRITER = ReportWriter(
+            create_report_storage(REPORTS_ROOT),
+            workers=int(os.getenv("NEWCLAW_REPORT_IO_WORKERS", "2")),
+            max_pending=int(os.getenv("NEWCLAW_REPORT_IO_MAX_PENDING", "64")),
+        )
+        # One directory per renderer version, so startup never adopts renders from another one.
+        RENDER_CACHE = RenderCache(
+            REPORTS_ROOT / "_cache" / RENDERER_VERSION, int(os.getenv("NEWCLAW_RENDER_CACHE_ENTRIES", "1024"))
+        )
+        _RUNTIME_READY = True
+
+
+def __getattr__(name: str) -> Any:
+    # `from app.main import TASKS` and friends build the runtime on first access.
+    if name in _RUNTIME_NAMES:
+        init_runtime()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _now_iso() -> str:
@@ -83,6 +296,38 @@ def _error(status_code: int, code: str, message: str) -> None:
     )
 
 
+# Set while this thread runs a _staged_commit() block.
+_STAGED = local()
+
+
+@contextmanager
+def _staged_commit() -> Iterator[None]:
+    # Runs the block's store writes as one transaction and holds back their in-memory side
+    # (task table, event log and indexes, counters, stream wake-ups) until it commits. If the
+    # commit fails, memory is left as it was. Callers stage changes to existing task and
+    # approval dicts on copies and register the copy-back with _after_commit() first.
+    _STAGED.effects = []
+    try:
+        with STATE_STORE.transaction():
+            yield
+        effects = _STAGED.effects
+    finally:
+        _STAGED.effects = None
+    for effect in effects:
+        effect()
+
+
+def _staging() -> bool:
+    return getattr(_STAGED, "effects", None) is not None
+
+
+def _after_commit(effect: Callable[[], Any]) -> None:
+    if _staging():
+        _STAGED.effects.append(effect)
+    else:
+        effect()
+
+
 def _log_event(task_id: str, event_type: str, **kwargs: Any) -> None:
     event = {
         "event_id": f"evt_{uuid4().hex[:12]}",
@@ -91,16 +336,140 @@ def _log_event(task_id: str, event_type: str, **kwargs: Any) -> None:
         "created_at": _now_iso(),
         **kwargs,
     }
+    staged = _staging()
+    with EVENT_LOG_LOCK:
+        event["seq"] = next(EVENT_SEQ)
+        if not staged:
+            _index_event(event)
+    with STATE_STORE.transaction():
+        STATE_STORE.save_event(event)
+        STATE_STORE.add_audit_counters(event_deltas(event_type))
+    if staged:
+        _after_commit(partial(_adopt_event, event))
+    else:
+        _publish_event(event)
+
+
+def _index_event(event: dict[str, Any]) -> None:
+    # Caller holds EVENT_LOG_LOCK.
     TASK_EVENTS.append(event)
-    STATE_STORE.save_event(event)
+    TASK_EVENT_INDEX.setdefault(event["task_id"], []).append(event)
+
+
+def _adopt_event(event: dict[str, Any]) -> None:
+    with EVENT_LOG_LOCK:
+        _index_event(event)
+    _publish_event(event)
+
+
+def _publish_event(event: dict[str, Any]) -> None:
+    AUDIT_COUNTERS.apply(event_deltas(event["event_type"]))
+    EVENT_BROKER.publish(event["task_id"])
+
+
+def _get_task(task_id: str) -> dict[str, Any] | None:
+    task = TASKS.get(task_id)
+    if task is None and LAZY_HYDRATION:
+        # Only terminal tasks live outside memory in lazy mode, and those never change again.
+        task = STATE_STORE.get_task(task_id)
+    return task
+
+
+def _get_approval(queue_id: str) -> dict[str, Any] | None:
+    item = APPROVAL_QUEUE.get(queue_id)
+    if item is None and LAZY_HYDRATION:
+        item = STATE_STORE.get_approval(queue_id)
+    return item
+
+
+def _task_events(task_id: str, after_seq: int = 0, limit: int | None = None) -> list[dict[str, Any]]:
+    if LAZY_HYDRATION and task_id not in TASKS:
+        return STATE_STORE.load_task_events(task_id, after_seq=after_seq, limit=limit)
+    events = TASK_EVENT_INDEX.get(task_id, [])
+    start = bisect_right(events, after_seq, key=lambda event: event["seq"])
+    return events[start:] if limit is None else events[start : start + limit]
+
+
+def _stream_events(task_id: str, after_seq: int) -> list[dict[str, Any]]:
+    return [event for event in _task_events(task_id, after_seq=after_seq) if event["event_type"] in STREAM_EVENT_TYPES]
+
+
+def _filter_stream_events(events: list[dict[str, Any]], after_seq: int) -> list[dict[str, Any]]:
+    start = bisect_right(events, after_seq, key=lambda event: event["seq"])
+    return [event for event in events[start:] if event["event_type"] in STREAM_EVENT_TYPES]
+
+
+def _task_finished(task_id: str) -> bool:
+    # Judged from the log rather than task["status"]: the status flips before its
+    # STATUS_CHANGED event is appended, and streams must not close in between.
+    for event in reversed(_task_events(task_id)):
+        if event["event_type"] == "STATUS_CHANGED":
+            return event["to_status"] == TaskStatus.DONE.value
+    return False
+
+
+def _stream_snapshot(task_id: str, after_seq: int) -> tuple[bool, list[dict[str, Any]]]:
+    return _task_finished(task_id), _stream_events(task_id, after_seq)
+
+
+async def _wait_stream_events(task_id: str, after_seq: int, timeout: float) -> list[dict[str, Any]]:
+    # The first look may read the store (lazy hydration), so it runs off the event loop.
+    finished, items = await run_in_threadpool(_stream_snapshot, task_id, after_seq)
+    # Finished tasks never emit again; answer right away instead of holding the request.
+    if finished or items:
+        return items
+    # Wait on the task's own event list, so a task evicted from memory while we wait (lazy
+    # hydration) does not turn the broker's fetch into a store read on the event loop.
+    events = TASK_EVENT_INDEX.get(task_id)
+    if events is None:
+        return await run_in_threadpool(_stream_events, task_id, after_seq)
+    return await EVENT_BROKER.wait_for(task_id, lambda: _filter_stream_events(events, after_seq), timeout)
+
+
+def _has_idempotency(task_id: str, idem_key: str) -> bool:
+    if (task_id, idem_key) in RUN_IDEMPOTENCY:
+        return True
+    return LAZY_HYDRATION and STATE_STORE.get_idempotency(task_id, idem_key) is not None
+
+
+def _evict_task(task_id: str) -> None:
+    # Lazy hydration: a DONE task never changes again, so once its last event is logged it
+    # is dropped from memory and served by the store like the history loaded at startup.
+    # Call at the end of the operation that finished it, after its last _log_event().
+    global _EVICTED_EVENTS
+    if not LAZY_HYDRATION:
+        return
+    TASKS.pop(task_id, None)
+    for key in [key for key in RUN_IDEMPOTENCY if key[0] == task_id]:
+        del RUN_IDEMPOTENCY[key]
+    with EVENT_LOG_LOCK:
+        _EVICTED_EVENTS += len(TASK_EVENT_INDEX.pop(task_id, ()))
+        # Compact the shared log once evicted events make up half of it.
+        if _EVICTED_EVENTS * 2 > len(TASK_EVENTS):
+            TASK_EVENTS[:] = [event for event in TASK_EVENTS if event["task_id"] in TASK_EVENT_INDEX]
+            _EVICTED_EVENTS = 0
+
+
+def _evict_approval(queue_id: str) -> None:
+    APPROVAL_QUEUE.pop(queue_id, None)
+    APPROVAL_INDEX.remove(queue_id)
 
 
 def _persist_task(task: dict[str, Any]) -> None:
     STATE_STORE.save_task(task)
 
 
-def _persist_approval(approval: dict[str, Any]) -> None:
-    STATE_STORE.save_approval(approval)
+def _persist_approval(approval: dict[str, Any], previous_status: str | None) -> None:
+    deltas = approval_deltas(previous_status, approval["status"])
+    with STATE_STORE.transaction():
+        STATE_STORE.save_approval(approval)
+        STATE_STORE.add_audit_counters(deltas)
+    if LAZY_HYDRATION and approval["status"] != ApprovalStatus.PENDING.value:
+        # Resolved approvals are served by the store in lazy mode.
+        _after_commit(partial(_evict_approval, approval["queue_id"]))
+    else:
+        _after_commit(partial(APPROVAL_INDEX.update, approval))
+    _after_commit(partial(AUDIT_COUNTERS.apply, deltas))
 
 
 def _persist_approval_action(action: dict[str, Any]) -> None:
@@ -147,6 +516,7 @@ def _set_status(
 ) -> None:
     from_status = task["status"]
     task["status"] = to_status.value
+    _after_commit(partial(_observe_transition, task["task_id"], to_status))
     task["updated_at"] = _now_iso()
     if reason_code is not None:
         task["approval_reason"] = reason_code
@@ -169,7 +539,29 @@ def _set_status(
     )
 
 
+def _close_stage(task_id: str, now: float) -> None:
+    started = STAGE_STARTED.pop(task_id, None)
+    if started is not None:
+        STAGE_SECONDS.observe(now - started[1], started[0])
+
+
+def _observe_transition(task_id: str, to_status: TaskStatus) -> None:
+    now = time.perf_counter()
+    if to_status == TaskStatus.RUNNING:
+        RUN_STARTED.setdefault(task_id, now)
+        return
+    # Any status change out of RUNNING ends the current stage.
+    _close_stage(task_id, now)
+    if to_status in (TaskStatus.DONE, TaskStatus.NEEDS_HUMAN_APPROVAL):
+        started = RUN_STARTED.pop(task_id, None)
+        if started is not None:
+            RUN_SECONDS.observe(now - started, to_status.value)
+
+
 def _set_stage(task: dict[str, Any], stage: str) -> None:
+    now = time.perf_counter()
+    _close_stage(task["task_id"], now)
+    STAGE_STARTED[task["task_id"]] = (stage, now)
     task["current_stage"] = stage
     task["updated_at"] = _now_iso()
     _persist_task(task)
@@ -177,34 +569,36 @@ def _set_stage(task: dict[str, Any], stage: str) -> None:
 
 
 def _validate_task_input(template_type: str, payload: dict[str, Any]) -> None:
-    if template_type not in TEMPLATE_REQUIRED_FIELDS:
+    required = POLICY_STORE.current().template_required_fields.get(template_type)
+    if required is None:
         _error(400, "INVALID_REQUEST", f"unsupported template_type: {template_type}")
-    required = TEMPLATE_REQUIRED_FIELDS[template_type]
     missing = [field for field in required if field not in payload or payload[field] in (None, "")]
     if missing:
         _error(400, "INVALID_REQUEST", f"missing required input fields: {', '.join(missing)}")
 
 
-def _detect_policy_block(task_input: dict[str, Any], approved_reasons: set[str]) -> str | None:
-    joined = " ".join(str(value) for value in task_input.values()).lower()
-    for reason_code, patterns in POLICY_BLOCK_PATTERNS.items():
-        if reason_code in approved_reasons:
+def _extract_points(notes: str, limit: int = 5) -> list[str]:
+    # Walks the notes line by line and stops after `limit` non-blank lines, so a
+    # multi-megabyte transcript is never copied, split or stripped as a whole.
+    points: list[str] = []
+    if limit <= 0:
+        return points
+    for match in NOTE_LINE_PATTERN.finditer(notes):
+        line = match.group()
+        if not line.strip():
             continue
-        if any(pattern.lower() in joined for pattern in patterns):
-            return reason_code
-    return None
+        points.append(line.strip("-* \t"))
+        if len(points) >= limit:
+            break
+    return points
 
 
-def _extract_points(notes: str, limit: int = 5) -> list[str]:
-    raw_lines = notes.replace("\r", "\n").split("\n")
-    lines = [line.strip("-* \t") for line in raw_lines if line.strip()]
-    if not lines and notes.strip():
-        return [notes.strip()]
-    return lines[:limit]
+# Part of every render cache key and of the cache directory. Bump it whenever the report
+# output of _render_meeting_summary (or _extract_points) changes.
+RENDERER_VERSION = "v1"
 
 
-def _render_meeting_summary(task: dict[str, Any]) -> str:
-    payload = task["input"]
+def _render_meeting_summary(payload: dict[str, Any]) -> str:
     points = _extract_points(str(payload["notes"]))
     if not points:
         raise ValueError("notes must include at least one meaningful line")
@@ -259,22 +653,15 @@ def _create_approval_item(task: dict[str, Any], reason_code: str) -> str:
         "expires_at": None,
         "resolved_at": None,
     }
-    _persist_approval(APPROVAL_QUEUE[queue_id])
+    _persist_approval(APPROVAL_QUEUE[queue_id], None)
     _log_event(task["task_id"], "APPROVAL_REQUESTED", queue_id=queue_id, reason_code=reason_code)
     return queue_id
 
 
-def _write_report(task_id: str, report_text: str) -> str:
-    target = REPORTS_ROOT / task_id
-    target.mkdir(parents=True, exist_ok=True)
-    report_path = target / "report.md"
-    report_path.write_text(report_text, encoding="utf-8")
-    return str(report_path)
-
-
 def _execute_once(task_id: str) -> bool:
-    # Returns True when execution completed (DONE). False when it moved to approval.
-    with STORE_LOCK:
+    # Returns True when execution finished or the report write was handed off (DONE follows
+    # from _finish_report). False when it moved to approval.
+    with TASK_LOCKS.hold(task_id):
         task = TASKS.get(task_id)
         if not task:
             return True
@@ -282,13 +669,14 @@ def _execute_once(task_id: str) -> bool:
             return True
         _set_stage(task, "planner")
 
-    with STORE_LOCK:
+    with TASK_LOCKS.hold(task_id):
         task = TASKS[task_id]
         _set_stage(task, "executor")
         approved_reasons = set(task.get("approved_reasons", []))
-        reason_code = _detect_policy_block(task["input"], approved_reasons)
+        policy = POLICY_STORE.current()
+        reason_code = policy.matcher.detect(task["input"], approved_reasons)
         if reason_code:
-            _log_event(task["task_id"], "BLOCKED_POLICY", reason_code=reason_code)
+            _log_event(task["task_id"], "BLOCKED_POLICY", reason_code=reason_code, policy_version=policy.version)
             queue_id = _create_approval_item(task, reason_code)
             _set_status(
                 task,
@@ -299,76 +687,169 @@ def _execute_once(task_id: str) -> bool:
             )
             return False
 
-    with STORE_LOCK:
+    with TASK_LOCKS.hold(task_id):
         task = TASKS[task_id]
         template_type = task["template_type"]
-        if template_type != "meeting_summary":
-            raise ValueError(f"unsupported template_type at runtime: {template_type}")
-        report_text = _render_meeting_summary(task)
+        task_input = task["input"]
+    # Inputs are never modified after creation, so hashing and rendering (both linear in
+    # the notes size) run without holding the task's stripe.
+    if template_type != "meeting_summary":
+        raise ValueError(f"unsupported template_type at runtime: {template_type}")
+    cache_key = render_cache_key(template_type, task_input, RENDERER_VERSION)
+    report_text, cached_path = RENDER_CACHE.get_or_render(cache_key, lambda: _render_meeting_summary(task_input))
+    # The write runs on the report I/O pool; the reviewer/reporter stages follow from its
+    # completion callback, so this pipeline worker is free as soon as the write is queued.
+    # When the pool is NEWCLAW_REPORT_IO_MAX_PENDING writes behind, submit() waits here.
+    REPORT_WRITER.submit(
+        task_id,
+        report_text,
+        cached_path,
+        lambda report_path, error: _finish_report(task_id, report_text, report_path, error),
+        context=PROFILER.handoff(task_id) if PROFILER is not None else nullcontext,
+    )
+    return True
 
-    report_path = _write_report(task_id, report_text)
 
-    with STORE_LOCK:
-        task = TASKS[task_id]
-        _set_stage(task, "reviewer")
-        if "# 회의 결과 요약" not in report_text:
-            raise ValueError("review failed: report header missing")
-
-        _set_stage(task, "reporter")
-        task["result"] = {"report_path": report_path}
-        task["completed_at"] = _now_iso()
-        _set_status(task, TaskStatus.DONE, next_action="none")
-    return True
+def _finish_report(task_id: str, report_text: str, report_path: str | None, error: BaseException | None) -> None:
+    try:
+        if error is not None:
+            raise error
+        with TASK_LOCKS.hold(task_id):
+            task = TASKS[task_id]
+            _set_stage(task, "reviewer")
+            if "# 회의 결과 요약" not in report_text:
+                raise ValueError("review failed: report header missing")
+
+            _set_stage(task, "reporter")
+            task["result"] = {"report_path": report_path}
+            task["completed_at"] = _now_iso()
+            _set_status(task, TaskStatus.DONE, next_action="none")
+            _evict_task(task_id)
+    except Exception as exc:
+        if _handle_failure(task_id, exc):
+            _requeue_pipeline(task_id)
+
+
+def _requeue_pipeline(task_id: str, attempt: int = 0) -> None:
+    # Hands a retry back to the scheduler instead of running it on the calling report-io
+    # thread. The task is already back in RUNNING; if the backlog is full as well, try
+    # again after an exponential backoff.
+    if SCHEDULER.reserve(1):
+        SCHEDULER.submit_reserved(_run_pipeline, [(task_id,)])
+        return
+    delay = min(REQUEUE_BACKOFF_SECONDS * 2**attempt, REQUEUE_BACKOFF_MAX_SECONDS)
+    timer = Timer(delay, _requeue_pipeline, (task_id, attempt + 1))
+    timer.daemon = True
+    timer.start()
+
+
+def _handle_failure(task_id: str, exc: Exception) -> bool:
+    # Returns True when the task was moved back to RUNNING for another attempt.
+    with TASK_LOCKS.hold(task_id):
+        task = TASKS.get(task_id)
+        if not task:
+            return False
+        retry_count = int(task.get("retry_count", 0))
+        if retry_count < MAX_RETRY:
+            task["retry_count"] = retry_count + 1
+            _set_status(
+                task,
+                TaskStatus.FAILED_RETRYABLE,
+                last_error=str(exc),
+                next_action="retrying",
+            )
+            _log_event(task_id, "RETRY_STARTED", retry_count=task["retry_count"])
+            _set_status(task, TaskStatus.RUNNING, next_action="wait_for_completion")
+            return True
+
+        queue_id = _create_approval_item(task, "retry_exhausted")
+        _set_status(
+            task,
+            TaskStatus.NEEDS_HUMAN_APPROVAL,
+            reason_code="retry_exhausted",
+            last_error=str(exc),
+            next_action="approve_or_reject",
+            approval_queue_id=queue_id,
+        )
+        return False
 
 
 def _run_pipeline(task_id: str) -> None:
+    if PROFILER is not None:
+        with PROFILER.pipeline(task_id):
+            _run_attempts(task_id)
+        return
+    _run_attempts(task_id)
+
+
+def _run_attempts(task_id: str) -> None:
     while True:
         try:
-            completed = _execute_once(task_id)
-            if completed:
-                return
+            _execute_once(task_id)
             return
         except Exception as exc:
-            with STORE_LOCK:
-                task = TASKS.get(task_id)
-                if not task:
-                    return
-                retry_count = int(task.get("retry_count", 0))
-                if retry_count < MAX_RETRY:
-                    task["retry_count"] = retry_count + 1
-                    _set_status(
-                        task,
-                        TaskStatus.FAILED_RETRYABLE,
-                        last_error=str(exc),
-                        next_action="retrying",
-                    )
-                    _log_event(task_id, "RETRY_STARTED", retry_count=task["retry_count"])
-                    _set_status(task, TaskStatus.RUNNING, next_action="wait_for_completion")
-                    continue
-
-                queue_id = _create_approval_item(task, "retry_exhausted")
-                _set_status(
-                    task,
-                    TaskStatus.NEEDS_HUMAN_APPROVAL,
-                    reason_code="retry_exhausted",
-                    last_error=str(exc),
-                    next_action="approve_or_reject",
-                    approval_queue_id=queue_id,
-                )
+            if not _handle_failure(task_id, exc):
                 return
 
 
 def _start_pipeline(task_id: str) -> None:
-    worker = Thread(target=_run_pipeline, args=(task_id,), daemon=True)
-    worker.start()
+    # Called while holding the task's stripe and before the transition to RUNNING, so a
+    # full queue leaves the task untouched. The worker blocks on the stripe until the
+    # caller has committed the transition.
+    if PROFILER is not None:
+        # Before submit: the worker looks the task up as soon as it picks the job.
+        PROFILER.follow(task_id)
+    try:
+        SCHEDULER.submit(_run_pipeline, task_id)
+    except SchedulerSaturated:
+        if PROFILER is not None:
+            PROFILER.unfollow(task_id)
+        _error(503, "SCHEDULER_SATURATED", "pipeline queue is full, retry later")
+
+
+def _insert_task(task_id: str, req: CreateTaskRequest, actor: ActorContext, role: str) -> dict[str, Any]:
+    # Caller holds the task's stripe and has validated the request.
+    now = _now_iso()
+    task = {
+        "task_id": task_id,
+        "title": req.title,
+        "template_type": req.template_type,
+        "input": req.input,
+        "requested_by": req.requested_by,
+        "status": TaskStatus.READY.value,
+        "current_stage": None,
+        "next_action": "run_task",
+        "retry_count": 0,
+        "approved_reasons": [],
+        "approval_queue_id": None,
+        "approval_reason": None,
+        "last_error": None,
+        "result": None,
+        "created_at": now,
+        "updated_at": now,
+        "started_at": None,
+        "completed_at": None,
+        "final_reason": None,
+    }
+    _persist_task(task)
+    _after_commit(partial(TASKS.__setitem__, task_id, task))
+    _log_event(task_id, "TASK_CREATED", actor_id=actor.actor_id, actor_role=role, requested_by=req.requested_by)
+    return task
+
+
+def _begin_run(task: dict[str, Any], actor: ActorContext, role: str) -> None:
+    # Caller holds the task's stripe and has already handed the task to the scheduler.
+    task["started_at"] = _now_iso()
+    _set_status(task, TaskStatus.RUNNING, next_action="wait_for_completion")
+    _log_event(task["task_id"], "RUN_REQUESTED", actor_id=actor.actor_id, actor_role=role)
 
 
-@APP.get("/health")
+@ROUTER.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
-@APP.post("/api/v1/task/create", status_code=201)
+@ROUTER.post("/api/v1/task/create", status_code=201)
 def create_task(
     req: CreateTaskRequest,
     actor: ActorContext = Depends(actor_context_dependency),
@@ -379,43 +860,77 @@ def create_task(
 
     _validate_task_input(req.template_type, req.input)
     task_id = f"task_{uuid4()}"
-    now = _now_iso()
 
-    with STORE_LOCK:
-        TASKS[task_id] = {
-            "task_id": task_id,
-            "title": req.title,
-            "template_type": req.template_type,
-            "input": req.input,
-            "requested_by": req.requested_by,
-            "status": TaskStatus.READY.value,
-            "current_stage": None,
-            "next_action": "run_task",
-            "retry_count": 0,
-            "approved_reasons": [],
-            "approval_queue_id": None,
-            "approval_reason": None,
-            "last_error": None,
-            "result": None,
-            "created_at": now,
-            "updated_at": now,
-            "started_at": None,
-            "completed_at": None,
-            "final_reason": None,
-        }
-        _persist_task(TASKS[task_id])
-        _log_event(task_id, "TASK_CREATED", actor_id=actor.actor_id, actor_role=role, requested_by=req.requested_by)
+    with TASK_LOCKS.hold(task_id):
+        task = _insert_task(task_id, req, actor, role)
 
-    return {"task_id": task_id, "status": TaskStatus.READY.value, "created_at": now}
+    return {"task_id": task_id, "status": TaskStatus.READY.value, "created_at": task["created_at"]}
 
 
-@APP.post("/api/v1/task/run", status_code=202)
+def _batch_item_error(index: int, exc: HTTPException) -> dict[str, Any]:
+    return {"index": index, "ok": False, "error": {key: exc.detail["error"][key] for key in ("code", "message")}}
+
+
+@ROUTER.post("/api/v1/task/create/batch")
+def create_tasks_batch(
+    req: BatchCreateTaskRequest,
+    actor: ActorContext = Depends(actor_context_dependency),
+) -> dict[str, Any]:
+    role = _authorize(actor.actor_role, {"requester", "admin"}, "create_task")
+    results: list[dict[str, Any]] = []
+    accepted: list[tuple[int, str, CreateTaskRequest]] = []
+    for index, item in enumerate(req.items):
+        try:
+            if role == "requester" and actor.actor_id != item.requested_by:
+                _error(403, "FORBIDDEN", "requester must match requested_by")
+            _validate_task_input(item.template_type, item.input)
+        except HTTPException as exc:
+            results.append(_batch_item_error(index, exc))
+            continue
+        task_id = f"task_{uuid4()}"
+        accepted.append((index, task_id, item))
+        results.append({"index": index, "ok": True, "task_id": task_id})
+
+    # New ids are invisible to other requests until we return, but pipeline workers
+    # started below must still wait for the stripes until every task is committed.
+    with TASK_LOCKS.hold_many(task_id for _, task_id, _ in accepted):
+        started = SCHEDULER.reserve(len(accepted)) if req.start else 0
+        # Tasks enter TASKS (and their events the log) only once the batch has committed.
+        try:
+            with _staged_commit():
+                for position, (index, task_id, item) in enumerate(accepted):
+                    task = _insert_task(task_id, item, actor, role)
+                    if position < started:
+                        _begin_run(task, actor, role)
+                    elif req.start:
+                        results[index]["start_error"] = {
+                            "code": "SCHEDULER_SATURATED",
+                            "message": "pipeline backlog is full, retry later",
+                        }
+                    results[index]["status"] = task["status"]
+                    results[index]["created_at"] = task["created_at"]
+        except Exception:
+            SCHEDULER.release(started)
+            raise
+        if started:
+            SCHEDULER.submit_reserved(_run_pipeline, [(task_id,) for _, task_id, _ in accepted[:started]])
+
+    return {
+        "requested": len(results),
+        "created": len(accepted),
+        "started": started,
+        "failed": len(results) - len(accepted),
+        "results": results,
+    }
+
+
+@ROUTER.post("/api/v1/task/run", status_code=202)
 def run_task(
     req: RunTaskRequest,
     actor: ActorContext = Depends(actor_context_dependency),
 ) -> dict[str, Any]:
-    with STORE_LOCK:
-        task = TASKS.get(req.task_id)
+    with TASK_LOCKS.hold(req.task_id):
+        task = _get_task(req.task_id)
         if not task:
             _error(404, "TASK_NOT_FOUND", f"task not found: {req.task_id}")
         role = _authorize_task_access(
@@ -427,8 +942,7 @@ def run_task(
         )
 
         if req.idempotency_key:
-            key = (req.task_id, req.idempotency_key)
-            if key in RUN_IDEMPOTENCY:
+            if _has_idempotency(req.task_id, req.idempotency_key):
                 return {
                     "task_id": req.task_id,
                     "status": task["status"],
@@ -438,24 +952,22 @@ def run_task(
         if task["status"] != TaskStatus.READY.value:
             _error(409, "INVALID_TASK_STATE", f"task is not READY: {task['status']}")
 
-        task["started_at"] = _now_iso()
-        _set_status(task, TaskStatus.RUNNING, next_action="wait_for_completion")
+        _start_pipeline(req.task_id)
+        _begin_run(task, actor, role)
         if req.idempotency_key:
             RUN_IDEMPOTENCY[(req.task_id, req.idempotency_key)] = req.task_id
             STATE_STORE.save_idempotency(req.task_id, req.idempotency_key, req.task_id)
-        _log_event(task["task_id"], "RUN_REQUESTED", actor_id=actor.actor_id, actor_role=role)
 
-    _start_pipeline(req.task_id)
     return {"task_id": req.task_id, "status": TaskStatus.RUNNING.value, "started_at": TASKS[req.task_id]["started_at"]}
 
 
-@APP.get("/api/v1/task/status/{task_id}")
+@ROUTER.get("/api/v1/task/status/{task_id}")
 def task_status(
     task_id: str,
     actor: ActorContext = Depends(actor_context_dependency),
 ) -> dict[str, Any]:
-    with STORE_LOCK:
-        task = TASKS.get(task_id)
+    with TASK_LOCKS.hold(task_id):
+        task = _get_task(task_id)
         if not task:
             _error(404, "TASK_NOT_FOUND", f"task not found: {task_id}")
         _authorize_task_access(
@@ -489,13 +1001,42 @@ def task_status(
         return response
 
 
-@APP.get("/api/v1/task/events/{task_id}")
+@ROUTER.get("/api/v1/task/result/{task_id}")
+def task_result(
+    task_id: str,
+    actor: ActorContext = Depends(actor_context_dependency),
+) -> dict[str, Any]:
+    with TASK_LOCKS.hold(task_id):
+        task = _get_task(task_id)
+        if not task:
+            _error(404, "TASK_NOT_FOUND", f"task not found: {task_id}")
+        _authorize_task_access(
+            task,
+            actor.actor_id,
+            actor.actor_role,
+            allowed_roles={"requester", "reviewer", "approver", "admin"},
+            action="task_result",
+        )
+        report_path = (task.get("result") or {}).get("report_path")
+    if not report_path:
+        _error(409, "INVALID_TASK_STATE", f"task has no report: {task['status']}")
+    # Read through the configured storage, so s3:// references resolve like local paths.
+    try:
+        content = REPORT_WRITER.storage.read(report_path)
+    except OSError:
+        _error(404, "REPORT_NOT_FOUND", f"report not found: {report_path}")
+    return {"task_id": task_id, "report_path": report_path, "content": content}
+
+
+@ROUTER.get("/api/v1/task/events/{task_id}")
 def task_events(
     task_id: str,
+    after_seq: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=1000),
     actor: ActorContext = Depends(actor_context_dependency),
 ) -> dict[str, Any]:
-    with STORE_LOCK:
-        task = TASKS.get(task_id)
+    with TASK_LOCKS.hold(task_id):
+        task = _get_task(task_id)
         if not task:
             _error(404, "TASK_NOT_FOUND", f"task not found: {task_id}")
         _authorize_task_access(
@@ -505,27 +1046,184 @@ def task_events(
             allowed_roles={"requester", "reviewer", "approver", "admin"},
             action="task_events",
         )
-        items = [event for event in TASK_EVENTS if event.get("task_id") == task_id]
-        return {"task_id": task_id, "items": items, "count": len(items)}
+        # Fetch one extra row to learn whether another page exists.
+        items = _task_events(task_id, after_seq=after_seq, limit=None if limit is None else limit + 1)
+        has_more = limit is not None and len(items) > limit
+        if has_more:
+            items = items[:limit]
+        next_after_seq = items[-1]["seq"] if items else after_seq
+        return {
+            "task_id": task_id,
+            "items": items,
+            "count": len(items),
+            "next_after_seq": next_after_seq,
+            "has_more": has_more,
+        }
+
+
+def _authorize_task_stream(task_id: str, actor: ActorContext, action: str) -> None:
+    with TASK_LOCKS.hold(task_id):
+        task = _get_task(task_id)
+        if not task:
+            _error(404, "TASK_NOT_FOUND", f"task not found: {task_id}")
+        _authorize_task_access(
+            task,
+            actor.actor_id,
+            actor.actor_role,
+            allowed_roles={"requester", "reviewer", "approver", "admin"},
+            action=action,
+        )
+
+
+# Both event endpoints are async: waiting clients park on the event loop instead of
+# holding threadpool threads that the sync endpoints need.
+@ROUTER.get("/api/v1/task/events/{task_id}/poll")
+async def poll_task_events(
+    task_id: str,
+    after_seq: int = Query(default=0, ge=0),
+    timeout: float = Query(default=25.0, ge=0, le=60),
+    actor: ActorContext = Depends(actor_context_dependency),
+) -> dict[str, Any]:
+    await run_in_threadpool(_authorize_task_stream, task_id, actor, "task_events_poll")
+    # The wait happens outside the task lock so the pipeline can keep making progress.
+    try:
+        items = await _wait_stream_events(task_id, after_seq, timeout)
+    except StreamCapacityExceeded:
+        _error(503, "STREAM_CAPACITY_EXCEEDED", "too many clients are waiting for events, retry later")
+    task = await run_in_threadpool(_get_task, task_id)
+    return {
+        "task_id": task_id,
+        "status": task["status"],
+        "current_stage": task["current_stage"],
+        "items": items,
+        "count": len(items),
+        "next_after_seq": items[-1]["seq"] if items else after_seq,
+    }
+
+
+@ROUTER.get("/api/v1/task/events/{task_id}/stream")
+async def stream_task_events(
+    task_id: str,
+    after_seq: int = Query(default=0, ge=0),
+    last_event_id: str | None = Header(default=None),
+    actor: ActorContext = Depends(actor_context_dependency),
+) -> StreamingResponse:
+    await run_in_threadpool(_authorize_task_stream, task_id, actor, "task_events_stream")
+    if EVENT_BROKER.at_capacity():
+        _error(503, "STREAM_CAPACITY_EXCEEDED", "too many clients are waiting for events, retry later")
+    cursor = int(last_event_id) if last_event_id and last_event_id.isdigit() else after_seq
+
+    async def _sse() -> AsyncIterator[str]:
+        nonlocal cursor
+        deadline = time.monotonic() + STREAM_MAX_SECONDS
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                items = await _wait_stream_events(task_id, cursor, min(STREAM_HEARTBEAT_SECONDS, max(remaining, 0.0)))
+            except StreamCapacityExceeded:
+                # Filled up after the check above; ask the client to come back later.
+                yield f"retry: {int(STREAM_HEARTBEAT_SECONDS * 1000)}\n\n"
+                return
+            for event in items:
+                cursor = event["seq"]
+                data = json.dumps(event, ensure_ascii=False)
+                yield f"id: {cursor}\nevent: {event['event_type']}\ndata: {data}\n\n"
+            if not items:
+                yield ": keepalive\n\n"
+            finished, pending = await run_in_threadpool(_stream_snapshot, task_id, cursor)
+            if (finished and not pending) or time.monotonic() >= deadline:
+                return
+
+    return StreamingResponse(
+        _sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _encode_approval_cursor(key: PageKey) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode("utf-8")).decode("ascii")
 
 
-@APP.get("/api/v1/approvals")
+def _decode_approval_cursor(cursor: str) -> PageKey:
+    try:
+        updated_at, queue_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, TypeError):
+        _error(400, "INVALID_REQUEST", "invalid approvals cursor")
+    return str(updated_at), str(queue_id)
+
+
+@ROUTER.get("/api/v1/approvals")
 def list_approvals(
     status: str | None = Query(default=None),
     approver_group: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    cursor: str | None = Query(default=None),
     actor: ActorContext = Depends(actor_context_dependency),
 ) -> dict[str, Any]:
     _authorize(actor.actor_role, {"approver", "admin"}, "list_approvals")
-    with STORE_LOCK:
-        items = list(APPROVAL_QUEUE.values())
-        if status:
-            items = [item for item in items if item["status"] == status]
-        if approver_group:
-            items = [item for item in items if item["approver_group"] == approver_group]
-        return {"items": items, "count": len(items)}
-
-
-@APP.post("/api/v1/approvals/{queue_id}/approve")
+    after = _decode_approval_cursor(cursor) if cursor else None
+    # Fetch one extra item to learn whether another page exists.
+    fetch = None if limit is None else limit + 1
+    if LAZY_HYDRATION and status != ApprovalStatus.PENDING.value:
+        # Resolved approvals are not hydrated; the store is authoritative for them.
+        items = STATE_STORE.list_approvals(status, approver_group, after=after, limit=fetch)
+    else:
+        queue_ids = APPROVAL_INDEX.page(status or None, approver_group or None, after=after, limit=fetch)
+        items = [APPROVAL_QUEUE[queue_id] for queue_id in queue_ids]
+    next_cursor = None
+    if limit is not None and len(items) > limit:
+        items = items[:limit]
+        next_cursor = _encode_approval_cursor(approval_page_key(items[-1]))
+    return {"items": items, "count": len(items), "next_cursor": next_cursor}
+
+
+def _record_approval_action(queue_item: dict[str, Any], action_name: str, acted_by: str, comment: str | None) -> None:
+    action = {
+        "action_id": f"aa_{uuid4().hex}",
+        "queue_id": queue_item["queue_id"],
+        "task_id": queue_item["task_id"],
+        "action": action_name,
+        "acted_by": acted_by,
+        "comment": comment,
+        "created_at": _now_iso(),
+    }
+    _persist_approval_action(action)
+    # Every action resolves its approval, so lazy mode keeps them in the store only.
+    if not LAZY_HYDRATION:
+        _after_commit(partial(APPROVAL_ACTIONS.append, action))
+
+
+def _apply_approval(queue_item: dict[str, Any], task: dict[str, Any], actor: ActorContext, role: str, comment: str | None) -> None:
+    # Caller holds the task's stripe, has checked the item is PENDING and has already
+    # handed the task to the scheduler (or reserved a backlog slot for it).
+    queue_item["status"] = ApprovalStatus.APPROVED.value
+    queue_item["resolved_at"] = _now_iso()
+    _persist_approval(queue_item, ApprovalStatus.PENDING.value)
+    _record_approval_action(queue_item, "APPROVE", actor.actor_id, comment)
+
+    approved_reasons = set(task.get("approved_reasons", []))
+    approved_reasons.add(queue_item["reason_code"])
+    task["approved_reasons"] = sorted(approved_reasons)
+    _set_status(task, TaskStatus.RUNNING, next_action="wait_for_completion")
+    _log_event(task["task_id"], "HUMAN_APPROVED", queue_id=queue_item["queue_id"], acted_by=actor.actor_id, actor_role=role)
+
+
+def _apply_rejection(queue_item: dict[str, Any], task: dict[str, Any], actor: ActorContext, role: str, comment: str | None) -> None:
+    # Caller holds the task's stripe and has checked the item is PENDING.
+    queue_item["status"] = ApprovalStatus.REJECTED.value
+    queue_item["resolved_at"] = _now_iso()
+    _persist_approval(queue_item, ApprovalStatus.PENDING.value)
+    _record_approval_action(queue_item, "REJECT", actor.actor_id, comment)
+
+    # Set completion timestamp before status persistence so DB state is consistent after restart.
+    task["completed_at"] = _now_iso()
+    _set_status(task, TaskStatus.DONE, next_action="none", final_reason="rejected_by_human")
+    _log_event(task["task_id"], "HUMAN_REJECTED", queue_id=queue_item["queue_id"], acted_by=actor.actor_id, actor_role=role)
+    _after_commit(partial(_evict_task, task["task_id"]))
+
+
+@ROUTER.post("/api/v1/approvals/{queue_id}/approve")
 def approve_queue_item(
     queue_id: str,
     req: ApprovalDecisionRequest,
@@ -534,44 +1232,24 @@ def approve_queue_item(
     role = _authorize(actor.actor_role, {"approver", "admin"}, "approve_queue_item")
     if req.acted_by != actor.actor_id:
         _error(403, "FORBIDDEN", "acted_by must match authenticated actor")
-    with STORE_LOCK:
-        queue_item = APPROVAL_QUEUE.get(queue_id)
-        if not queue_item:
-            _error(404, "APPROVAL_NOT_FOUND", f"approval queue item not found: {queue_id}")
+    queue_item = _get_approval(queue_id)
+    if not queue_item:
+        _error(404, "APPROVAL_NOT_FOUND", f"approval queue item not found: {queue_id}")
+    # The queue item belongs to exactly one task; its stripe guards the approval state too.
+    with TASK_LOCKS.hold(queue_item["task_id"]):
         if queue_item["status"] != ApprovalStatus.PENDING.value:
             _error(409, "INVALID_APPROVAL_STATE", f"approval item is not PENDING: {queue_item['status']}")
 
-        queue_item["status"] = ApprovalStatus.APPROVED.value
-        queue_item["resolved_at"] = _now_iso()
-        _persist_approval(queue_item)
-
-        action = {
-            "action_id": f"aa_{uuid4().hex}",
-            "queue_id": queue_id,
-            "task_id": queue_item["task_id"],
-            "action": "APPROVE",
-            "acted_by": actor.actor_id,
-            "comment": req.comment,
-            "created_at": _now_iso(),
-        }
-        APPROVAL_ACTIONS.append(action)
-        _persist_approval_action(action)
-
         task = TASKS.get(queue_item["task_id"])
         if not task:
             _error(404, "TASK_NOT_FOUND", f"task not found: {queue_item['task_id']}")
+        _start_pipeline(task["task_id"])
+        _apply_approval(queue_item, task, actor, role, req.comment)
 
-        approved_reasons = set(task.get("approved_reasons", []))
-        approved_reasons.add(queue_item["reason_code"])
-        task["approved_reasons"] = sorted(approved_reasons)
-        _set_status(task, TaskStatus.RUNNING, next_action="wait_for_completion")
-        _log_event(task["task_id"], "HUMAN_APPROVED", queue_id=queue_id, acted_by=actor.actor_id, actor_role=role)
-
-    _start_pipeline(queue_item["task_id"])
     return {"queue_id": queue_id, "status": ApprovalStatus.APPROVED.value, "task_status": TaskStatus.RUNNING.value}
 
 
-@APP.post("/api/v1/approvals/{queue_id}/reject")
+@ROUTER.post("/api/v1/approvals/{queue_id}/reject")
 def reject_queue_item(
     queue_id: str,
     req: ApprovalDecisionRequest,
@@ -580,55 +1258,187 @@ def reject_queue_item(
     role = _authorize(actor.actor_role, {"approver", "admin"}, "reject_queue_item")
     if req.acted_by != actor.actor_id:
         _error(403, "FORBIDDEN", "acted_by must match authenticated actor")
-    with STORE_LOCK:
-        queue_item = APPROVAL_QUEUE.get(queue_id)
-        if not queue_item:
-            _error(404, "APPROVAL_NOT_FOUND", f"approval queue item not found: {queue_id}")
+    queue_item = _get_approval(queue_id)
+    if not queue_item:
+        _error(404, "APPROVAL_NOT_FOUND", f"approval queue item not found: {queue_id}")
+    with TASK_LOCKS.hold(queue_item["task_id"]):
         if queue_item["status"] != ApprovalStatus.PENDING.value:
             _error(409, "INVALID_APPROVAL_STATE", f"approval item is not PENDING: {queue_item['status']}")
 
-        queue_item["status"] = ApprovalStatus.REJECTED.value
-        queue_item["resolved_at"] = _now_iso()
-        _persist_approval(queue_item)
-
-        action = {
-            "action_id": f"aa_{uuid4().hex}",
-            "queue_id": queue_id,
-            "task_id": queue_item["task_id"],
-            "action": "REJECT",
-            "acted_by": actor.actor_id,
-            "comment": req.comment,
-            "created_at": _now_iso(),
-        }
-        APPROVAL_ACTIONS.append(action)
-        _persist_approval_action(action)
-
         task = TASKS.get(queue_item["task_id"])
         if not task:
             _error(404, "TASK_NOT_FOUND", f"task not found: {queue_item['task_id']}")
-        # Set completion timestamp before status persistence so DB state is consistent after restart.
-        task["completed_at"] = _now_iso()
-        _set_status(task, TaskStatus.DONE, next_action="none", final_reason="rejected_by_human")
-        _log_event(task["task_id"], "HUMAN_REJECTED", queue_id=queue_id, acted_by=actor.actor_id, actor_role=role)
+        _apply_rejection(queue_item, task, actor, role, req.comment)
 
     return {"queue_id": queue_id, "status": ApprovalStatus.REJECTED.value, "task_status": TaskStatus.DONE.value}
 
 
-@APP.get("/api/v1/audit/summary")
+def _bulk_item_error(queue_id: str, code: str, message: str) -> dict[str, Any]:
+    return {"queue_id": queue_id, "ok": False, "error": {"code": code, "message": message}}
+
+
+@ROUTER.post("/api/v1/approvals/bulk")
+def bulk_decide_queue_items(
+    req: BulkApprovalDecisionRequest,
+    actor: ActorContext = Depends(actor_context_dependency),
+) -> dict[str, Any]:
+    role = _authorize(actor.actor_role, {"approver", "admin"}, "bulk_decide_queue_items")
+    if req.acted_by != actor.actor_id:
+        _error(403, "FORBIDDEN", "acted_by must match authenticated actor")
+    approve = req.action == "APPROVE"
+    queue_ids = list(dict.fromkeys(req.queue_ids))
+    results: dict[str, dict[str, Any]] = {}
+    found: dict[str, dict[str, Any]] = {}
+    for queue_id in queue_ids:
+        queue_item = _get_approval(queue_id)
+        if queue_item is None:
+            results[queue_id] = _bulk_item_error(queue_id, "APPROVAL_NOT_FOUND", f"approval queue item not found: {queue_id}")
+        else:
+            found[queue_id] = queue_item
+
+    with TASK_LOCKS.hold_many(item["task_id"] for item in found.values()):
+        ready: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        for queue_id, queue_item in found.items():
+            if queue_item["status"] != ApprovalStatus.PENDING.value:
+                results[queue_id] = _bulk_item_error(
+                    queue_id, "INVALID_APPROVAL_STATE", f"approval item is not PENDING: {queue_item['status']}"
+                )
+                continue
+            task = TASKS.get(queue_item["task_id"])
+            if not task:
+                results[queue_id] = _bulk_item_error(queue_id, "TASK_NOT_FOUND", f"task not found: {queue_item['task_id']}")
+                continue
+            ready.append((queue_item, task))
+
+        reserved = 0
+        if approve:
+            # Claim scheduler backlog slots up front; only items beyond the backlog stay PENDING.
+            reserved = SCHEDULER.reserve(len(ready))
+            for queue_item, _ in ready[reserved:]:
+                results[queue_item["queue_id"]] = _bulk_item_error(
+                    queue_item["queue_id"], "SCHEDULER_SATURATED", "pipeline backlog is full, retry later"
+                )
+            ready = ready[:reserved]
+
+        # Decisions are staged on copies: memory changes only once the batch has committed.
+        try:
+            with _staged_commit():
+                for queue_item, task in ready:
+                    staged_item, staged_task = dict(queue_item), dict(task)
+                    _after_commit(partial(queue_item.update, staged_item))
+                    _after_commit(partial(task.update, staged_task))
+                    if approve:
+                        _apply_approval(staged_item, staged_task, actor, role, req.comment)
+                    else:
+                        _apply_rejection(staged_item, staged_task, actor, role, req.comment)
+        except Exception:
+            SCHEDULER.release(reserved)
+            raise
+        for queue_item, task in ready:
+            results[queue_item["queue_id"]] = {
+                "queue_id": queue_item["queue_id"],
+                "ok": True,
+                "status": queue_item["status"],
+                "task_status": task["status"],
+            }
+        if approve:
+            # Workers wait for the stripes, which are released right after this.
+            SCHEDULER.submit_reserved(_run_pipeline, [(task["task_id"],) for _, task in ready])
+
+    items = [results[queue_id] for queue_id in queue_ids]
+    succeeded = sum(1 for item in items if item["ok"])
+    return {
+        "action": req.action,
+        "requested": len(items),
+        "succeeded": succeeded,
+        "failed": len(items) - succeeded,
+        "results": items,
+    }
+
+
+@ROUTER.get("/api/v1/audit/summary")
 def audit_summary(actor: ActorContext = Depends(actor_context_dependency)) -> dict[str, Any]:
     _authorize(actor.actor_role, {"reviewer", "admin"}, "audit_summary")
-    with STORE_LOCK:
-        blocked_policy = sum(1 for event in TASK_EVENTS if event.get("event_type") == "BLOCKED_POLICY")
-        approvals_pending = sum(1 for item in APPROVAL_QUEUE.values() if item.get("status") == ApprovalStatus.PENDING.value)
-        approvals_resolved = sum(
-            1
-            for item in APPROVAL_QUEUE.values()
-            if item.get("status") in {ApprovalStatus.APPROVED.value, ApprovalStatus.REJECTED.value}
-        )
-        return {
-            "total_events": len(TASK_EVENTS),
-            "blocked_policy_events": blocked_policy,
-            "policy_bypass_events": 0,
-            "approvals_pending": approvals_pending,
-            "approvals_resolved": approvals_resolved,
-        }
+    # Served from memory: the totals loaded at startup plus deltas committed since.
+    counters = AUDIT_COUNTERS.snapshot()
+    return {
+        "total_events": counters.get("events", 0),
+        "blocked_policy_events": counters.get("events:BLOCKED_POLICY", 0),
+        "policy_bypass_events": 0,
+        "approvals_pending": counters.get(f"approvals:{ApprovalStatus.PENDING.value}", 0),
+        "approvals_resolved": counters.get(f"approvals:{ApprovalStatus.APPROVED.value}", 0)
+        + counters.get(f"approvals:{ApprovalStatus.REJECTED.value}", 0),
+    }
+
+
+@ROUTER.get("/metrics", response_class=PlainTextResponse)
+def metrics(actor: ActorContext = Depends(actor_context_dependency)) -> PlainTextResponse:
+    _authorize(actor.actor_role, {"admin"}, "metrics")
+    return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@ROUTER.get("/api/v1/ops/profiles")
+def list_profiles(
+    limit: int = Query(default=50, ge=1, le=500),
+    actor: ActorContext = Depends(actor_context_dependency),
+) -> dict[str, Any]:
+    _authorize(actor.actor_role, {"admin"}, "list_profiles")
+    items = PROFILER.artifacts.list(limit) if PROFILER is not None else []
+    return {"enabled": PROFILER is not None, "count": len(items), "items": items}
+
+
+@ROUTER.get("/api/v1/ops/profiles/{profile_id}")
+def download_profile(
+    profile_id: str,
+    actor: ActorContext = Depends(actor_context_dependency),
+) -> FileResponse:
+    _authorize(actor.actor_role, {"admin"}, "download_profile")
+    path = PROFILER.artifacts.path_for(profile_id) if PROFILER is not None else None
+    if path is None:
+        _error(404, "PROFILE_NOT_FOUND", f"profile not found: {profile_id}")
+    return FileResponse(path, media_type="application/octet-stream", filename=path.name)
+
+
+@ROUTER.get("/api/v1/ops/stats")
+def ops_stats(actor: ActorContext = Depends(actor_context_dependency)) -> dict[str, Any]:
+    _authorize(actor.actor_role, {"admin"}, "ops_stats")
+    return {
+        "scheduler": SCHEDULER.stats(),
+        "state_store": STATE_STORE.stats(),
+        "event_stream": EVENT_BROKER.stats(),
+        "audit_counters": AUDIT_COUNTERS.stats(),
+        "policy": POLICY_STORE.stats(),
+        "render_cache": RENDER_CACHE.stats(),
+        "report_storage": REPORT_WRITER.stats(),
+        "auth_token_cache": token_cache_stats(),
+        "profiling": PROFILER.stats() if PROFILER is not None else {"enabled": False},
+    }
+
+
+async def _require_runtime() -> None:
+    # async so the per-request check does not take a threadpool hop; the one-time
+    # init (store open + state load) is blocking, so it runs in the threadpool.
+    if not _RUNTIME_READY:
+        await run_in_threadpool(init_runtime)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    init_runtime()
+    yield
+
+
+def create_app() -> FastAPI:
+    # Cheap to call: the store and in-memory state are process-wide and built by
+    # init_runtime() at startup. `uvicorn --factory app.main:create_app` serves this directly.
+    app = FastAPI(
+        title="Local Work Delegation Orchestrator",
+        version="0.1.0",
+        lifespan=_lifespan,
+        dependencies=[Depends(_require_runtime)],
+    )
+    app.include_router(ROUTER)
+    return app
+
+
+APP = create_app()
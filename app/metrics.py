@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import math
+import time
+import weakref
+from bisect import bisect_left
+from contextlib import contextmanager
+from itertools import count
+from threading import Lock, local
+from typing import Any, Callable, Iterable, Iterator
+
+# Seconds; wide enough for sub-millisecond lock waits and multi-second pipeline runs.
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Shard:
+    __slots__ = ("counts", "total")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.total = 0.0
+
+
+class _ThreadShards:
+    # Held only by one thread's local storage, so it is freed when that thread exits.
+    __slots__ = ("by_labels", "__weakref__")
+
+    def __init__(self) -> None:
+        self.by_labels: dict[LabelValues, _Shard] = {}
+
+
+class Histogram:
+    # Each thread records into its own shard, so observe() takes no lock and never
+    # contends; collect() sums the shards and may trail in-flight observations slightly.
+    # When a thread exits (Timer threads, threadpool churn) its shards are folded into a
+    # retired total, so the shard list tracks live threads rather than every thread seen.
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._local = local()
+        self._register_lock = Lock()
+        self._thread_ids = count()
+        # Live threads' shards by registration id; only changed under _register_lock.
+        self._threads: dict[int, dict[LabelValues, _Shard]] = {}
+        self._retired: dict[LabelValues, _Shard] = {}
+
+    def _shard(self, labels: LabelValues) -> _Shard:
+        holder: _ThreadShards | None = getattr(self._local, "shards", None)
+        if holder is None:
+            holder = self._local.shards = _ThreadShards()
+            with self._register_lock:
+                thread_id = next(self._thread_ids)
+                self._threads[thread_id] = holder.by_labels
+            weakref.finalize(holder, self._retire, thread_id)
+        shard = holder.by_labels.get(labels)
+        if shard is None:
+            if len(labels) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {labels}")
+            with self._register_lock:
+                shard = holder.by_labels[labels] = _Shard(len(self.buckets) + 1)
+        return shard
+
+    def _retire(self, thread_id: int) -> None:
+        # Runs once the owning thread is gone, so its shards no longer change.
+        with self._register_lock:
+            for labels, shard in self._threads.pop(thread_id).items():
+                retired = self._retired.get(labels)
+                if retired is None:
+                    retired = self._retired[labels] = _Shard(len(self.buckets) + 1)
+                retired.counts = [a + b for a, b in zip(retired.counts, shard.counts)]
+                retired.total += shard.total
+
+    def observe(self, value: float, *labels: str) -> None:
+        shard = self._shard(labels)
+        shard.counts[bisect_left(self.buckets, value)] += 1
+        shard.total += value
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def collect(self) -> list[str]:
+        with self._register_lock:
+            shards = [item for by_labels in self._threads.values() for item in by_labels.items()]
+            merged = {labels: (list(shard.counts), shard.total) for labels, shard in self._retired.items()}
+        for labels, shard in shards:
+            counts, total = merged.get(labels, ([0] * (len(self.buckets) + 1), 0.0))
+            merged[labels] = ([a + b for a, b in zip(counts, shard.counts)], total + shard.total)
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels in sorted(merged):
+            counts, total = merged[labels]
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                le = _format_labels(self.labelnames, labels, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            plain = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{plain} {_format_value(total)}")
+            lines.append(f"{self.name}_count{plain} {cumulative}")
+        return lines
+
+
+class GaugeCallback:
+    # Value(s) computed at scrape time, so the hot path pays nothing for them.
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        fn: Callable[[], Iterable[tuple[LabelValues, float]]],
+        labelnames: Iterable[str] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._fn = fn
+
+    def collect(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        for labels, value in self._fn():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: list[Histogram | GaugeCallback] = []
+
+    def register(self, metric: Any) -> Any:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+class InstrumentedStateStore:
+    # Times every public StateStore method into `histogram` (label: method). A
+    # transaction() is timed from entry to the end of its commit.
+    def __init__(self, store: Any, histogram: Histogram) -> None:
+        self._store = store
+        self._histogram = histogram
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._store, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        if name == "transaction":
+            return self._transaction
+        histogram = self._histogram
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started, name)
+
+        # Cached on the instance, so later lookups skip __getattr__ entirely.
+        self.__dict__[name] = timed
+        return timed
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            with self._store.transaction():
+                yield
+        finally:
+            self._histogram.observe(time.perf_counter() - started, "transaction")
@@ -2,9 +2,16 @@ from __future__ import annotations
 
 import json
 import os
+import queue
 import sqlite3
+import time
+from collections import Counter
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
-from typing import Any, Protocol
+from threading import Event, Lock, Thread, local
+from typing import Any, Iterator, Protocol
+
+from app.pg_pool import ConnectionPool
 
 
 StateSnapshot = tuple[
@@ -35,6 +42,45 @@ class StateStore(Protocol):
     def save_idempotency(self, task_id: str, idem_key: str, task_ref: str) -> None:
         ...
 
+    def stats(self) -> dict[str, Any]:
+        ...
+
+    def transaction(self) -> AbstractContextManager[None]:
+        ...
+
+    def load_active_state(self) -> StateSnapshot:
+        ...
+
+    def get_task(self, task_id: str) -> dict[str, Any] | None:
+        ...
+
+    def load_task_events(self, task_id: str, after_seq: int = 0, limit: int | None = None) -> list[dict[str, Any]]:
+        ...
+
+    def max_event_seq(self) -> int:
+        ...
+
+    def get_approval(self, queue_id: str) -> dict[str, Any] | None:
+        ...
+
+    def list_approvals(
+        self,
+        status: str | None,
+        approver_group: str | None,
+        after: tuple[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        ...
+
+    def get_idempotency(self, task_id: str, idem_key: str) -> str | None:
+        ...
+
+    def load_audit_counters(self) -> dict[str, int]:
+        ...
+
+    def add_audit_counters(self, deltas: dict[str, int]) -> None:
+        ...
+
 
 SCHEMA_DDL: tuple[str, ...] = (
     """
@@ -52,7 +98,8 @@ SCHEMA_DDL: tuple[str, ...] = (
         task_id TEXT NOT NULL,
         event_type TEXT NOT NULL,
         created_at TEXT NOT NULL,
-        payload TEXT NOT NULL
+        payload TEXT NOT NULL,
+        seq BIGINT
     );
     """,
     """
@@ -83,25 +130,373 @@ SCHEMA_DDL: tuple[str, ...] = (
         PRIMARY KEY (task_id, idem_key)
     );
     """,
+    """
+    CREATE TABLE IF NOT EXISTS audit_counters (
+        name TEXT PRIMARY KEY,
+        value BIGINT NOT NULL
+    );
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);",
+    "CREATE INDEX IF NOT EXISTS idx_events_task_created ON events(task_id, created_at);",
+    # Serves the status/approver_group filters and the (updated_at, queue_id) keyset order.
+    "CREATE INDEX IF NOT EXISTS idx_approvals_status_group_page ON approvals(status, approver_group, updated_at, queue_id);",
 )
 
+# Running totals behind GET /api/v1/audit/summary (see app.audit_counters). These statements
+# seed them once for databases that predate the table; ON CONFLICT keeps a concurrent seed
+# from failing, and callers run them under a write lock so it cannot double-count either.
+AUDIT_COUNTER_SEED_SQL: tuple[str, ...] = (
+    """
+    INSERT INTO audit_counters(name, value)
+    SELECT 'events', COUNT(*) FROM events WHERE true
+    ON CONFLICT(name) DO NOTHING
+    """,
+    """
+    INSERT INTO audit_counters(name, value)
+    SELECT 'events:' || event_type, COUNT(*) FROM events WHERE true GROUP BY event_type
+    ON CONFLICT(name) DO NOTHING
+    """,
+    """
+    INSERT INTO audit_counters(name, value)
+    SELECT 'approvals:' || status, COUNT(*) FROM approvals WHERE true GROUP BY status
+    ON CONFLICT(name) DO NOTHING
+    """,
+)
+
+# Counter deltas are added, not assigned, so processes sharing a database never overwrite
+# each other's counts.
+SQLITE_COUNTER_UPSERT = """
+    INSERT INTO audit_counters(name, value) VALUES(?, ?)
+    ON CONFLICT(name) DO UPDATE SET value = audit_counters.value + excluded.value
+    """
+POSTGRES_COUNTER_UPSERT = """
+    INSERT INTO audit_counters(name, value) VALUES(%s, %s)
+    ON CONFLICT(name) DO UPDATE SET value = audit_counters.value + EXCLUDED.value
+    """
+
+# Lazy hydration keeps only these (non-terminal) tasks in memory; DONE tasks never change.
+# Listed positively so the status index can be used as a range lookup.
+ACTIVE_TASK_STATUSES: tuple[str, ...] = ("READY", "RUNNING", "FAILED_RETRYABLE", "NEEDS_HUMAN_APPROVAL")
+
+
+def _is_enabled(name: str, *, default: bool = False) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
 
 def _json(value: dict[str, Any]) -> str:
     return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
 
 
+def _number_events(rows: list[tuple[str, str]], start: int) -> list[tuple[int, str, str]]:
+    # Assigns sequence numbers to (event_id, payload) rows that predate the seq column,
+    # in the order given, and mirrors the number into the stored payload.
+    numbered: list[tuple[int, str, str]] = []
+    for offset, (event_id, payload) in enumerate(rows):
+        seq = start + offset
+        event = json.loads(payload)
+        event["seq"] = seq
+        numbered.append((seq, _json(event), event_id))
+    return numbered
+
+
+Statement = tuple[str, tuple[Any, ...]]
+
+
+def _counter_statements(sql: str, deltas: dict[str, int]) -> list[Statement]:
+    # Name order, so concurrent transactions lock counter rows in the same order.
+    return [(sql, (name, delta)) for name, delta in sorted(deltas.items()) if delta]
+
+
+class _PendingWrite:
+    # claimed/cancelled are only changed under the store's _conn_lock: the committer claims
+    # an item before running it, and a caller that times out first cancels it instead.
+    __slots__ = ("statements", "done", "error", "claimed", "cancelled")
+
+    def __init__(self, statements: list[Statement]) -> None:
+        self.statements = statements
+        self.done = Event()
+        self.error: BaseException | None = None
+        self.claimed = False
+        self.cancelled = False
+
+
 class SQLiteStateStore:
-    def __init__(self, db_path: str) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        group_commit: bool = False,
+        commit_window_ms: float = 0.0,
+        commit_max_batch: int = 128,
+        commit_timeout_seconds: float = 30.0,
+    ) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        # Pipeline workers for different tasks use the connection concurrently; keep each
+        # statement and its commit together so one caller never commits another caller's
+        # half-done write, and on-demand reads never interleave with them.
+        self._conn_lock = Lock()
+        self._tx = local()
         self._init_schema()
 
+        self.group_commit = group_commit
+        self._commit_window = max(commit_window_ms, 0.0) / 1000.0
+        self._commit_max_batch = max(commit_max_batch, 1)
+        self._commit_timeout = max(commit_timeout_seconds, 0.001)
+        self._pending: queue.Queue[_PendingWrite] = queue.Queue()
+        # Set when a rollback fails: the connection is unusable and later writes fail fast.
+        self._broken: BaseException | None = None
+        if group_commit:
+            Thread(target=self._commit_loop, name="sqlite-group-commit", daemon=True).start()
+
     def _init_schema(self) -> None:
         for statement in SCHEMA_DDL:
             self.conn.execute(statement)
+        self._migrate_event_seq()
         self.conn.commit()
+        # BEGIN IMMEDIATE takes the write lock before the emptiness check, so two processes
+        # opening the same file cannot both seed.
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            if self.conn.execute("SELECT COUNT(*) FROM audit_counters").fetchone()[0] == 0:
+                for statement in AUDIT_COUNTER_SEED_SQL:
+                    self.conn.execute(statement)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def _migrate_event_seq(self) -> None:
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(events)")}
+        if "seq" not in columns:
+            self.conn.execute("ALTER TABLE events ADD COLUMN seq BIGINT")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_events_task_seq ON events(task_id, seq)")
+        rows = self.conn.execute(
+            "SELECT event_id, payload FROM events WHERE seq IS NULL ORDER BY created_at ASC, rowid ASC"
+        ).fetchall()
+        if not rows:
+            return
+        start = int(self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM events").fetchone()[0]) + 1
+        self.conn.executemany(
+            "UPDATE events SET seq = ?, payload = ? WHERE event_id = ?",
+            _number_events([(row["event_id"], row["payload"]) for row in rows], start),
+        )
+
+    def _write(self, sql: str, params: tuple[Any, ...]) -> None:
+        self._write_many([(sql, params)])
+
+    def _write_many(self, statements: list[Statement]) -> None:
+        # The statements commit (or fail) together.
+        buffered = getattr(self._tx, "statements", None)
+        if buffered is not None:
+            buffered.extend(statements)
+            return
+        if not self.group_commit:
+            with self._conn_lock:
+                try:
+                    for sql, params in statements:
+                        self.conn.execute(sql, params)
+                    self.conn.commit()
+                except Exception:
+                    self.conn.rollback()
+                    raise
+            return
+
+        # Group commit: hand the statements to the committer thread and wait until the
+        # transaction containing them is committed (or failed) before returning.
+        if self._broken is not None:
+            raise sqlite3.OperationalError(f"group commit stopped: {self._broken}")
+        pending = _PendingWrite(statements)
+        self._pending.put(pending)
+        # Callers usually hold a task stripe here; never wait on the committer forever. A
+        # write is only given up on while the committer has not started it, so a
+        # TimeoutError always means nothing was written.
+        if not pending.done.wait(self._commit_timeout):
+            with self._conn_lock:
+                if not pending.claimed:
+                    pending.cancelled = True
+                    raise TimeoutError(f"group commit did not start within {self._commit_timeout}s")
+            # Already run by the committer, which no longer holds the connection: the
+            # outcome is decided, so report it rather than guess.
+            pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        # Writes made by this thread inside the block are buffered and committed together
+        # when it exits; an exception discards them. Nested blocks join the outer one.
+        if getattr(self._tx, "statements", None) is not None:
+            yield
+            return
+        self._tx.statements = []
+        self._tx.counters = Counter()
+        try:
+            yield
+            statements = self._tx.statements + _counter_statements(SQLITE_COUNTER_UPSERT, self._tx.counters)
+        finally:
+            self._tx.statements = None
+            self._tx.counters = None
+        if statements:
+            self._write_many(statements)
+
+    def _commit_loop(self) -> None:
+        # With a zero window the batch is whatever queued up while the previous commit was
+        # running, so a lone writer pays no extra latency. A positive window waits for more.
+        while True:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + self._commit_window
+            while len(batch) < self._commit_max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._pending.get(timeout=remaining) if remaining > 0 else self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch: list[_PendingWrite]) -> None:
+        committed: list[_PendingWrite] = []
+        try:
+            if self._broken is not None:
+                return
+            with self._conn_lock:
+                for item in batch:
+                    item.claimed = not item.cancelled
+                live = [item for item in batch if item.claimed]
+                try:
+                    for item in live:
+                        for sql, params in item.statements:
+                            self.conn.execute(sql, params)
+                    self.conn.commit()
+                    committed = live
+                except Exception:
+                    self.conn.rollback()
+                    # Replay one by one so a single bad statement only fails its own caller.
+                    for item in live:
+                        try:
+                            for sql, params in item.statements:
+                                self.conn.execute(sql, params)
+                            self.conn.commit()
+                            committed.append(item)
+                        except Exception as exc:
+                            item.error = exc
+                            self.conn.rollback()
+        except Exception as exc:
+            # rollback() itself failed (I/O error, closed connection).
+            self._broken = exc
+        finally:
+            # Every caller is released, and nothing uncommitted is reported as written.
+            for item in batch:
+                if item.error is None and not any(item is done for done in committed):
+                    item.error = sqlite3.OperationalError(f"group commit stopped: {self._broken}")
+                item.done.set()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": "sqlite",
+            "group_commit": self.group_commit,
+            "pending_writes": self._pending.qsize(),
+            "broken": self._broken is not None,
+        }
+
+    def _fetch(self, sql: str, params: tuple[Any, ...] = ()) -> list[sqlite3.Row]:
+        with self._conn_lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def load_active_state(self) -> StateSnapshot:
+        tasks: dict[str, dict[str, Any]] = {}
+        events: list[dict[str, Any]] = []
+        approvals: dict[str, dict[str, Any]] = {}
+        idempotency: dict[tuple[str, str], str] = {}
+        placeholders = ",".join("?" for _ in ACTIVE_TASK_STATUSES)
+
+        for row in self._fetch(f"SELECT payload FROM tasks WHERE status IN ({placeholders})", ACTIVE_TASK_STATUSES):
+            item = json.loads(row["payload"])
+            tasks[item["task_id"]] = item
+
+        for row in self._fetch(
+            f"""
+            SELECT payload FROM events
+            WHERE task_id IN (SELECT task_id FROM tasks WHERE status IN ({placeholders}))
+            ORDER BY seq ASC
+            """,
+            ACTIVE_TASK_STATUSES,
+        ):
+            events.append(json.loads(row["payload"]))
+
+        for row in self._fetch("SELECT payload FROM approvals WHERE status = ?", ("PENDING",)):
+            item = json.loads(row["payload"])
+            approvals[item["queue_id"]] = item
+
+        for row in self._fetch(
+            f"""
+            SELECT task_id, idem_key, task_ref FROM run_idempotency
+            WHERE task_id IN (SELECT task_id FROM tasks WHERE status IN ({placeholders}))
+            """,
+            ACTIVE_TASK_STATUSES,
+        ):
+            idempotency[(row["task_id"], row["idem_key"])] = row["task_ref"]
+
+        return tasks, events, approvals, [], idempotency
+
+    def get_task(self, task_id: str) -> dict[str, Any] | None:
+        rows = self._fetch("SELECT payload FROM tasks WHERE task_id = ?", (task_id,))
+        return json.loads(rows[0]["payload"]) if rows else None
+
+    def load_task_events(self, task_id: str, after_seq: int = 0, limit: int | None = None) -> list[dict[str, Any]]:
+        rows = self._fetch(
+            "SELECT payload FROM events WHERE task_id = ? AND seq > ? ORDER BY seq ASC LIMIT ?",
+            (task_id, after_seq, -1 if limit is None else limit),
+        )
+        return [json.loads(row["payload"]) for row in rows]
+
+    def max_event_seq(self) -> int:
+        return int(self._fetch("SELECT COALESCE(MAX(seq), 0) FROM events")[0][0])
+
+    def get_approval(self, queue_id: str) -> dict[str, Any] | None:
+        rows = self._fetch("SELECT payload FROM approvals WHERE queue_id = ?", (queue_id,))
+        return json.loads(rows[0]["payload"]) if rows else None
+
+    def list_approvals(
+        self,
+        status: str | None,
+        approver_group: str | None,
+        after: tuple[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if approver_group:
+            clauses.append("approver_group = ?")
+            params.append(approver_group)
+        if after is not None:
+            clauses.append("(updated_at, queue_id) > (?, ?)")
+            params.extend(after)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT payload FROM approvals {where} ORDER BY updated_at ASC, queue_id ASC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        rows = self._fetch(sql, tuple(params))
+        return [json.loads(row["payload"]) for row in rows]
+
+    def get_idempotency(self, task_id: str, idem_key: str) -> str | None:
+        rows = self._fetch(
+            "SELECT task_ref FROM run_idempotency WHERE task_id = ? AND idem_key = ?",
+            (task_id, idem_key),
+        )
+        return rows[0]["task_ref"] if rows else None
+
+    def load_audit_counters(self) -> dict[str, int]:
+        return {row["name"]: int(row["value"]) for row in self._fetch("SELECT name, value FROM audit_counters")}
 
     def load_state(self) -> StateSnapshot:
         tasks: dict[str, dict[str, Any]] = {}
@@ -114,7 +509,7 @@ class SQLiteStateStore:
             item = json.loads(row["payload"])
             tasks[item["task_id"]] = item
 
-        for row in self.conn.execute("SELECT payload FROM events ORDER BY created_at ASC"):
+        for row in self.conn.execute("SELECT payload FROM events ORDER BY seq ASC"):
             events.append(json.loads(row["payload"]))
 
         for row in self.conn.execute("SELECT payload FROM approvals"):
@@ -130,7 +525,7 @@ class SQLiteStateStore:
         return tasks, events, approvals, actions, idempotency
 
     def save_task(self, task: dict[str, Any]) -> None:
-        self.conn.execute(
+        self._write(
             """
             INSERT INTO tasks(task_id, status, requested_by, updated_at, payload)
             VALUES(?,?,?,?,?)
@@ -148,13 +543,12 @@ class SQLiteStateStore:
                 _json(task),
             ),
         )
-        self.conn.commit()
 
     def save_event(self, event: dict[str, Any]) -> None:
-        self.conn.execute(
+        self._write(
             """
-            INSERT OR REPLACE INTO events(event_id, task_id, event_type, created_at, payload)
-            VALUES(?,?,?,?,?)
+            INSERT OR REPLACE INTO events(event_id, task_id, event_type, created_at, payload, seq)
+            VALUES(?,?,?,?,?,?)
             """,
             (
                 event["event_id"],
@@ -162,12 +556,12 @@ class SQLiteStateStore:
                 event["event_type"],
                 event["created_at"],
                 _json(event),
+                event.get("seq"),
             ),
         )
-        self.conn.commit()
 
     def save_approval(self, approval: dict[str, Any]) -> None:
-        self.conn.execute(
+        self._write(
             """
             INSERT INTO approvals(queue_id, task_id, status, approver_group, updated_at, payload)
             VALUES(?,?,?,?,?,?)
@@ -187,10 +581,18 @@ class SQLiteStateStore:
                 _json(approval),
             ),
         )
-        self.conn.commit()
+
+    def add_audit_counters(self, deltas: dict[str, int]) -> None:
+        # Inside a transaction the deltas are summed and written after its other statements,
+        # so the counters commit with the writes they count and each row is touched once.
+        buffered = getattr(self._tx, "counters", None)
+        if buffered is not None:
+            buffered.update(deltas)
+            return
+        self._write_many(_counter_statements(SQLITE_COUNTER_UPSERT, deltas))
 
     def save_approval_action(self, action: dict[str, Any]) -> None:
-        self.conn.execute(
+        self._write(
             """
             INSERT OR REPLACE INTO approval_actions(action_id, queue_id, task_id, action, created_at, payload)
             VALUES(?,?,?,?,?,?)
@@ -204,35 +606,213 @@ class SQLiteStateStore:
                 _json(action),
             ),
         )
-        self.conn.commit()
 
     def save_idempotency(self, task_id: str, idem_key: str, task_ref: str) -> None:
-        self.conn.execute(
+        self._write(
             """
             INSERT OR REPLACE INTO run_idempotency(task_id, idem_key, task_ref)
             VALUES(?,?,?)
             """,
             (task_id, idem_key, task_ref),
         )
-        self.conn.commit()
+
+
+def _pg_health_check(conn: Any) -> None:
+    with conn.cursor() as cur:
+        cur.execute("SELECT 1")
+    conn.rollback()
 
 
 class PostgresStateStore:
-    def __init__(self, dsn: str) -> None:
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        pool_min_size: int = 1,
+        pool_max_size: int = 10,
+        pool_timeout: float = 5.0,
+        health_check_interval: float = 30.0,
+    ) -> None:
         try:
             import psycopg
         except Exception as exc:  # pragma: no cover - optional dependency
             raise RuntimeError("postgres backend requires psycopg. Install with: pip install psycopg[binary]") from exc
 
         self._psycopg = psycopg
-        self.conn = psycopg.connect(dsn)
+        # API and pipeline threads each check out their own connection, so a slow statement
+        # only occupies one pool slot instead of stalling every writer.
+        self.pool = ConnectionPool(
+            lambda: psycopg.connect(dsn),
+            min_size=pool_min_size,
+            max_size=pool_max_size,
+            acquire_timeout=pool_timeout,
+            health_check_interval=health_check_interval,
+            check=_pg_health_check,
+            name="postgres",
+        )
+        self._tx = local()
         self._init_schema()
 
     def _init_schema(self) -> None:
-        with self.conn.cursor() as cur:
-            for statement in SCHEMA_DDL:
-                cur.execute(statement)
-        self.conn.commit()
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                for statement in SCHEMA_DDL:
+                    cur.execute(statement)
+                self._migrate_event_seq(cur)
+            conn.commit()
+            with conn.cursor() as cur:
+                # Held until commit: a second process starting at the same time waits, then
+                # sees the seeded rows.
+                cur.execute("LOCK TABLE audit_counters IN SHARE ROW EXCLUSIVE MODE")
+                cur.execute("SELECT COUNT(*) FROM audit_counters")
+                if cur.fetchone()[0] == 0:
+                    for statement in AUDIT_COUNTER_SEED_SQL:
+                        cur.execute(statement)
+            conn.commit()
+
+    def _migrate_event_seq(self, cur: Any) -> None:
+        cur.execute("ALTER TABLE events ADD COLUMN IF NOT EXISTS seq BIGINT")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_events_task_seq ON events(task_id, seq)")
+        cur.execute("SELECT event_id, payload FROM events WHERE seq IS NULL ORDER BY created_at ASC, event_id ASC")
+        rows = cur.fetchall()
+        if not rows:
+            return
+        cur.execute("SELECT COALESCE(MAX(seq), 0) FROM events")
+        start = int(cur.fetchone()[0]) + 1
+        cur.executemany(
+            "UPDATE events SET seq = %s, payload = %s WHERE event_id = %s",
+            _number_events([(event_id, payload) for event_id, payload in rows], start),
+        )
+
+    def _write(self, sql: str, params: tuple[Any, ...]) -> None:
+        self._write_many([(sql, params)])
+
+    def _write_many(self, statements: list[Statement]) -> None:
+        # The statements commit together; release() rolls back if one of them fails.
+        buffered = getattr(self._tx, "statements", None)
+        if buffered is not None:
+            buffered.extend(statements)
+            return
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                for sql, params in statements:
+                    cur.execute(sql, params)
+            conn.commit()
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": "postgres", "pool": self.pool.stats()}
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        # See SQLiteStateStore.transaction.
+        if getattr(self._tx, "statements", None) is not None:
+            yield
+            return
+        self._tx.statements = []
+        self._tx.counters = Counter()
+        try:
+            yield
+            statements = self._tx.statements + _counter_statements(POSTGRES_COUNTER_UPSERT, self._tx.counters)
+        finally:
+            self._tx.statements = None
+            self._tx.counters = None
+        if statements:
+            self._write_many(statements)
+
+    def _fetch(self, sql: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(sql, params)
+            return cur.fetchall()
+
+    def load_active_state(self) -> StateSnapshot:
+        tasks: dict[str, dict[str, Any]] = {}
+        events: list[dict[str, Any]] = []
+        approvals: dict[str, dict[str, Any]] = {}
+        idempotency: dict[tuple[str, str], str] = {}
+        active = list(ACTIVE_TASK_STATUSES)
+
+        for (payload,) in self._fetch("SELECT payload FROM tasks WHERE status = ANY(%s)", (active,)):
+            item = json.loads(payload)
+            tasks[item["task_id"]] = item
+
+        for (payload,) in self._fetch(
+            """
+            SELECT payload FROM events
+            WHERE task_id IN (SELECT task_id FROM tasks WHERE status = ANY(%s))
+            ORDER BY seq ASC
+            """,
+            (active,),
+        ):
+            events.append(json.loads(payload))
+
+        for (payload,) in self._fetch("SELECT payload FROM approvals WHERE status = %s", ("PENDING",)):
+            item = json.loads(payload)
+            approvals[item["queue_id"]] = item
+
+        for task_id, idem_key, task_ref in self._fetch(
+            """
+            SELECT task_id, idem_key, task_ref FROM run_idempotency
+            WHERE task_id IN (SELECT task_id FROM tasks WHERE status = ANY(%s))
+            """,
+            (active,),
+        ):
+            idempotency[(task_id, idem_key)] = task_ref
+
+        return tasks, events, approvals, [], idempotency
+
+    def get_task(self, task_id: str) -> dict[str, Any] | None:
+        rows = self._fetch("SELECT payload FROM tasks WHERE task_id = %s", (task_id,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def load_task_events(self, task_id: str, after_seq: int = 0, limit: int | None = None) -> list[dict[str, Any]]:
+        rows = self._fetch(
+            "SELECT payload FROM events WHERE task_id = %s AND seq > %s ORDER BY seq ASC LIMIT %s",
+            (task_id, after_seq, limit),
+        )
+        return [json.loads(payload) for (payload,) in rows]
+
+    def max_event_seq(self) -> int:
+        return int(self._fetch("SELECT COALESCE(MAX(seq), 0) FROM events")[0][0])
+
+    def get_approval(self, queue_id: str) -> dict[str, Any] | None:
+        rows = self._fetch("SELECT payload FROM approvals WHERE queue_id = %s", (queue_id,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def list_approvals(
+        self,
+        status: str | None,
+        approver_group: str | None,
+        after: tuple[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if status:
+            clauses.append("status = %s")
+            params.append(status)
+        if approver_group:
+            clauses.append("approver_group = %s")
+            params.append(approver_group)
+        if after is not None:
+            clauses.append("(updated_at, queue_id) > (%s, %s)")
+            params.extend(after)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT payload FROM approvals {where} ORDER BY updated_at ASC, queue_id ASC"
+        if limit is not None:
+            sql += " LIMIT %s"
+            params.append(limit)
+        rows = self._fetch(sql, tuple(params))
+        return [json.loads(payload) for (payload,) in rows]
+
+    def get_idempotency(self, task_id: str, idem_key: str) -> str | None:
+        rows = self._fetch(
+            "SELECT task_ref FROM run_idempotency WHERE task_id = %s AND idem_key = %s",
+            (task_id, idem_key),
+        )
+        return rows[0][0] if rows else None
+
+    def load_audit_counters(self) -> dict[str, int]:
+        return {name: int(value) for name, value in self._fetch("SELECT name, value FROM audit_counters")}
 
     def load_state(self) -> StateSnapshot:
         tasks: dict[str, dict[str, Any]] = {}
@@ -241,13 +821,13 @@ class PostgresStateStore:
         actions: list[dict[str, Any]] = []
         idempotency: dict[tuple[str, str], str] = {}
 
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute("SELECT payload FROM tasks")
             for (payload,) in cur.fetchall():
                 item = json.loads(payload)
                 tasks[item["task_id"]] = item
 
-            cur.execute("SELECT payload FROM events ORDER BY created_at ASC")
+            cur.execute("SELECT payload FROM events ORDER BY seq ASC")
             for (payload,) in cur.fetchall():
                 events.append(json.loads(payload))
 
@@ -267,118 +847,131 @@ class PostgresStateStore:
         return tasks, events, approvals, actions, idempotency
 
     def save_task(self, task: dict[str, Any]) -> None:
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO tasks(task_id, status, requested_by, updated_at, payload)
-                VALUES(%s,%s,%s,%s,%s)
-                ON CONFLICT(task_id) DO UPDATE SET
-                  status=EXCLUDED.status,
-                  requested_by=EXCLUDED.requested_by,
-                  updated_at=EXCLUDED.updated_at,
-                  payload=EXCLUDED.payload
-                """,
-                (
-                    task["task_id"],
-                    task["status"],
-                    task["requested_by"],
-                    task["updated_at"],
-                    _json(task),
-                ),
-            )
-        self.conn.commit()
+        self._write(
+            """
+            INSERT INTO tasks(task_id, status, requested_by, updated_at, payload)
+            VALUES(%s,%s,%s,%s,%s)
+            ON CONFLICT(task_id) DO UPDATE SET
+              status=EXCLUDED.status,
+              requested_by=EXCLUDED.requested_by,
+              updated_at=EXCLUDED.updated_at,
+              payload=EXCLUDED.payload
+            """,
+            (
+                task["task_id"],
+                task["status"],
+                task["requested_by"],
+                task["updated_at"],
+                _json(task),
+            ),
+        )
 
     def save_event(self, event: dict[str, Any]) -> None:
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO events(event_id, task_id, event_type, created_at, payload)
-                VALUES(%s,%s,%s,%s,%s)
-                ON CONFLICT(event_id) DO UPDATE SET
-                  task_id=EXCLUDED.task_id,
-                  event_type=EXCLUDED.event_type,
-                  created_at=EXCLUDED.created_at,
-                  payload=EXCLUDED.payload
-                """,
-                (
-                    event["event_id"],
-                    event["task_id"],
-                    event["event_type"],
-                    event["created_at"],
-                    _json(event),
-                ),
-            )
-        self.conn.commit()
+        self._write(
+            """
+            INSERT INTO events(event_id, task_id, event_type, created_at, payload, seq)
+            VALUES(%s,%s,%s,%s,%s,%s)
+            ON CONFLICT(event_id) DO UPDATE SET
+              task_id=EXCLUDED.task_id,
+              event_type=EXCLUDED.event_type,
+              created_at=EXCLUDED.created_at,
+              payload=EXCLUDED.payload,
+              seq=EXCLUDED.seq
+            """,
+            (
+                event["event_id"],
+                event["task_id"],
+                event["event_type"],
+                event["created_at"],
+                _json(event),
+                event.get("seq"),
+            ),
+        )
 
     def save_approval(self, approval: dict[str, Any]) -> None:
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO approvals(queue_id, task_id, status, approver_group, updated_at, payload)
-                VALUES(%s,%s,%s,%s,%s,%s)
-                ON CONFLICT(queue_id) DO UPDATE SET
-                  task_id=EXCLUDED.task_id,
-                  status=EXCLUDED.status,
-                  approver_group=EXCLUDED.approver_group,
-                  updated_at=EXCLUDED.updated_at,
-                  payload=EXCLUDED.payload
-                """,
-                (
-                    approval["queue_id"],
-                    approval["task_id"],
-                    approval["status"],
-                    approval.get("approver_group"),
-                    approval.get("resolved_at") or approval.get("created_at"),
-                    _json(approval),
-                ),
-            )
-        self.conn.commit()
+        self._write(
+            """
+            INSERT INTO approvals(queue_id, task_id, status, approver_group, updated_at, payload)
+            VALUES(%s,%s,%s,%s,%s,%s)
+            ON CONFLICT(queue_id) DO UPDATE SET
+              task_id=EXCLUDED.task_id,
+              status=EXCLUDED.status,
+              approver_group=EXCLUDED.approver_group,
+              updated_at=EXCLUDED.updated_at,
+              payload=EXCLUDED.payload
+            """,
+            (
+                approval["queue_id"],
+                approval["task_id"],
+                approval["status"],
+                approval.get("approver_group"),
+                approval.get("resolved_at") or approval.get("created_at"),
+                _json(approval),
+            ),
+        )
+
+    def add_audit_counters(self, deltas: dict[str, int]) -> None:
+        # See SQLiteStateStore.add_audit_counters. Writing them last also keeps the hot
+        # counter row locks for the shortest time.
+        buffered = getattr(self._tx, "counters", None)
+        if buffered is not None:
+            buffered.update(deltas)
+            return
+        self._write_many(_counter_statements(POSTGRES_COUNTER_UPSERT, deltas))
 
     def save_approval_action(self, action: dict[str, Any]) -> None:
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO approval_actions(action_id, queue_id, task_id, action, created_at, payload)
-                VALUES(%s,%s,%s,%s,%s,%s)
-                ON CONFLICT(action_id) DO UPDATE SET
-                  queue_id=EXCLUDED.queue_id,
-                  task_id=EXCLUDED.task_id,
-                  action=EXCLUDED.action,
-                  created_at=EXCLUDED.created_at,
-                  payload=EXCLUDED.payload
-                """,
-                (
-                    action["action_id"],
-                    action["queue_id"],
-                    action["task_id"],
-                    action["action"],
-                    action["created_at"],
-                    _json(action),
-                ),
-            )
-        self.conn.commit()
+        self._write(
+            """
+            INSERT INTO approval_actions(action_id, queue_id, task_id, action, created_at, payload)
+            VALUES(%s,%s,%s,%s,%s,%s)
+            ON CONFLICT(action_id) DO UPDATE SET
+              queue_id=EXCLUDED.queue_id,
+              task_id=EXCLUDED.task_id,
+              action=EXCLUDED.action,
+              created_at=EXCLUDED.created_at,
+              payload=EXCLUDED.payload
+            """,
+            (
+                action["action_id"],
+                action["queue_id"],
+                action["task_id"],
+                action["action"],
+                action["created_at"],
+                _json(action),
+            ),
+        )
 
     def save_idempotency(self, task_id: str, idem_key: str, task_ref: str) -> None:
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO run_idempotency(task_id, idem_key, task_ref)
-                VALUES(%s,%s,%s)
-                ON CONFLICT(task_id, idem_key) DO UPDATE SET
-                  task_ref=EXCLUDED.task_ref
-                """,
-                (task_id, idem_key, task_ref),
-            )
-        self.conn.commit()
+        self._write(
+            """
+            INSERT INTO run_idempotency(task_id, idem_key, task_ref)
+            VALUES(%s,%s,%s)
+            ON CONFLICT(task_id, idem_key) DO UPDATE SET
+              task_ref=EXCLUDED.task_ref
+            """,
+            (task_id, idem_key, task_ref),
+        )
 
 
 def create_state_store() -> StateStore:
     backend = os.getenv("NEWCLAW_DB_BACKEND", "sqlite").strip().lower()
     if backend == "sqlite":
-        return SQLiteStateStore(os.getenv("NEWCLAW_DB_PATH", "data/new_claw.db"))
+        return SQLiteStateStore(
+            os.getenv("NEWCLAW_DB_PATH", "data/new_claw.db"),
+            group_commit=_is_enabled("NEWCLAW_SQLITE_GROUP_COMMIT"),
+            commit_window_ms=float(os.getenv("NEWCLAW_SQLITE_COMMIT_WINDOW_MS", "0")),
+            commit_max_batch=int(os.getenv("NEWCLAW_SQLITE_COMMIT_MAX_BATCH", "128")),
+            commit_timeout_seconds=float(os.getenv("NEWCLAW_SQLITE_COMMIT_TIMEOUT_SECONDS", "30")),
+        )
     if backend == "postgres":
         dsn = os.getenv("NEWCLAW_DATABASE_URL", "").strip()
         if not dsn:
             raise RuntimeError("NEWCLAW_DATABASE_URL is required when NEWCLAW_DB_BACKEND=postgres")
-        return PostgresStateStore(dsn)
+        return PostgresStateStore(
+            dsn,
+            pool_min_size=int(os.getenv("NEWCLAW_PG_POOL_MIN_SIZE", "1")),
+            pool_max_size=int(os.getenv("NEWCLAW_PG_POOL_MAX_SIZE", "10")),
+            pool_timeout=float(os.getenv("NEWCLAW_PG_POOL_TIMEOUT", "5")),
+            health_check_interval=float(os.getenv("NEWCLAW_PG_POOL_HEALTH_CHECK_SECONDS", "30")),
+        )
     raise RuntimeError(f"unsupported NEWCLAW_DB_BACKEND: {backend}")
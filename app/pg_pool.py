@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition
+from typing import Any, Callable, Iterator
+
+
+class PoolTimeout(RuntimeError):
+    pass
+
+
+def _is_closed(conn: Any) -> bool:
+    return bool(getattr(conn, "closed", False) or getattr(conn, "broken", False))
+
+
+class ConnectionPool:
+    # Thread-safe pool of DB-API style connections. Connections are created on demand up
+    # to max_size, health-checked when they have been idle for a while, and discarded when
+    # they come back closed/broken or fail to roll back. A discard on release is replaced
+    # right away when it leaves the pool below min_size.
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        acquire_timeout: float = 5.0,
+        health_check_interval: float = 30.0,
+        check: Callable[[Any], None] | None = None,
+        name: str = "pool",
+    ) -> None:
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+        self.name = name
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self._connect = connect
+        self._check = check
+        self._cond = Condition()
+        self._idle: deque[tuple[Any, float]] = deque()
+        self._size = 0
+        self._in_use = 0
+        self._closed = False
+        self._acquired = 0
+        self._timeouts = 0
+        self._created = 0
+        self._discarded = 0
+        self._health_check_failures = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+        for _ in range(min_size):
+            conn = self._open()
+            with self._cond:
+                self._size += 1
+                self._idle.append((conn, time.monotonic()))
+
+    def _open(self) -> Any:
+        conn = self._connect()
+        with self._cond:
+            self._created += 1
+        return conn
+
+    def _discard(self, conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._discarded += 1
+            self._cond.notify()
+
+    def _replenish(self) -> None:
+        # Called from release(), so a failed connect is not raised to the caller; the next
+        # acquire() opens one on demand instead.
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                conn = self._open()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                return
+            with self._cond:
+                if not self._closed:
+                    self._idle.append((conn, time.monotonic()))
+                    self._cond.notify()
+                    continue
+            self._discard(conn)
+            return
+
+    def _healthy(self, conn: Any, idle_since: float) -> bool:
+        if _is_closed(conn):
+            return False
+        if self._check is None or time.monotonic() - idle_since < self.health_check_interval:
+            return True
+        try:
+            self._check(conn)
+        except Exception:
+            with self._cond:
+                self._health_check_failures += 1
+            return False
+        return True
+
+    def acquire(self) -> Any:
+        started = time.monotonic()
+        deadline = started + self.acquire_timeout
+        while True:
+            candidate: tuple[Any, float] | None = None
+            create = False
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise PoolTimeout(f"{self.name} pool is closed")
+                    if self._idle:
+                        candidate = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeout(f"{self.name} pool exhausted: no connection within {self.acquire_timeout}s")
+                    self._cond.wait(remaining)
+
+            if create:
+                try:
+                    conn = self._open()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+            else:
+                assert candidate is not None
+                conn, idle_since = candidate
+                if not self._healthy(conn, idle_since):
+                    self._discard(conn)
+                    continue
+
+            waited = time.monotonic() - started
+            with self._cond:
+                self._in_use += 1
+                self._acquired += 1
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+            return conn
+
+    def release(self, conn: Any) -> None:
+        with self._cond:
+            self._in_use -= 1
+        if self._closed or _is_closed(conn):
+            self._discard(conn)
+            self._replenish()
+            return
+        # Never hand out a connection that is still inside an open or aborted transaction.
+        # Callers commit their own writes; this is a no-op for connections already idle.
+        try:
+            conn.rollback()
+        except Exception:
+            self._discard(conn)
+            self._replenish()
+            return
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "name": self.name,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "acquired": self._acquired,
+                "timeouts": self._timeouts,
+                "created": self._created,
+                "discarded": self._discarded,
+                "health_check_failures": self._health_check_failures,
+                "wait_seconds_avg": (self._wait_total / self._acquired) if self._acquired else 0.0,
+                "wait_seconds_max": self._wait_max,
+            }
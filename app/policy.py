@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping
+
+DEFAULT_POLICY_RULES_PATH = Path(__file__).resolve().parents[1] / "configs" / "policy_rules.json"
+
+
+@dataclass(frozen=True)
+class PolicyRule:
+    reason_code: str
+    patterns: tuple[str, ...]
+    detail: str = ""
+
+
+def _read_rule_bytes(path: str | Path) -> bytes:
+    try:
+        return Path(path).read_bytes()
+    except OSError as exc:
+        raise RuntimeError(f"failed to load policy rules from {path}: {exc}") from exc
+
+
+def _read_rule_file(path: str | Path) -> tuple[dict[str, Any], str]:
+    return _decode_rule_file(_read_rule_bytes(path), path)
+
+
+def _decode_rule_file(content: bytes, path: str | Path) -> tuple[dict[str, Any], str]:
+    try:
+        raw = json.loads(content.decode("utf-8"))
+    except ValueError as exc:
+        raise RuntimeError(f"failed to load policy rules from {path}: {exc}") from exc
+    if not isinstance(raw, dict):
+        raise RuntimeError(f"invalid policy rule file {path}: top level must be an object")
+    # The declared version plus a content digest, so an edit that forgets to bump
+    # "version" still yields a distinct rule-set version in BLOCKED_POLICY events.
+    version = f"{raw.get('version', 0)}-{hashlib.sha256(content).hexdigest()[:12]}"
+    return raw, version
+
+
+def _parse_rules(raw: dict[str, Any], path: str | Path) -> tuple[PolicyRule, ...]:
+    rules: list[PolicyRule] = []
+    for item in raw.get("blocked_patterns", []):
+        patterns = tuple(pattern for pattern in item.get("patterns", []) if pattern)
+        if not item.get("reason_code") or not patterns:
+            raise RuntimeError(f"invalid policy rule in {path}: {item!r}")
+        rules.append(PolicyRule(reason_code=item["reason_code"], patterns=patterns, detail=item.get("detail", "")))
+    return tuple(rules)
+
+
+def _parse_templates(raw: dict[str, Any], path: str | Path) -> Mapping[str, tuple[str, ...]]:
+    templates: dict[str, tuple[str, ...]] = {}
+    for template_type, spec in raw.get("templates", {}).items():
+        fields = spec.get("required_fields") if isinstance(spec, dict) else None
+        if not isinstance(fields, list) or not all(isinstance(field, str) and field for field in fields):
+            raise RuntimeError(f"invalid template rule in {path}: {template_type!r}")
+        templates[template_type] = tuple(fields)
+    return MappingProxyType(templates)
+
+
+def load_policy_rules(path: str | Path) -> tuple[PolicyRule, ...]:
+    # Format: configs/policy_rules.json (see POLICY_WHITELIST.md section 5). Rule order is
+    # priority order when one input trips several rules.
+    raw, _ = _read_rule_file(path)
+    return _parse_rules(raw, path)
+
+
+def _trie_regex(patterns: list[str]) -> str:
+    # Builds one regex whose alternations share common prefixes, so the re engine walks a
+    # trie in C at each position instead of trying every pattern in turn. Optional tails
+    # are greedy, so the longest pattern starting at a position is the one reported.
+    trie: dict[str, Any] = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def _render(node: dict[str, Any]) -> str:
+        terminal = "" in node
+        branches = [re.escape(char) + _render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if terminal else body
+
+    return _render(trie)
+
+
+def _iter_strings(value: Any) -> Iterator[str]:
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, dict):
+            stack.extend(reversed(list(item.values())))
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(reversed(list(item)))
+        elif item is not None:
+            yield str(item)
+
+
+class PolicyMatcher:
+    # All patterns of all rules compiled into a single case-insensitive scanner. Each
+    # string in the (possibly nested) input is scanned once, whatever the rule count.
+    def __init__(self, rules: tuple[PolicyRule, ...]) -> None:
+        self.rules = rules
+        self._priority = {rule.reason_code: idx for idx, rule in enumerate(rules)}
+        owners: dict[str, set[str]] = {}
+        for rule in rules:
+            for pattern in rule.patterns:
+                owners.setdefault(pattern.lower(), set()).add(rule.reason_code)
+        # A match is the longest pattern at its position; every shorter pattern that is a
+        # prefix of it matched there too.
+        self._reasons: dict[str, frozenset[str]] = {}
+        for pattern in owners:
+            codes: set[str] = set()
+            for end in range(1, len(pattern) + 1):
+                codes |= owners.get(pattern[:end], set())
+            self._reasons[pattern] = frozenset(codes)
+        # Zero-width lookahead so overlapping matches (e.g. from different rules) are all seen.
+        self._scanner = re.compile(f"(?=({_trie_regex(list(owners))}))") if owners else None
+
+    @property
+    def pattern_count(self) -> int:
+        return len(self._reasons)
+
+    def detect(self, task_input: Any, approved_reasons: set[str] | frozenset[str] = frozenset()) -> str | None:
+        if self._scanner is None:
+            return None
+        candidates = {rule.reason_code for rule in self.rules} - set(approved_reasons)
+        if not candidates:
+            return None
+        top = min(candidates, key=self._priority.__getitem__)
+        found: set[str] = set()
+        for text in _iter_strings(task_input):
+            for match in self._scanner.finditer(text.lower()):
+                hits = self._reasons[match.group(1)] & candidates
+                if top in hits:
+                    return top
+                found |= hits
+        return min(found, key=self._priority.__getitem__) if found else None
+
+
+@dataclass(frozen=True)
+class PolicySnapshot:
+    version: str
+    matcher: PolicyMatcher
+    template_required_fields: Mapping[str, tuple[str, ...]]
+    loaded_at: float
+
+
+def load_policy_snapshot(path: str | Path) -> PolicySnapshot:
+    return _build_snapshot(_read_rule_bytes(path), path)
+
+
+def _build_snapshot(content: bytes, path: str | Path) -> PolicySnapshot:
+    raw, version = _decode_rule_file(content, path)
+    return PolicySnapshot(
+        version=version,
+        matcher=PolicyMatcher(_parse_rules(raw, path)),
+        template_required_fields=_parse_templates(raw, path),
+        loaded_at=time.time(),
+    )
+
+
+# A rule file modified within POLICY_RACY_WINDOW_NS of the last check is re-read and
+# compared by digest, as for the JWKS cache in app.auth: a same-size rewrite inside one
+# filesystem timestamp tick would otherwise look unchanged and keep stale rules in force.
+POLICY_RACY_WINDOW_NS = 2_000_000_000
+
+
+class PolicyStore:
+    # Serves the compiled rule set and swaps in a new one when the file on disk changes.
+    # Readers only read one attribute, so a decision always sees a single complete
+    # snapshot; compiling happens off to the side and never blocks readers. A broken
+    # file on reload keeps the previous snapshot in service.
+    def __init__(self, path: str | Path, check_interval: float = 2.0) -> None:
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._reload_lock = Lock()
+        self._file_state = self._stat()
+        self._checked_at_ns = time.time_ns()
+        content = _read_rule_bytes(self.path)
+        self._digest = hashlib.sha256(content).digest()
+        self._snapshot = _build_snapshot(content, self.path)
+        self._next_check = time.monotonic() + check_interval
+        self._reloads = 0
+        self._last_error: str | None = None
+
+    def _stat(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def current(self) -> PolicySnapshot:
+        if self.check_interval >= 0 and time.monotonic() >= self._next_check:
+            self.reload()
+        return self._snapshot
+
+    def reload(self, force: bool = False) -> bool:
+        # Returns True when a new snapshot was installed. Concurrent callers do not queue
+        # up behind a reload in progress; they keep using the current snapshot.
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+        try:
+            self._next_check = time.monotonic() + self.check_interval
+            file_state = self._stat()
+            if not force:
+                if file_state is None:
+                    return False
+                if file_state == self._file_state and file_state[0] + POLICY_RACY_WINDOW_NS < self._checked_at_ns:
+                    return False
+            checked_at_ns = time.time_ns()
+            try:
+                content = _read_rule_bytes(self.path)
+            except RuntimeError as exc:
+                self._last_error = str(exc)
+                return False
+            digest = hashlib.sha256(content).digest()
+            self._file_state = file_state
+            self._checked_at_ns = checked_at_ns
+            if digest == self._digest:
+                return False
+            self._digest = digest
+            try:
+                snapshot = _build_snapshot(content, self.path)
+            except RuntimeError as exc:
+                self._last_error = str(exc)
+                return False
+            self._last_error = None
+            if snapshot.version == self._snapshot.version:
+                return False
+            self._snapshot = snapshot
+            self._reloads += 1
+            return True
+        finally:
+            self._reload_lock.release()
+
+    def stats(self) -> dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "path": str(self.path),
+            "version": snapshot.version,
+            "patterns": snapshot.matcher.pattern_count,
+            "templates": sorted(snapshot.template_required_fields),
+            "reloads": self._reloads,
+            "last_error": self._last_error,
+        }
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import cProfile
+import functools
+import inspect
+import json
+import os
+import random
+import re
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from threading import Lock, current_thread
+from typing import Any, Callable, ContextManager, Iterator
+from uuid import uuid4
+
+from fastapi import Header, Response
+from fastapi.routing import APIRoute
+
+from app.auth import ActorContext
+
+PROFILE_HEADER = "X-Newclaw-Profile"
+PROFILE_ID_HEADER = "X-Newclaw-Profile-Id"
+PROFILE_ID_PATTERN = re.compile(r"^prof_[0-9a-f]{16}(?:_pipeline(?:_report)?)?$")
+
+# Profile id of the request being profiled in the current handler thread.
+_ACTIVE_PROFILE: ContextVar[str | None] = ContextVar("newclaw_active_profile", default=None)
+# Profile id of the pipeline run being profiled in the current worker thread.
+_ACTIVE_PIPELINE: ContextVar[str | None] = ContextVar("newclaw_active_pipeline", default=None)
+
+
+class ProfileArtifacts:
+    # <root>/<profile_id>.prof (pstats dump, open with `python -m pstats` or snakeviz) plus a
+    # <profile_id>.json sidecar. Only the newest max_artifacts profiles are kept.
+    def __init__(self, root: Path, max_artifacts: int) -> None:
+        self.root = root
+        self.max_artifacts = max(max_artifacts, 1)
+        self._lock = Lock()
+
+    def path_for(self, profile_id: str) -> Path | None:
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = self.root / f"{profile_id}.prof"
+        return path if path.is_file() else None
+
+    def save(self, profile_id: str, profiler: cProfile.Profile, meta: dict[str, Any]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(self.root / f"{profile_id}.prof"))
+        (self.root / f"{profile_id}.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        with self._lock:
+            self._prune_locked()
+
+    def _prune_locked(self) -> None:
+        sidecars = sorted(self.root.glob("prof_*.json"), key=lambda path: path.stat().st_mtime_ns)
+        for sidecar in sidecars[: max(len(sidecars) - self.max_artifacts, 0)]:
+            sidecar.with_suffix(".prof").unlink(missing_ok=True)
+            sidecar.unlink(missing_ok=True)
+
+    def list(self, limit: int) -> list[dict[str, Any]]:
+        items: list[dict[str, Any]] = []
+        for sidecar in self.root.glob("prof_*.json") if self.root.is_dir() else ():
+            try:
+                items.append(json.loads(sidecar.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                continue
+        items.sort(key=lambda item: item.get("created_at", 0), reverse=True)
+        return items[:limit]
+
+
+class RequestProfiler:
+    # Runs cProfile around selected route handlers and around the pipeline run those
+    # requests start. A request is profiled when an admin sends `X-Newclaw-Profile: 1`
+    # or when it falls into the sample rate. Only installed when enabled, so routes are
+    # untouched otherwise.
+    def __init__(self, artifacts: ProfileArtifacts, *, sample_rate: float = 0.0, allow_header: bool = True) -> None:
+        self.artifacts = artifacts
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.allow_header = allow_header
+        self._lock = Lock()
+        # task_id -> profile id of the request that started its pipeline run.
+        self._followed: dict[str, str] = {}
+        self._profiled = 0
+
+    def _wants_profile(self, header_value: str | None, kwargs: dict[str, Any]) -> bool:
+        if self.allow_header and header_value and header_value.strip().lower() in {"1", "true", "yes", "on"}:
+            actors = [value for value in kwargs.values() if isinstance(value, ActorContext)]
+            if any(actor.actor_role.strip().lower() == "admin" for actor in actors):
+                return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def wrap(self, endpoint: Callable[..., Any], route_path: str) -> Callable[..., Any]:
+        # Only sync handlers, which run whole on one threadpool thread, are wrapped. Async
+        # ones (the long-poll and SSE endpoints) run on the event loop thread, interleaved
+        # with every other request there, so a per-thread cProfile would mix them together.
+        if inspect.iscoroutinefunction(endpoint) or getattr(endpoint, "_newclaw_profiled", False):
+            return endpoint
+        signature = inspect.signature(endpoint, eval_str=True)
+
+        @functools.wraps(endpoint)
+        def profiled(*args: Any, **kwargs: Any) -> Any:
+            header_value = kwargs.pop("_profile_header", None)
+            response: Response = kwargs.pop("_profile_response")
+            if not self._wants_profile(header_value, kwargs):
+                return endpoint(*args, **kwargs)
+            profile_id = f"prof_{uuid4().hex[:16]}"
+            response.headers[PROFILE_ID_HEADER] = profile_id
+            token = _ACTIVE_PROFILE.set(profile_id)
+            try:
+                with self._profile(profile_id, kind="request", target=route_path):
+                    return endpoint(*args, **kwargs)
+            finally:
+                _ACTIVE_PROFILE.reset(token)
+
+        extra = [
+            inspect.Parameter(
+                "_profile_header",
+                inspect.Parameter.KEYWORD_ONLY,
+                default=Header(default=None, alias=PROFILE_HEADER),
+                annotation=str | None,
+            ),
+            inspect.Parameter("_profile_response", inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+        ]
+        # Resolved annotations, so FastAPI does not look names up in this module's globals.
+        profiled.__signature__ = signature.replace(parameters=[*signature.parameters.values(), *extra])  # type: ignore[attr-defined]
+        # include_router() rebuilds routes with the same route class; wrap only once.
+        profiled._newclaw_profiled = True  # type: ignore[attr-defined]
+        return profiled
+
+    @contextmanager
+    def _profile(self, profile_id: str, *, kind: str, target: str) -> Iterator[None]:
+        profiler = cProfile.Profile()
+        created_at = time.time()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - started
+            self.artifacts.save(
+                profile_id,
+                profiler,
+                {
+                    "profile_id": profile_id,
+                    "kind": kind,
+                    "target": target,
+                    "created_at": created_at,
+                    "duration_seconds": round(elapsed, 6),
+                    # cProfile only sees the thread it was enabled on; work handed to other
+                    # threads is missing here unless it has an artifact of its own.
+                    "thread": current_thread().name,
+                },
+            )
+            with self._lock:
+                self._profiled += 1
+
+    def follow(self, task_id: str) -> None:
+        # Called where a handler hands a task to the scheduler; profiles that pipeline run
+        # too when the handler itself is being profiled.
+        profile_id = _ACTIVE_PROFILE.get()
+        if profile_id is not None:
+            with self._lock:
+                self._followed[task_id] = profile_id
+
+    def unfollow(self, task_id: str) -> None:
+        # For a handoff that failed after follow(): no pipeline run will pop the entry.
+        with self._lock:
+            self._followed.pop(task_id, None)
+
+    def pipeline(self, task_id: str) -> ContextManager[None]:
+        with self._lock:
+            profile_id = self._followed.pop(task_id, None)
+        if profile_id is None:
+            return nullcontext()
+        return self._pipeline(f"{profile_id}_pipeline", task_id)
+
+    @contextmanager
+    def _pipeline(self, pipeline_id: str, task_id: str) -> Iterator[None]:
+        token = _ACTIVE_PIPELINE.set(pipeline_id)
+        try:
+            with self._profile(pipeline_id, kind="pipeline", target=task_id):
+                yield
+        finally:
+            _ACTIVE_PIPELINE.reset(token)
+
+    def handoff(self, task_id: str) -> Callable[[], ContextManager[None]]:
+        # Called on a worker thread inside pipeline(), for work it hands to another thread
+        # (the report write and the reviewer/reporter stages on the report I/O pool). That
+        # part is saved as <profile_id>_pipeline_report, since a profile covers one thread.
+        pipeline_id = _ACTIVE_PIPELINE.get()
+        if pipeline_id is None:
+            return nullcontext
+        return lambda: self._profile(f"{pipeline_id}_report", kind="pipeline_report", target=task_id)
+
+    def route_class(self) -> type[APIRoute]:
+        profiler = self
+
+        class ProfiledRoute(APIRoute):
+            def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+                super().__init__(path, profiler.wrap(endpoint, path), **kwargs)
+
+        return ProfiledRoute
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": True,
+                "header": PROFILE_HEADER if self.allow_header else None,
+                "sample_rate": self.sample_rate,
+                "profiled": self._profiled,
+                "pending_pipelines": len(self._followed),
+            }
+
+
+def _is_enabled(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def create_profiler() -> RequestProfiler | None:
+    # None unless NEWCLAW_PROFILING is on or a sample rate is set.
+    sample_rate = float(os.getenv("NEWCLAW_PROFILE_SAMPLE_RATE", "0"))
+    allow_header = _is_enabled("NEWCLAW_PROFILING")
+    if not allow_header and sample_rate <= 0:
+        return None
+    artifacts = ProfileArtifacts(
+        Path(os.getenv("NEWCLAW_PROFILE_DIR", "data/profiles")),
+        int(os.getenv("NEWCLAW_PROFILE_MAX_ARTIFACTS", "200")),
+    )
+    return RequestProfiler(artifacts, sample_rate=sample_rate, allow_header=allow_header)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable
+from uuid import uuid4
+
+
+def render_cache_key(template_type: str, payload: Any, renderer_version: str) -> str:
+    # Canonical JSON so dict ordering and whitespace never split identical inputs. The
+    # renderer version keeps output from an older renderer from being served after it changes.
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{renderer_version}\0{template_type}\0{canonical}".encode("utf-8")).hexdigest()
+
+
+def link_or_write(source: Path | None, target: Path, text: str) -> None:
+    # Hard-links the cached object to the task's report path so identical reports share one
+    # file on disk; falls back to writing the text (object evicted, or no link support).
+    # Either way the target is replaced atomically.
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.{uuid4().hex[:8]}.tmp")
+    try:
+        if source is None:
+            raise FileNotFoundError
+        os.link(source, tmp)
+    except OSError:
+        tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, target)
+
+
+class RenderCache:
+    # Content-addressed store of rendered reports: key -> object file under root. Bounded to
+    # max_entries with LRU eviction; evicting unlinks the object, while task reports linked
+    # to it keep their own directory entry. Objects left from a previous run are adopted.
+    def __init__(self, root: Path, max_entries: int) -> None:
+        self.root = root
+        self.max_entries = max(max_entries, 0)
+        self._lock = Lock()
+        self._entries: OrderedDict[str, Path] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        if self.max_entries and root.is_dir():
+            existing = sorted(
+                (entry.stat().st_mtime_ns, entry.name[:-3], Path(entry.path))
+                for entry in os.scandir(root)
+                if entry.is_file() and entry.name.endswith(".md")
+            )
+            for _, key, path in existing:
+                self._entries[key] = path
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        while len(self._entries) > self.max_entries:
+            _, path = self._entries.popitem(last=False)
+            self._evictions += 1
+            path.unlink(missing_ok=True)
+
+    def _read(self, key: str) -> tuple[str, Path] | None:
+        with self._lock:
+            path = self._entries.get(key)
+            if path is not None:
+                self._entries.move_to_end(key)
+        if path is None:
+            return None
+        try:
+            return path.read_text(encoding="utf-8"), path
+        except OSError:
+            with self._lock:
+                if self._entries.get(key) == path:
+                    del self._entries[key]
+            return None
+
+    def _store(self, key: str, text: str) -> Path:
+        path = self.root / f"{key}.md"
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{uuid4().hex[:8]}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+        with self._lock:
+            self._entries[key] = path
+            self._entries.move_to_end(key)
+            self._evict_locked()
+        return path
+
+    def get_or_render(self, key: str, render: Callable[[], str]) -> tuple[str, Path | None]:
+        # Returns the report text and the object file to link from (None when disabled).
+        # Two concurrent misses on one key both render; the second store just overwrites.
+        if not self.max_entries:
+            return render(), None
+        cached = self._read(key)
+        with self._lock:
+            if cached is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        if cached is not None:
+            return cached
+        text = render()
+        return text, self._store(key, text)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, ContextManager, Protocol
+from uuid import uuid4
+
+from app.render_cache import link_or_write
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ReportStorage(Protocol):
+    def put(self, task_id: str, report_text: str, cached_path: Path | None = None) -> str:
+        ...
+
+    def read(self, report_ref: str) -> str:
+        ...
+
+    def stats(self) -> dict[str, Any]:
+        ...
+
+
+def _shard(task_id: str, depth: int) -> list[str]:
+    # Task ids share a "task_" prefix, so shard on a hash rather than on the id itself.
+    digest = hashlib.sha1(task_id.encode("utf-8")).hexdigest()
+    return [digest[idx * 2 : idx * 2 + 2] for idx in range(depth)]
+
+
+def _encode(report_text: str, compress: bool) -> bytes:
+    data = report_text.encode("utf-8")
+    # mtime=0 keeps identical reports byte-identical once compressed.
+    return gzip.compress(data, mtime=0) if compress else data
+
+
+def _atomic_write(path: Path, data: bytes, fsync: bool) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{uuid4().hex[:8]}.tmp")
+    with open(tmp, "wb") as handle:
+        handle.write(data)
+        if fsync:
+            handle.flush()
+            os.fsync(handle.fileno())
+    os.replace(tmp, path)
+    if fsync:
+        _fsync_dir(path.parent)
+
+
+def _fsync_dir(path: Path) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class LocalReportStorage:
+    # <root>/<ab>/<cd>/<task_id>/report.md[.gz], written to a temp file and renamed into
+    # place. Uncompressed reports are hard-linked from the render cache when possible.
+    def __init__(self, root: Path, *, shard_depth: int = 2, compress: bool = False, fsync: bool = False) -> None:
+        self.root = root
+        self.shard_depth = max(shard_depth, 0)
+        self.compress = compress
+        self.fsync = fsync
+
+    def path_for(self, task_id: str) -> Path:
+        name = "report.md.gz" if self.compress else "report.md"
+        return self.root.joinpath(*_shard(task_id, self.shard_depth), task_id, name)
+
+    def put(self, task_id: str, report_text: str, cached_path: Path | None = None) -> str:
+        report_path = self.path_for(task_id)
+        if self.compress or self.fsync:
+            _atomic_write(report_path, _encode(report_text, self.compress), self.fsync)
+        else:
+            link_or_write(cached_path, report_path, report_text)
+        return str(report_path)
+
+    def read(self, report_ref: str) -> str:
+        data = Path(report_ref).read_bytes()
+        if report_ref.endswith(".gz"):
+            data = gzip.decompress(data)
+        return data.decode("utf-8")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": "local",
+            "root": str(self.root),
+            "shard_depth": self.shard_depth,
+            "compress": self.compress,
+            "fsync": self.fsync,
+        }
+
+
+class LocalObjectClient:
+    # Directory-backed stand-in for the two S3 calls the adapter uses, for development and
+    # tests without an object store. Objects are published with an atomic rename.
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def _path(self, bucket: str, key: str) -> Path:
+        return self.root / bucket / key
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes, **_: Any) -> dict[str, Any]:
+        _atomic_write(self._path(Bucket, Key), Body, fsync=False)
+        return {"ETag": hashlib.md5(Body).hexdigest()}
+
+    def get_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        path = self._path(Bucket, Key)
+        return {"Body": _BytesBody(path.read_bytes())}
+
+
+class _BytesBody:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    def read(self) -> bytes:
+        return self._data
+
+
+class S3ReportStorage:
+    # Reports as objects under <prefix>/<ab>/<cd>/<task_id>/report.md[.gz]; the reference
+    # stored in the task result is the s3:// URI. Single PUTs are atomic on S3.
+    def __init__(
+        self,
+        bucket: str,
+        *,
+        prefix: str = "reports",
+        endpoint_url: str | None = None,
+        shard_depth: int = 2,
+        compress: bool = False,
+        client: Any = None,
+    ) -> None:
+        if client is None:
+            try:
+                import boto3
+            except ImportError as exc:
+                raise RuntimeError("s3 report backend requires boto3. Install with: pip install boto3") from exc
+            client = boto3.client("s3", endpoint_url=endpoint_url or None)
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.shard_depth = max(shard_depth, 0)
+        self.compress = compress
+        self._client = client
+
+    def key_for(self, task_id: str) -> str:
+        name = "report.md.gz" if self.compress else "report.md"
+        return "/".join(part for part in (self.prefix, *_shard(task_id, self.shard_depth), task_id, name) if part)
+
+    def put(self, task_id: str, report_text: str, cached_path: Path | None = None) -> str:
+        key = self.key_for(task_id)
+        extra = {"ContentEncoding": "gzip"} if self.compress else {}
+        self._client.put_object(
+            Bucket=self.bucket,
+            Key=key,
+            Body=_encode(report_text, self.compress),
+            ContentType="text/markdown; charset=utf-8",
+            **extra,
+        )
+        return f"s3://{self.bucket}/{key}"
+
+    def read(self, report_ref: str) -> str:
+        bucket, _, key = report_ref.removeprefix("s3://").partition("/")
+        data = self._client.get_object(Bucket=bucket, Key=key)["Body"].read()
+        if key.endswith(".gz"):
+            data = gzip.decompress(data)
+        return data.decode("utf-8")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": "s3",
+            "bucket": self.bucket,
+            "prefix": self.prefix,
+            "shard_depth": self.shard_depth,
+            "compress": self.compress,
+        }
+
+
+class ReportWriter:
+    # Runs report storage writes on a dedicated I/O pool so pipeline workers hand the
+    # write off and move on; the callback receives (report_ref, None) or (None, error)
+    # on the same I/O thread, right after the write.
+    # At most max_pending writes are queued or running; submit() blocks beyond that, so a
+    # slow store pushes back on the pipeline workers instead of growing the pool's queue.
+    def __init__(self, storage: ReportStorage, *, workers: int, max_pending: int = 64) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        self.storage = storage
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="report-io")
+        self._slots = BoundedSemaphore(max_pending)
+        self._lock = Lock()
+        self._pending = 0
+        self._submit_waits = 0
+        self._written = 0
+        self._failed = 0
+        self._write_total = 0.0
+        self._write_max = 0.0
+
+    def _write(self, task_id: str, report_text: str, cached_path: Path | None) -> str:
+        started = time.monotonic()
+        try:
+            report_ref = self.storage.put(task_id, report_text, cached_path)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+                self._failed += 1
+            raise
+        finally:
+            self._slots.release()
+        elapsed = time.monotonic() - started
+        with self._lock:
+            self._pending -= 1
+            self._written += 1
+            self._write_total += elapsed
+            self._write_max = max(self._write_max, elapsed)
+        return report_ref
+
+    def submit(
+        self,
+        task_id: str,
+        report_text: str,
+        cached_path: Path | None,
+        callback: Callable[[str | None, BaseException | None], None],
+        context: Callable[[], ContextManager[Any]] = nullcontext,
+    ) -> Future[str]:
+        # The write and then the callback run on one I/O thread inside context() (e.g. a
+        # profiler following the task there).
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._submit_waits += 1
+            self._slots.acquire()
+        with self._lock:
+            self._pending += 1
+        try:
+            return self._executor.submit(self._run, task_id, report_text, cached_path, callback, context)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            self._slots.release()
+            raise
+
+    def _run(
+        self,
+        task_id: str,
+        report_text: str,
+        cached_path: Path | None,
+        callback: Callable[[str | None, BaseException | None], None],
+        context: Callable[[], ContextManager[Any]],
+    ) -> str:
+        with context():
+            try:
+                report_ref = self._write(task_id, report_text, cached_path)
+            except Exception as exc:
+                self._notify(callback, None, exc)
+                raise
+            self._notify(callback, report_ref, None)
+            return report_ref
+
+    def _notify(
+        self,
+        callback: Callable[[str | None, BaseException | None], None],
+        report_ref: str | None,
+        error: BaseException | None,
+    ) -> None:
+        try:
+            callback(report_ref, error)
+        except Exception:
+            LOGGER.exception("report callback failed")
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self.storage.stats(),
+                "io_workers": self.workers,
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+                "submit_waits": self._submit_waits,
+                "written": self._written,
+                "failed": self._failed,
+                "write_seconds_avg": round(self._write_total / self._written, 6) if self._written else 0.0,
+                "write_seconds_max": round(self._write_max, 6),
+            }
+
+
+def _is_enabled(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def create_report_storage(root: Path) -> ReportStorage:
+    backend = os.getenv("NEWCLAW_REPORT_BACKEND", "local").strip().lower()
+    shard_depth = int(os.getenv("NEWCLAW_REPORT_SHARD_DEPTH", "2"))
+    compress = _is_enabled("NEWCLAW_REPORT_COMPRESS")
+    if backend == "local":
+        return LocalReportStorage(
+            root, shard_depth=shard_depth, compress=compress, fsync=_is_enabled("NEWCLAW_REPORT_FSYNC")
+        )
+    if backend in {"s3", "s3-local"}:
+        bucket = os.getenv("NEWCLAW_REPORT_S3_BUCKET", "").strip()
+        if not bucket:
+            raise RuntimeError(f"NEWCLAW_REPORT_S3_BUCKET is required when NEWCLAW_REPORT_BACKEND={backend}")
+        client = None
+        if backend == "s3-local":
+            client = LocalObjectClient(Path(os.getenv("NEWCLAW_REPORT_S3_LOCAL_ROOT", "data/object_store")))
+        return S3ReportStorage(
+            bucket,
+            prefix=os.getenv("NEWCLAW_REPORT_S3_PREFIX", "reports"),
+            endpoint_url=os.getenv("NEWCLAW_REPORT_S3_ENDPOINT"),
+            shard_depth=shard_depth,
+            compress=compress,
+            client=client,
+        )
+    raise RuntimeError(f"unsupported NEWCLAW_REPORT_BACKEND: {backend}")
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import logging
+import queue
+import time
+from collections import deque
+from threading import Condition, Lock, Thread
+from typing import Any, Callable
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SchedulerSaturated(RuntimeError):
+    pass
+
+
+Job = tuple[float, Callable[..., None], tuple[Any, ...]]
+
+
+class PipelineScheduler:
+    # Fixed-size worker pool fed by a bounded ready queue. Submissions beyond the queue
+    # capacity are refused immediately instead of spawning more threads. Batches and
+    # retries go through a bounded backlog instead (reserve() then submit_reserved()): a
+    # feeder thread moves them onto the queue as workers free slots, so a batch larger than
+    # the queue is accepted whole.
+    def __init__(self, *, workers: int, queue_size: int, backlog_size: int = 0, name: str = "pipeline") -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        self.name = name
+        self.workers = workers
+        self.queue_size = queue_size
+        self.backlog_size = max(backlog_size, 0)
+        self._queue: queue.Queue[Job] = queue.Queue(maxsize=queue_size)
+        self._backlog: deque[Job] = deque()
+        self._backlog_cond = Condition()
+        self._reserved = 0
+        self._threads: list[Thread] = []
+        self._start_lock = Lock()
+        self._stats_lock = Lock()
+        self._busy = 0
+        self._submitted = 0
+        self._rejected = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _ensure_started(self) -> None:
+        if self._threads:
+            return
+        with self._start_lock:
+            if self._threads:
+                return
+            threads = [
+                Thread(target=self._worker, name=f"{self.name}-worker-{idx}", daemon=True)
+                for idx in range(self.workers)
+            ]
+            threads.append(Thread(target=self._feed, name=f"{self.name}-feeder", daemon=True))
+            for thread in threads:
+                thread.start()
+            self._threads = threads
+
+    def submit(self, fn: Callable[..., None], *args: Any) -> None:
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((time.monotonic(), fn, args))
+        except queue.Full as exc:
+            with self._stats_lock:
+                self._rejected += 1
+            raise SchedulerSaturated(f"{self.name} queue is full ({self.queue_size})") from exc
+        with self._stats_lock:
+            self._submitted += 1
+
+    def reserve(self, count: int) -> int:
+        # Claims up to `count` backlog slots before the caller commits the work they are
+        # for; returns how many were granted. Follow with submit_reserved() or release().
+        with self._backlog_cond:
+            granted = max(min(count, self.backlog_size - len(self._backlog) - self._reserved), 0)
+            self._reserved += granted
+        if granted < count:
+            with self._stats_lock:
+                self._rejected += count - granted
+        return granted
+
+    def release(self, count: int) -> None:
+        with self._backlog_cond:
+            self._reserved -= count
+
+    def submit_reserved(self, fn: Callable[..., None], arg_list: list[tuple[Any, ...]]) -> None:
+        # Never blocks and never refuses: the slots were claimed by reserve().
+        self._ensure_started()
+        enqueued_at = time.monotonic()
+        with self._backlog_cond:
+            self._reserved -= len(arg_list)
+            self._backlog.extend((enqueued_at, fn, args) for args in arg_list)
+            self._backlog_cond.notify()
+        with self._stats_lock:
+            self._submitted += len(arg_list)
+
+    def _feed(self) -> None:
+        while True:
+            with self._backlog_cond:
+                while not self._backlog:
+                    self._backlog_cond.wait()
+                job = self._backlog[0]
+            # Blocks while the queue is full; the job keeps its backlog slot until then.
+            self._queue.put(job)
+            with self._backlog_cond:
+                self._backlog.popleft()
+
+    def _worker(self) -> None:
+        while True:
+            enqueued_at, fn, args = self._queue.get()
+            waited = time.monotonic() - enqueued_at
+            with self._stats_lock:
+                self._busy += 1
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+            failed = False
+            try:
+                fn(*args)
+            except Exception:
+                failed = True
+                LOGGER.exception("%s job failed: %s%r", self.name, getattr(fn, "__name__", fn), args)
+            finally:
+                with self._stats_lock:
+                    self._busy -= 1
+                    self._completed += 1
+                    if failed:
+                        self._failed += 1
+                self._queue.task_done()
+
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            started = self._completed + self._busy
+            return {
+                "workers": self.workers,
+                "busy_workers": self._busy,
+                "queue_depth": self._queue.qsize(),
+                "queue_capacity": self.queue_size,
+                "backlog_depth": len(self._backlog),
+                "backlog_capacity": self.backlog_size,
+                "submitted": self._submitted,
+                "rejected": self._rejected,
+                "completed": self._completed,
+                "failed": self._failed,
+                "wait_seconds_avg": (self._wait_total / started) if started else 0.0,
+                "wait_seconds_max": self._wait_max,
+            }
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.approval_index import ApprovalIndex  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare linear approval filtering vs the status/group index")
+    parser.add_argument("--approvals", type=int, default=300_000, help="historical approvals (default: 300000)")
+    parser.add_argument("--pending", type=int, default=500, help="of which still PENDING (default: 500)")
+    parser.add_argument("--groups", type=int, default=20, help="approver groups (default: 20)")
+    parser.add_argument("--page-size", type=int, default=50, help="inbox page size (default: 50)")
+    parser.add_argument("--requests", type=int, default=50, help="inbox requests to time (default: 50)")
+    args = parser.parse_args()
+
+    queue: dict[str, dict] = {}
+    for idx in range(args.approvals):
+        pending = idx >= args.approvals - args.pending
+        queue_id = f"aq_{idx:08d}"
+        queue[queue_id] = {
+            "queue_id": queue_id,
+            "task_id": f"task_{idx}",
+            "status": "PENDING" if pending else ("APPROVED" if idx % 3 else "REJECTED"),
+            "approver_group": f"group_{idx % args.groups}",
+            "created_at": f"2026-03-01T00:{idx // 3600 % 60:02d}:{idx % 60:02d}+00:00",
+            "resolved_at": None if pending else "2026-03-02T00:00:00+00:00",
+        }
+
+    started = time.perf_counter()
+    index = ApprovalIndex(queue.values())
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for idx in range(args.requests):
+        group = f"group_{idx % args.groups}"
+        items = [item for item in list(queue.values()) if item["status"] == "PENDING" and item["approver_group"] == group]
+    scan_seconds = (time.perf_counter() - started) / args.requests
+
+    started = time.perf_counter()
+    for idx in range(args.requests):
+        group = f"group_{idx % args.groups}"
+        items = [queue[queue_id] for queue_id in index.page("PENDING", group, limit=args.page_size)]
+    index_seconds = (time.perf_counter() - started) / args.requests
+    del items
+
+    print(f"approvals={args.approvals} pending={args.pending} groups={args.groups}")
+    print(f"index build: {build_seconds:.3f}s")
+    print(f"linear filter: {scan_seconds * 1000:.3f} ms/request")
+    print(f"index page:    {index_seconds * 1000:.4f} ms/request")
+    print(f"speedup: {scan_seconds / index_seconds:.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
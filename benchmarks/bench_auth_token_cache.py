@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.auth import TOKEN_CACHE, issue_dev_jwt, reload_auth_settings, resolve_actor_context  # noqa: E402
+
+
+def _b64url(value: bytes) -> str:
+    return base64.urlsafe_b64encode(value).decode("utf-8").rstrip("=")
+
+
+def _idp_token(sub: str, secret: str) -> str:
+    header = _b64url(json.dumps({"alg": "HS256", "typ": "JWT", "kid": "kid-1"}).encode("utf-8"))
+    claims = {"sub": sub, "role": "reviewer", "exp": int(time.time()) + 3600}
+    payload = _b64url(json.dumps(claims).encode("utf-8"))
+    signature = hmac.new(secret.encode("utf-8"), f"{header}.{payload}".encode("utf-8"), hashlib.sha256).digest()
+    return f"{header}.{payload}.{_b64url(signature)}"
+
+
+def _throughput(calls: list[tuple[str | None, str | None]], cache_size: int) -> float:
+    TOKEN_CACHE.clear()
+    TOKEN_CACHE.max_entries = cache_size
+    started = time.perf_counter()
+    for authorization, sso_token in calls:
+        resolve_actor_context(authorization, None, None, None, None, sso_token)
+    return len(calls) / (time.perf_counter() - started)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare cached and uncached bearer/SSO token authentication")
+    parser.add_argument("--tokens", type=int, default=200, help="distinct tokens (default: 200)")
+    parser.add_argument("--requests", type=int, default=50_000, help="authentications per run (default: 50000)")
+    args = parser.parse_args()
+
+    secret = "bench-idp-secret"
+    with tempfile.TemporaryDirectory() as tmp:
+        jwks_path = Path(tmp) / "jwks.json"
+        jwks = {"keys": [{"kid": "kid-1", "kty": "oct", "alg": "HS256", "k": _b64url(secret.encode("utf-8"))}]}
+        jwks_path.write_text(json.dumps(jwks), encoding="utf-8")
+        # Backdate the file so the JWKS cache does not treat it as freshly modified.
+        os.utime(jwks_path, (time.time() - 3600, time.time() - 3600))
+        os.environ["NEWCLAW_IDP_JWKS_PATH"] = str(jwks_path)
+        reload_auth_settings()
+
+        scenarios = {
+            "local_bearer": [
+                (f"Bearer {issue_dev_jwt(f'user_{idx}', 'reviewer')}", None) for idx in range(args.tokens)
+            ],
+            "idp_sso": [(None, _idp_token(f"idp_{idx}", secret)) for idx in range(args.tokens)],
+        }
+        print(f"tokens={args.tokens} requests={args.requests}")
+        for name, tokens in scenarios.items():
+            calls = [tokens[idx % len(tokens)] for idx in range(args.requests)]
+            uncached = _throughput(calls, 0)
+            cached = _throughput(calls, 4096)
+            stats = TOKEN_CACHE.stats()
+            print(
+                f"{name:>12}: uncached={uncached:,.0f}/s cached={cached:,.0f}/s "
+                f"speedup={cached / uncached:.1f}x hit_rate={stats['hit_rate']} "
+                f"verify_seconds_avg={stats['verify_seconds_avg']}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
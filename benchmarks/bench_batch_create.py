@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def _item(idx: int) -> dict:
+    return {
+        "title": f"bench task {idx}",
+        "template_type": "meeting_summary",
+        "input": {
+            "meeting_title": f"회의 {idx}",
+            "meeting_date": "2026-03-02",
+            "participants": ["Kim", "Lee"],
+            "notes": "업무A 진행\n업무B 리스크",
+        },
+        "requested_by": "bench_user",
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Create tasks one request at a time vs one batch request")
+    parser.add_argument("--tasks", type=int, default=1000, help="tasks per mode (default: 1000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["NEWCLAW_DB_PATH"] = str(Path(tmp) / "batch.db")
+
+        from fastapi.testclient import TestClient
+
+        from app.auth import issue_dev_jwt
+        from app.main import APP
+
+        client = TestClient(APP)
+        headers = {"Authorization": f"Bearer {issue_dev_jwt('bench_user', 'requester')}"}
+
+        started = time.perf_counter()
+        for idx in range(args.tasks):
+            resp = client.post("/api/v1/task/create", json=_item(idx), headers=headers)
+            assert resp.status_code == 201, resp.text
+        single = time.perf_counter() - started
+
+        started = time.perf_counter()
+        resp = client.post(
+            "/api/v1/task/create/batch",
+            json={"items": [_item(idx) for idx in range(args.tasks)]},
+            headers=headers,
+        )
+        batch = time.perf_counter() - started
+        assert resp.status_code == 200 and resp.json()["created"] == args.tasks, resp.text
+
+    print(f"single requests: {args.tasks} tasks in {single:.2f}s ({single / args.tasks * 1000:.2f} ms/task)")
+    print(f"batch request:   {args.tasks} tasks in {batch:.2f}s ({batch / args.tasks * 1000:.3f} ms/task)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.persistence import SQLiteStateStore  # noqa: E402
+
+
+def _seed(db_path: str, count: int) -> list[str]:
+    store = SQLiteStateStore(db_path)
+    queue_ids = []
+    with store.transaction():
+        for idx in range(count):
+            task_id = f"task_bulk_{idx}"
+            queue_id = f"aq_bulk_{idx:06d}"
+            store.save_task(
+                {
+                    "task_id": task_id,
+                    "title": "bulk",
+                    "template_type": "meeting_summary",
+                    # A real input, so approved tasks can run the pipeline to DONE.
+                    "input": {
+                        "meeting_title": "bulk",
+                        "meeting_date": "2026-03-01",
+                        "participants": ["Ops"],
+                        "notes": "external send required",
+                    },
+                    "requested_by": "bench_user",
+                    "status": "NEEDS_HUMAN_APPROVAL",
+                    "current_stage": "approval",
+                    "next_action": "wait_for_approval",
+                    "retry_count": 0,
+                    "approved_reasons": [],
+                    "approval_reason": "external_send_requested",
+                    "last_error": None,
+                    "result": None,
+                    "started_at": "2026-03-01T00:00:00+00:00",
+                    "completed_at": None,
+                    "final_reason": None,
+                    "approval_queue_id": queue_id,
+                    "created_at": "2026-03-01T00:00:00+00:00",
+                    "updated_at": "2026-03-01T00:00:00+00:00",
+                }
+            )
+            store.save_approval(
+                {
+                    "queue_id": queue_id,
+                    "task_id": task_id,
+                    "request_id": f"req_{idx}",
+                    "reason_code": "external_send_requested",
+                    "reason_message": "approval required",
+                    "requested_by": "bench_user",
+                    "approver_group": "ops_team",
+                    "status": "PENDING",
+                    "created_at": "2026-03-01T00:00:00+00:00",
+                    "expires_at": None,
+                    "resolved_at": None,
+                }
+            )
+            queue_ids.append(queue_id)
+    store.conn.close()
+    return queue_ids
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Clear an approval backlog one call at a time vs one bulk call")
+    parser.add_argument("--items", type=int, default=5000, help="pending approvals per bulk call (default: 5000)")
+    parser.add_argument("--single", type=int, default=300, help="items cleared one call at a time (default: 300)")
+    parser.add_argument("--drain-timeout", type=float, default=600.0, help="max seconds to wait for approved runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bulk.db")
+        queue_ids = _seed(db_path, args.single + 2 * args.items)
+        os.environ["NEWCLAW_DB_PATH"] = db_path
+        os.environ.setdefault("NEWCLAW_REPORTS_ROOT", str(Path(tmp) / "reports"))
+
+        from fastapi.testclient import TestClient
+
+        from app import main as runtime
+        from app.auth import issue_dev_jwt
+        from app.main import APP
+
+        client = TestClient(APP)
+        headers = {"Authorization": f"Bearer {issue_dev_jwt('bench_approver', 'approver')}"}
+        body = {"acted_by": "bench_approver", "comment": "backlog cleanup"}
+
+        started = time.perf_counter()
+        for queue_id in queue_ids[: args.single]:
+            resp = client.post(f"/api/v1/approvals/{queue_id}/reject", json=body, headers=headers)
+            assert resp.status_code == 200, resp.text
+        single = time.perf_counter() - started
+
+        reject_ids = queue_ids[args.single : args.single + args.items]
+        started = time.perf_counter()
+        resp = client.post("/api/v1/approvals/bulk", json={**body, "queue_ids": reject_ids, "action": "REJECT"}, headers=headers)
+        bulk_reject = time.perf_counter() - started
+        assert resp.status_code == 200 and resp.json()["succeeded"] == args.items, resp.text
+
+        # Approving also hands every task to the scheduler, including more than its queue holds.
+        approve_ids = queue_ids[args.single + args.items :]
+        started = time.perf_counter()
+        resp = client.post("/api/v1/approvals/bulk", json={**body, "queue_ids": approve_ids, "action": "APPROVE"}, headers=headers)
+        bulk_approve = time.perf_counter() - started
+        assert resp.status_code == 200 and resp.json()["succeeded"] == args.items, resp.text
+
+        task_ids = [f"task_bulk_{int(queue_id.rsplit('_', 1)[1])}" for queue_id in approve_ids]
+        deadline = time.perf_counter() + args.drain_timeout
+        while time.perf_counter() < deadline:
+            if all(runtime.TASKS[task_id]["status"] != "RUNNING" for task_id in task_ids):
+                break
+            time.sleep(0.1)
+        drain = time.perf_counter() - started
+        done = sum(1 for task_id in task_ids if runtime.TASKS[task_id]["status"] == "DONE")
+
+    per_item = single / args.single
+    print(f"single calls:  {args.single} items in {single:.2f}s ({per_item * 1000:.2f} ms/item)")
+    print(f"  -> {args.items} items projected: {per_item * args.items:.1f}s")
+    print(f"bulk REJECT:   {args.items} items in {bulk_reject:.2f}s ({bulk_reject / args.items * 1000:.3f} ms/item)")
+    print(f"bulk APPROVE:  {args.items} items in {bulk_approve:.2f}s ({bulk_approve / args.items * 1000:.3f} ms/item)")
+    print(f"  -> pipeline runs finished: {done}/{args.items} DONE after {drain:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.main import _build_event_index  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare full-scan vs per-task index event lookups")
+    parser.add_argument("--events", type=int, default=1_000_000, help="total events in memory (default: 1000000)")
+    parser.add_argument("--events-per-task", type=int, default=12, help="events per task (default: 12)")
+    parser.add_argument("--lookups", type=int, default=50, help="random task lookups to time (default: 50)")
+    args = parser.parse_args()
+
+    tasks = max(args.events // args.events_per_task, 1)
+    events = [
+        {"event_id": f"evt_{idx}", "task_id": f"task_{idx % tasks}", "event_type": "STAGE_CHANGED"}
+        for idx in range(args.events)
+    ]
+    task_ids = [f"task_{random.randrange(tasks)}" for _ in range(args.lookups)]
+
+    started = time.perf_counter()
+    index = _build_event_index(events)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for task_id in task_ids:
+        [event for event in events if event.get("task_id") == task_id]
+    scan_seconds = (time.perf_counter() - started) / len(task_ids)
+
+    started = time.perf_counter()
+    for task_id in task_ids:
+        list(index.get(task_id, ()))
+    index_seconds = (time.perf_counter() - started) / len(task_ids)
+
+    print(f"events={args.events} tasks={tasks}")
+    print(f"index build: {build_seconds:.3f}s")
+    print(f"scan lookup:  {scan_seconds * 1000:.3f} ms/request")
+    print(f"index lookup: {index_seconds * 1000:.6f} ms/request")
+    print(f"speedup: {scan_seconds / index_seconds:.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
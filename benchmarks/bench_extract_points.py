@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.main import _extract_points, _render_meeting_summary  # noqa: E402
+
+
+def _split_extract(notes: str, limit: int = 5) -> list[str]:
+    # The previous implementation: normalise, split and strip every line, then slice.
+    raw_lines = notes.replace("\r", "\n").split("\n")
+    lines = [line.strip("-* \t") for line in raw_lines if line.strip()]
+    if not lines and notes.strip():
+        return [notes.strip()]
+    return lines[:limit]
+
+
+def _measure(fn, notes: str, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(notes)
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    fn(notes)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare split-based and streaming point extraction on large notes")
+    parser.add_argument("--notes-mb", type=float, default=10.0, help="size of the notes in MB (default: 10)")
+    parser.add_argument("--line-chars", type=int, default=80, help="characters per transcript line (default: 80)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    line = ("- " + "회의 발언 " * args.line_chars)[: args.line_chars] + "\r\n"
+    notes = line * max(int(args.notes_mb * 1024 * 1024 / len(line.encode("utf-8"))), 1)
+    payload = {"meeting_title": "대용량", "meeting_date": "2026-03-04", "participants": ["Kim"], "notes": notes}
+    assert _split_extract(notes) == _extract_points(notes)
+
+    print(f"notes_bytes={len(notes.encode('utf-8'))} lines={notes.count(chr(10))}")
+    for label, fn in (
+        ("split", _split_extract),
+        ("streaming", _extract_points),
+        ("render", lambda _: _render_meeting_summary(payload)),
+    ):
+        best, peak = _measure(fn, notes, args.repeat)
+        print(f"{label:>9}: best_sec={best:.5f} peak_alloc_mb={peak / 1024 / 1024:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.persistence import SQLiteStateStore  # noqa: E402
+
+# Runs in a fresh interpreter per sample so every number is a cold start.
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+import {module}
+result = {{"import_ms": (time.perf_counter() - started) * 1000}}
+if {module!r} == "app.main":
+    import app.main as main
+    started = time.perf_counter()
+    # Trees without init_runtime() open the store at import; then this measures nothing.
+    getattr(main, "init_runtime", lambda: None)()
+    result["init_runtime_ms"] = (time.perf_counter() - started) * 1000
+    from fastapi.testclient import TestClient
+    started = time.perf_counter()
+    TestClient(main.APP).get("/health")
+    result["first_request_ms"] = (time.perf_counter() - started) * 1000
+heavy = ("psycopg", "cryptography", "boto3")
+result["heavy_modules_loaded"] = sorted(name for name in heavy if name in sys.modules)
+print(json.dumps(result))
+"""
+
+
+def _seed(db_path: str, tasks: int, events_per_task: int) -> None:
+    store = SQLiteStateStore(db_path)
+    store.conn.executemany(
+        "INSERT INTO tasks(task_id, status, requested_by, updated_at, payload) VALUES(?,?,?,?,?)",
+        [
+            (f"task_{idx}", "DONE", "bench", "2026-03-01T00:00:00+00:00", f'{{"task_id":"task_{idx}","status":"DONE"}}')
+            for idx in range(tasks)
+        ],
+    )
+    store.conn.executemany(
+        "INSERT INTO events(event_id, task_id, event_type, created_at, payload, seq) VALUES(?,?,?,?,?,?)",
+        [
+            (
+                f"evt_{idx}_{seq}",
+                f"task_{idx}",
+                "STAGE_CHANGED",
+                "2026-03-01T00:00:00+00:00",
+                f'{{"event_id":"evt_{idx}_{seq}","task_id":"task_{idx}","seq":{idx * events_per_task + seq + 1}}}',
+                idx * events_per_task + seq + 1,
+            )
+            for idx in range(tasks)
+            for seq in range(events_per_task)
+        ],
+    )
+    store.conn.commit()
+    store.conn.close()
+
+
+def _sample(module: str, env: dict[str, str], cwd: str) -> dict[str, object]:
+    proc = subprocess.run(
+        [sys.executable, "-c", PROBE.format(root=str(ROOT), module=module)],
+        env=env,
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cold-start cost: module import vs runtime init vs first request")
+    parser.add_argument("--modules", default="app.main,app.auth,app.persistence,app.cli", help="modules to import")
+    parser.add_argument("--history", type=int, default=20000, help="DONE tasks in the seeded database (default: 20000)")
+    parser.add_argument("--events-per-task", type=int, default=10, help="events per seeded task (default: 10)")
+    parser.add_argument("--repeat", type=int, default=5, help="cold starts per module (default: 5)")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    args = parser.parse_args()
+
+    report: dict[str, dict[str, object]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "history.db")
+        _seed(db_path, args.history, args.events_per_task)
+        env = dict(
+            os.environ,
+            NEWCLAW_DB_BACKEND="sqlite",
+            NEWCLAW_DB_PATH=db_path,
+            NEWCLAW_REPORTS_ROOT=str(Path(tmp) / "reports"),
+        )
+
+        print(f"{'module':<16} {'import ms':>10} {'init ms':>9} {'1st req ms':>11}  heavy deps loaded")
+        for module in [item.strip() for item in args.modules.split(",") if item.strip()]:
+            samples = [_sample(module, env, tmp) for _ in range(args.repeat)]
+            summary: dict[str, object] = {}
+            for key in ("import_ms", "init_runtime_ms", "first_request_ms"):
+                values = [float(sample[key]) for sample in samples if key in sample]
+                if values:
+                    summary[key] = round(statistics.median(values), 2)
+            summary["heavy_modules_loaded"] = samples[-1]["heavy_modules_loaded"]
+            report[module] = summary
+            print(
+                f"{module:<16} {summary['import_ms']:>10.1f} {summary.get('init_runtime_ms', float('nan')):>9.1f} "
+                f"{summary.get('first_request_ms', float('nan')):>11.1f}  {summary['heavy_modules_loaded'] or '-'}"
+            )
+
+    if args.output:
+        meta = {"history": args.history, "events_per_task": args.events_per_task, "repeat": args.repeat}
+        args.output.write_text(json.dumps({"meta": meta, "results": report}, indent=2), encoding="utf-8")
+        print(f"wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+ENDPOINTS = ("create", "run", "status", "approve", "flow")
+TERMINAL = {"DONE", "NEEDS_HUMAN_APPROVAL"}
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    # Nearest-rank on an already sorted list.
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(pct / 100.0 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def _summarize(samples: list[float], errors: int, wall_seconds: float) -> dict[str, Any]:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "errors": errors,
+        "throughput_per_second": round(len(ordered) / wall_seconds, 2) if wall_seconds else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+        "p50_ms": round(_percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(_percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(_percentile(ordered, 99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+    }
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.samples: dict[str, list[float]] = {name: [] for name in ENDPOINTS}
+        self.errors: dict[str, int] = {name: 0 for name in ENDPOINTS}
+
+    def call(self, name: str, send: Any, expected: int) -> Any:
+        started = time.perf_counter()
+        resp = send()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            if resp.status_code == expected:
+                self.samples[name].append(elapsed)
+            else:
+                self.errors[name] += 1
+        if resp.status_code != expected:
+            raise RuntimeError(f"{name}: HTTP {resp.status_code} {resp.text[:200]}")
+        return resp.json()
+
+    def flow_done(self, elapsed: float | None) -> None:
+        with self._lock:
+            if elapsed is None:
+                self.errors["flow"] += 1
+            else:
+                self.samples["flow"].append(elapsed)
+
+
+def _run_flow(client: Any, recorder: _Recorder, headers: dict[str, dict[str, str]], idx: int, args: argparse.Namespace) -> None:
+    # create -> run -> status (until terminal) -> [approve -> status (until DONE)]
+    blocked = args.approval_every > 0 and idx % args.approval_every == 0
+    notes = "요약 결과를 외부 전송 해주세요" if blocked else f"업무{idx} 진행\n리스크 점검\n일정 공유"
+    started = time.perf_counter()
+    try:
+        created = recorder.call(
+            "create",
+            lambda: client.post(
+                "/api/v1/task/create",
+                json={
+                    "title": f"load {idx}",
+                    "template_type": "meeting_summary",
+                    "input": {
+                        "meeting_title": f"부하 측정 {idx}",
+                        "meeting_date": "2026-03-01",
+                        "participants": ["Kim", "Lee"],
+                        "notes": notes,
+                    },
+                    "requested_by": "bench_user",
+                },
+                headers=headers["requester"],
+            ),
+            201,
+        )
+        task_id = created["task_id"]
+        recorder.call(
+            "run",
+            lambda: client.post(
+                "/api/v1/task/run",
+                json={"task_id": task_id, "idempotency_key": f"load_{idx}", "run_mode": "standard"},
+                headers=headers["requester"],
+            ),
+            202,
+        )
+        status = _wait(client, recorder, headers, task_id, TERMINAL, args)
+        if status["status"] == "NEEDS_HUMAN_APPROVAL":
+            recorder.call(
+                "approve",
+                lambda: client.post(
+                    f"/api/v1/approvals/{status['approval_queue_id']}/approve",
+                    json={"acted_by": "bench_approver", "comment": "load"},
+                    headers=headers["approver"],
+                ),
+                200,
+            )
+            # The task was approved for its policy block, so it runs through to DONE.
+            status = _wait(client, recorder, headers, task_id, {"DONE"}, args)
+        if status["status"] != "DONE":
+            raise RuntimeError(f"flow ended in {status['status']}")
+    except Exception:
+        recorder.flow_done(None)
+        return
+    recorder.flow_done(time.perf_counter() - started)
+
+
+def _wait(
+    client: Any,
+    recorder: _Recorder,
+    headers: dict[str, dict[str, str]],
+    task_id: str,
+    expected: set[str],
+    args: argparse.Namespace,
+) -> dict[str, Any]:
+    deadline = time.monotonic() + args.flow_timeout
+    while True:
+        status = recorder.call(
+            "status", lambda: client.get(f"/api/v1/task/status/{task_id}", headers=headers["requester"]), 200
+        )
+        if status["status"] in expected:
+            return status
+        if time.monotonic() >= deadline:
+            raise RuntimeError(f"timed out waiting for {expected}: {status['status']}")
+        time.sleep(args.poll_interval)
+
+
+def _run_level(client: Any, headers: dict[str, dict[str, str]], concurrency: int, args: argparse.Namespace) -> dict[str, Any]:
+    recorder = _Recorder()
+    flows = max(args.flows, concurrency)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="load") as pool:
+        list(pool.map(lambda idx: _run_flow(client, recorder, headers, idx, args), range(flows)))
+    wall = time.perf_counter() - started
+    return {
+        "concurrency": concurrency,
+        "flows": flows,
+        "wall_seconds": round(wall, 3),
+        "endpoints": {
+            name: _summarize(recorder.samples[name], recorder.errors[name], wall)
+            for name in ENDPOINTS
+            if recorder.samples[name] or recorder.errors[name]
+        },
+    }
+
+
+def _child(args: argparse.Namespace) -> int:
+    # Runs inside a fresh interpreter whose environment already selects the store backend,
+    # since app.main reads its configuration at import time.
+    from app.auth import issue_dev_jwt
+
+    headers = {
+        "requester": {"Authorization": f"Bearer {issue_dev_jwt('bench_user', 'requester')}"},
+        "approver": {"Authorization": f"Bearer {issue_dev_jwt('bench_approver', 'approver')}"},
+    }
+    if args.base_url:
+        import httpx
+
+        client_cm: Any = httpx.Client(base_url=args.base_url, timeout=args.flow_timeout)
+    else:
+        from fastapi.testclient import TestClient
+
+        from app.main import APP
+
+        client_cm = TestClient(APP)
+
+    levels = []
+    with client_cm as client:
+        # Warm-up flows so imports, first connections and caches are not in the numbers.
+        _run_level(client, headers, 1, argparse.Namespace(**{**vars(args), "flows": args.warmup}))
+        for concurrency in args.concurrency:
+            levels.append(_run_level(client, headers, concurrency, args))
+    args.child.write_text(json.dumps(levels), encoding="utf-8")
+    return 0
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _run_backend(backend: str, args: argparse.Namespace, tmp: Path) -> list[dict[str, Any]] | None:
+    output = tmp / f"levels_{backend}.json"
+    env = dict(os.environ)
+    env["NEWCLAW_REPORTS_ROOT"] = str(tmp / f"reports_{backend}")
+    if backend == "sqlite":
+        env["NEWCLAW_DB_BACKEND"] = "sqlite"
+        env["NEWCLAW_DB_PATH"] = str(tmp / "load.db")
+    elif backend == "postgres":
+        if not args.postgres_dsn:
+            print("skip postgres: set --postgres-dsn or NEWCLAW_TEST_DATABASE_URL", file=sys.stderr)
+            return None
+        env["NEWCLAW_DB_BACKEND"] = "postgres"
+        env["NEWCLAW_DATABASE_URL"] = args.postgres_dsn
+    elif backend != "external":
+        raise SystemExit(f"unsupported backend: {backend}")
+    cmd = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--child",
+        str(output),
+        "--concurrency",
+        ",".join(str(level) for level in args.concurrency),
+        "--flows",
+        str(args.flows),
+        "--warmup",
+        str(args.warmup),
+        "--approval-every",
+        str(args.approval_every),
+        "--poll-interval",
+        str(args.poll_interval),
+        "--flow-timeout",
+        str(args.flow_timeout),
+    ]
+    if backend == "external":
+        cmd += ["--base-url", args.base_url]
+    proc = subprocess.run(cmd, env=env, cwd=str(tmp), capture_output=True, text=True)
+    if proc.returncode != 0:
+        print(f"{backend} run failed:\n{proc.stderr}", file=sys.stderr)
+        return None
+    return json.loads(output.read_text(encoding="utf-8"))
+
+
+def _print_results(results: list[dict[str, Any]]) -> None:
+    print(f"{'backend':>8} {'conc':>5} {'endpoint':>8} {'count':>6} {'err':>4} {'rps':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for result in results:
+        for level in result["levels"]:
+            for name, summary in level["endpoints"].items():
+                print(
+                    f"{result['backend']:>8} {level['concurrency']:>5} {name:>8} {summary['count']:>6} "
+                    f"{summary['errors']:>4} {summary['throughput_per_second']:>9.1f} {summary['p50_ms']:>8.2f} "
+                    f"{summary['p95_ms']:>8.2f} {summary['p99_ms']:>8.2f}"
+                )
+
+
+def _compare(results: list[dict[str, Any]], baseline_path: Path, max_regression: float, min_samples: int) -> int:
+    # Flags endpoints whose p95 grew, or throughput dropped, by more than max_regression.
+    # Endpoints with fewer than min_samples calls on either side are too noisy to judge.
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    previous = {
+        (result["backend"], level["concurrency"], name): summary
+        for result in baseline["results"]
+        for level in result["levels"]
+        for name, summary in level["endpoints"].items()
+    }
+    regressions = 0
+    print(f"\ncompared with {baseline_path} (commit {baseline.get('meta', {}).get('commit')})")
+    for result in results:
+        for level in result["levels"]:
+            for name, summary in level["endpoints"].items():
+                old = previous.get((result["backend"], level["concurrency"], name))
+                if not old or not old["p95_ms"] or not old["throughput_per_second"]:
+                    continue
+                if min(old["count"], summary["count"]) < min_samples:
+                    continue
+                p95_change = summary["p95_ms"] / old["p95_ms"] - 1
+                rps_change = summary["throughput_per_second"] / old["throughput_per_second"] - 1
+                flagged = p95_change > max_regression or -rps_change > max_regression
+                regressions += flagged
+                print(
+                    f"{'REGRESSION' if flagged else 'ok':>10} {result['backend']:>8} {level['concurrency']:>5} "
+                    f"{name:>8} p95 {p95_change:+.1%} rps {rps_change:+.1%}"
+                )
+    return 1 if regressions else 0
+
+
+def _levels(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="End-to-end create/run/status/approve load against the orchestrator API")
+    parser.add_argument("--backends", default="sqlite,postgres", help="comma separated: sqlite, postgres, external")
+    parser.add_argument("--concurrency", type=_levels, default=[1, 8, 32], help="comma separated levels (default: 1,8,32)")
+    parser.add_argument("--flows", type=int, default=200, help="flows per concurrency level (default: 200)")
+    parser.add_argument("--warmup", type=int, default=5, help="warm-up flows before measuring (default: 5)")
+    parser.add_argument("--approval-every", type=int, default=4, help="every Nth flow needs approval; 0 disables (default: 4)")
+    parser.add_argument("--poll-interval", type=float, default=0.005, help="status poll interval seconds (default: 0.005)")
+    parser.add_argument("--flow-timeout", type=float, default=30.0, help="per-flow wait limit seconds (default: 30)")
+    parser.add_argument("--postgres-dsn", default=os.getenv("NEWCLAW_TEST_DATABASE_URL", ""), help="postgres DSN")
+    parser.add_argument("--base-url", default="", help="server URL for the 'external' backend")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--compare", type=Path, help="baseline results JSON to diff against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="allowed p95/throughput change (default: 0.2)")
+    parser.add_argument("--min-samples", type=int, default=20, help="skip comparing smaller samples (default: 20)")
+    parser.add_argument("--child", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return _child(args)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in [item.strip() for item in args.backends.split(",") if item.strip()]:
+            levels = _run_backend(backend, args, Path(tmp))
+            if levels is not None:
+                results.append({"backend": backend, "levels": levels})
+    if not results:
+        print("no backend produced results", file=sys.stderr)
+        return 1
+
+    _print_results(results)
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "args": {
+                "concurrency": args.concurrency,
+                "flows": args.flows,
+                "approval_every": args.approval_every,
+                "poll_interval": args.poll_interval,
+            },
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"\nwrote {args.output}")
+    if args.compare:
+        return _compare(results, args.compare, args.max_regression, args.min_samples)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
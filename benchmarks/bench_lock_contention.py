@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Callable, ContextManager, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.locking import StripedLock  # noqa: E402
+
+
+def _global_holder() -> Callable[[str], ContextManager[None]]:
+    lock = Lock()
+
+    @contextmanager
+    def hold(_key: str) -> Iterator[None]:
+        with lock:
+            yield
+
+    return hold
+
+
+def _striped_holder(stripes: int) -> Callable[[str], ContextManager[None]]:
+    return StripedLock(stripes).hold
+
+
+def _run(hold: Callable[[str], ContextManager[None]], workers: int, ops: int, hold_seconds: float) -> float:
+    # Each worker drives its own task_id, mirroring pipeline threads working on unrelated tasks.
+    # The sleep inside the critical section stands in for the store commit done under the lock.
+    def worker(task_id: str) -> None:
+        for _ in range(ops):
+            with hold(task_id):
+                time.sleep(hold_seconds)
+
+    threads = [Thread(target=worker, args=(f"task_bench_{idx}",)) for idx in range(workers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return (workers * ops) / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare global lock vs striped task locks under contention")
+    parser.add_argument("--workers", default="1,2,4,8,16", help="comma separated worker counts (default: 1,2,4,8,16)")
+    parser.add_argument("--ops", type=int, default=200, help="critical sections per worker (default: 200)")
+    parser.add_argument("--hold-ms", type=float, default=1.0, help="simulated work inside the lock in ms (default: 1.0)")
+    parser.add_argument("--stripes", type=int, default=64, help="stripe count for the striped lock (default: 64)")
+    args = parser.parse_args()
+
+    worker_counts = [int(item) for item in args.workers.split(",") if item.strip()]
+    hold_seconds = args.hold_ms / 1000.0
+
+    print(f"{'workers':>8} {'global ops/s':>14} {'striped ops/s':>14} {'speedup':>8}")
+    for workers in worker_counts:
+        global_rate = _run(_global_holder(), workers, args.ops, hold_seconds)
+        striped_rate = _run(_striped_holder(args.stripes), workers, args.ops, hold_seconds)
+        print(f"{workers:>8} {global_rate:>14.1f} {striped_rate:>14.1f} {striped_rate / global_rate:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
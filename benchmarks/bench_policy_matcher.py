@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.policy import PolicyMatcher, PolicyRule  # noqa: E402
+
+
+def _naive_detect(rules: tuple[PolicyRule, ...], task_input: dict[str, str]) -> str | None:
+    # The previous implementation: one joined string, one substring search per pattern.
+    joined = " ".join(str(value) for value in task_input.values()).lower()
+    for rule in rules:
+        if any(pattern.lower() in joined for pattern in rule.patterns):
+            return rule.reason_code
+    return None
+
+
+def _build_rules(rng: random.Random, rule_count: int, patterns_per_rule: int) -> tuple[PolicyRule, ...]:
+    rules = []
+    for idx in range(rule_count):
+        patterns = tuple(
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(8, 16))) for _ in range(patterns_per_rule)
+        )
+        rules.append(PolicyRule(reason_code=f"rule_{idx}", patterns=patterns))
+    return tuple(rules)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare the compiled policy matcher with per-pattern substring search")
+    parser.add_argument("--rules", type=int, default=50)
+    parser.add_argument("--patterns-per-rule", type=int, default=100)
+    parser.add_argument("--notes-kb", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rules = _build_rules(rng, args.rules, args.patterns_per_rule)
+    words = ["회의", "결정", "action", "item", "owner", "deadline", "review", "내부", "공유"]
+    notes = " ".join(rng.choice(words) for _ in range(args.notes_kb * 1024 // 6))
+    task_input = {"meeting_title": "weekly sync", "meeting_notes": notes}
+
+    started = time.perf_counter()
+    matcher = PolicyMatcher(rules)
+    compile_sec = time.perf_counter() - started
+
+    results = {}
+    for label, detect in (
+        ("compiled", lambda: matcher.detect(task_input)),
+        ("naive", lambda: _naive_detect(rules, task_input)),
+    ):
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            outcome = detect()
+            best = min(best, time.perf_counter() - started)
+        results[label] = (best, outcome)
+
+    assert results["compiled"][1] == results["naive"][1]
+    print(f"patterns={matcher.pattern_count} notes_bytes={len(notes.encode())} compile_sec={compile_sec:.3f}")
+    for label, (best, outcome) in results.items():
+        print(f"{label:>8}: best_sec={best:.4f} result={outcome}")
+    print(f"speedup={results['naive'][0] / results['compiled'][0]:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
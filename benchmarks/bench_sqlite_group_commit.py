@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from threading import Thread
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.persistence import SQLiteStateStore  # noqa: E402
+
+
+def _run(db_path: str, *, group_commit: bool, writers: int, events: int, window_ms: float) -> float:
+    store = SQLiteStateStore(db_path, group_commit=group_commit, commit_window_ms=window_ms)
+
+    def writer(worker_id: int) -> None:
+        for idx in range(events):
+            store.save_event(
+                {
+                    "event_id": f"evt_{worker_id}_{idx}",
+                    "task_id": f"task_bench_{worker_id}",
+                    "event_type": "STAGE_CHANGED",
+                    "created_at": "2026-03-01T00:00:00+00:00",
+                    "stage": "executor",
+                }
+            )
+
+    threads = [Thread(target=writer, args=(worker_id,)) for worker_id in range(writers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    store.conn.close()
+    return (writers * events) / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure SQLite events/sec with and without group commit")
+    parser.add_argument("--writers", default="1,4,16", help="comma separated concurrent writer counts (default: 1,4,16)")
+    parser.add_argument("--events", type=int, default=200, help="events per writer (default: 200)")
+    parser.add_argument("--window-ms", type=float, default=0.0, help="group commit window in ms (default: 0.0)")
+    args = parser.parse_args()
+
+    print(f"{'writers':>8} {'per-write ev/s':>15} {'group ev/s':>12} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for writers in [int(item) for item in args.writers.split(",") if item.strip()]:
+            baseline = _run(
+                str(Path(tmp) / f"baseline_{writers}.db"),
+                group_commit=False,
+                writers=writers,
+                events=args.events,
+                window_ms=args.window_ms,
+            )
+            grouped = _run(
+                str(Path(tmp) / f"group_{writers}.db"),
+                group_commit=True,
+                writers=writers,
+                events=args.events,
+                window_ms=args.window_ms,
+            )
+            print(f"{writers:>8} {baseline:>15.1f} {grouped:>12.1f} {grouped / baseline:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.persistence import SQLiteStateStore  # noqa: E402
+
+
+def _populate(store: SQLiteStateStore, done_tasks: int, active_tasks: int, events_per_task: int) -> None:
+    # Bulk insert through the connection directly; this measures hydration, not writes.
+    rows_tasks = []
+    rows_events = []
+    for idx in range(done_tasks + active_tasks):
+        task_id = f"task_hydrate_{idx}"
+        status = "DONE" if idx < done_tasks else "RUNNING"
+        rows_tasks.append((task_id, status, "bench", "2026-03-01T00:00:00+00:00", f'{{"task_id":"{task_id}","status":"{status}"}}'))
+        for seq in range(events_per_task):
+            event_id = f"evt_{idx}_{seq}"
+            rows_events.append(
+                (
+                    event_id,
+                    task_id,
+                    "STAGE_CHANGED",
+                    "2026-03-01T00:00:00+00:00",
+                    f'{{"event_id":"{event_id}","task_id":"{task_id}","event_type":"STAGE_CHANGED"}}',
+                )
+            )
+    store.conn.executemany(
+        "INSERT INTO tasks(task_id, status, requested_by, updated_at, payload) VALUES(?,?,?,?,?)", rows_tasks
+    )
+    store.conn.executemany(
+        "INSERT INTO events(event_id, task_id, event_type, created_at, payload) VALUES(?,?,?,?,?)", rows_events
+    )
+    store.conn.commit()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare eager load_state vs lazy load_active_state as history grows")
+    parser.add_argument("--history", default="1000,10000,50000", help="comma separated DONE task counts")
+    parser.add_argument("--active", type=int, default=100, help="non-terminal tasks (default: 100)")
+    parser.add_argument("--events-per-task", type=int, default=12, help="events per task (default: 12)")
+    args = parser.parse_args()
+
+    print(f"{'done tasks':>10} {'eager s':>9} {'lazy s':>9} {'lazy tasks':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for done_tasks in [int(item) for item in args.history.split(",") if item.strip()]:
+            store = SQLiteStateStore(str(Path(tmp) / f"hydrate_{done_tasks}.db"))
+            _populate(store, done_tasks, args.active, args.events_per_task)
+
+            started = time.perf_counter()
+            store.load_state()
+            eager = time.perf_counter() - started
+
+            started = time.perf_counter()
+            tasks, _, _, _, _ = store.load_active_state()
+            lazy = time.perf_counter() - started
+            print(f"{done_tasks:>10} {eager:>9.3f} {lazy:>9.3f} {len(tasks):>11}")
+            store.conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.persistence import SQLiteStateStore, StateStore  # noqa: E402
+
+# Task payload shaped like the ones app.main persists, so JSON encode/decode cost is realistic.
+TASK_INPUT = {
+    "meeting_title": "주간 운영회의",
+    "meeting_date": "2026-03-01",
+    "participants": ["Kim", "Lee", "Park"],
+    "notes": "업무A 진행\n업무B 리스크\n업무C 일정",
+}
+
+
+def _task(task_id: str, status: str) -> dict[str, Any]:
+    return {
+        "task_id": task_id,
+        "title": "store bench",
+        "template_type": "meeting_summary",
+        "input": TASK_INPUT,
+        "requested_by": "bench_user",
+        "status": status,
+        "current_stage": "reporter" if status == "DONE" else "executor",
+        "retry_count": 0,
+        "created_at": "2026-03-01T00:00:00+00:00",
+        "updated_at": "2026-03-01T00:00:00+00:00",
+    }
+
+
+def _event(event_id: str, task_id: str, seq: int) -> dict[str, Any]:
+    return {
+        "event_id": event_id,
+        "task_id": task_id,
+        "event_type": "STAGE_CHANGED",
+        "created_at": "2026-03-01T00:00:00+00:00",
+        "stage": "executor",
+        "seq": seq,
+    }
+
+
+class _Seq:
+    # Event seqs continue from whatever the store already holds, like app.main's EVENT_SEQ.
+    def __init__(self, store: StateStore) -> None:
+        self._lock = threading.Lock()
+        self._next = store.max_event_seq() + 1
+
+    def take(self, count: int = 1) -> int:
+        with self._lock:
+            start = self._next
+            self._next += count
+            return start
+
+
+def _make_factory(backend: str, tmp: Path, args: argparse.Namespace) -> Callable[[str], StateStore] | None:
+    # Each factory call opens a store on fresh storage named by the argument.
+    if backend == "sqlite":
+        return lambda name: SQLiteStateStore(str(tmp / f"{name}.db"))
+    if backend == "sqlite-group":
+        return lambda name: SQLiteStateStore(str(tmp / f"{name}.db"), group_commit=True)
+    if backend == "postgres":
+        if not args.postgres_dsn:
+            print("skip postgres: set --postgres-dsn or NEWCLAW_TEST_DATABASE_URL", file=sys.stderr)
+            return None
+        from app.persistence import PostgresStateStore
+
+        # Shares one database; load_state numbers include rows already there (reported as baseline).
+        return lambda name: PostgresStateStore(args.postgres_dsn, pool_max_size=max(args.writers))
+    if ":" in backend:
+        # "package.module:callable" taking a name, for evaluating a new backend.
+        module_name, _, attr = backend.partition(":")
+        return getattr(importlib.import_module(module_name), attr)
+    raise SystemExit(f"unsupported backend: {backend}")
+
+
+def _close(store: StateStore) -> None:
+    conn = getattr(store, "conn", None)
+    if conn is not None:
+        conn.close()
+    pool = getattr(store, "pool", None)
+    if pool is not None:
+        pool.close()
+
+
+def _bench_writes(store: StateStore, run_id: str, count: int, batch: int) -> dict[str, float]:
+    seqs = _Seq(store)
+    results: dict[str, float] = {}
+
+    started = time.perf_counter()
+    for idx in range(count):
+        store.save_task(_task(f"task_w_{run_id}_{idx}", "RUNNING"))
+    results["save_task_per_second"] = count / (time.perf_counter() - started)
+
+    task_id = f"task_w_{run_id}_0"
+    started = time.perf_counter()
+    for idx in range(count):
+        store.save_event(_event(f"evt_w_{run_id}_{idx}", task_id, seqs.take()))
+    results["save_event_per_second"] = count / (time.perf_counter() - started)
+
+    # Same rows committed `batch` at a time, the way bulk endpoints write.
+    started = time.perf_counter()
+    for offset in range(0, count, batch):
+        with store.transaction():
+            for idx in range(offset, min(offset + batch, count)):
+                store.save_event(_event(f"evt_wb_{run_id}_{idx}", task_id, seqs.take()))
+    results["save_event_batched_per_second"] = count / (time.perf_counter() - started)
+    return results
+
+
+def _populate(store: StateStore, run_id: str, start: int, stop: int, events_per_task: int, batch: int) -> None:
+    # Rows [start, stop) where a "row" is one event; every task gets events_per_task events
+    # and nine in ten tasks are DONE, so load_active_state has history to skip.
+    seqs = _Seq(store)
+    for offset in range(start, stop, batch):
+        end = min(offset + batch, stop)
+        with store.transaction():
+            for row in range(offset, end):
+                task_no, event_no = divmod(row, events_per_task)
+                task_id = f"task_l_{run_id}_{task_no}"
+                if event_no == 0:
+                    store.save_task(_task(task_id, "RUNNING" if task_no % 10 == 0 else "DONE"))
+                store.save_event(_event(f"evt_l_{run_id}_{row}", task_id, seqs.take()))
+
+
+def _bench_load(
+    store: StateStore, run_id: str, sizes: list[int], events_per_task: int, batch: int
+) -> list[dict[str, Any]]:
+    baseline = len(store.load_state()[1])
+    results = []
+    loaded = 0
+    for size in sizes:
+        started = time.perf_counter()
+        _populate(store, run_id, loaded, size, events_per_task, batch)
+        populate = time.perf_counter() - started
+        loaded = size
+
+        started = time.perf_counter()
+        tasks, events, _, _, _ = store.load_state()
+        load_state = time.perf_counter() - started
+
+        started = time.perf_counter()
+        active_tasks, _, _, _, _ = store.load_active_state()
+        load_active = time.perf_counter() - started
+        results.append(
+            {
+                "rows": size,
+                "baseline_rows": baseline,
+                "populate_seconds": round(populate, 3),
+                "load_state_seconds": round(load_state, 3),
+                "load_active_state_seconds": round(load_active, 3),
+                "tasks": len(tasks),
+                "active_tasks": len(active_tasks),
+                "events": len(events),
+            }
+        )
+        del tasks, events, active_tasks
+        print(
+            f"  rows {size:>9}: populate {populate:8.2f}s  load_state {load_state:7.3f}s"
+            f"  load_active_state {load_active:7.3f}s"
+        )
+    return results
+
+
+def _bench_writers(store: StateStore, run_id: str, writers: list[int], per_writer: int) -> list[dict[str, Any]]:
+    # Each writer commits one event per call, like independent pipeline workers.
+    seqs = _Seq(store)
+    results = []
+    single = None
+    for count in writers:
+        def writer(offset: int) -> None:
+            task_id = f"task_c_{run_id}_{count}_{offset}"
+            for idx in range(per_writer):
+                store.save_event(_event(f"evt_c_{run_id}_{count}_{offset}_{idx}", task_id, seqs.take()))
+
+        threads = [threading.Thread(target=writer, args=(offset,)) for offset in range(count)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        rate = count * per_writer / (time.perf_counter() - started)
+        single = single or rate
+        results.append({"writers": count, "events_per_second": round(rate, 1), "scaling": round(rate / single, 2)})
+        print(f"  writers {count:>3}: {rate:10.0f} events/s  x{rate / single:.2f}")
+    return results
+
+
+def _levels(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run one write/load/concurrency benchmark against StateStore backends")
+    parser.add_argument(
+        "--backends",
+        default="sqlite,sqlite-group,postgres",
+        help="comma separated: sqlite, sqlite-group, postgres, or package.module:factory(name)",
+    )
+    parser.add_argument("--writes", type=int, default=2000, help="rows per write benchmark (default: 2000)")
+    parser.add_argument("--batch", type=int, default=500, help="rows per transaction when batching (default: 500)")
+    parser.add_argument(
+        "--rows", type=_levels, default=[10_000, 100_000, 1_000_000], help="load_state sizes (default: 10000,100000,1000000)"
+    )
+    parser.add_argument("--events-per-task", type=int, default=10, help="events per task when loading (default: 10)")
+    parser.add_argument("--writers", type=_levels, default=[1, 2, 4, 8], help="concurrent writer counts (default: 1,2,4,8)")
+    parser.add_argument("--per-writer", type=int, default=500, help="events per concurrent writer (default: 500)")
+    parser.add_argument("--postgres-dsn", default=os.getenv("NEWCLAW_TEST_DATABASE_URL", ""), help="postgres DSN")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    args = parser.parse_args()
+
+    report: dict[str, Any] = {}
+    run_id = f"{int(time.time())}"
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in [item.strip() for item in args.backends.split(",") if item.strip()]:
+            factory = _make_factory(backend, Path(tmp), args)
+            if factory is None:
+                continue
+            print(f"{backend}")
+            result: dict[str, Any] = {}
+
+            store = factory(f"{backend}_writes")
+            writes = _bench_writes(store, run_id, args.writes, args.batch)
+            result["writes"] = {name: round(value, 1) for name, value in writes.items()}
+            for name, value in result["writes"].items():
+                print(f"  {name:<30} {value:10.0f}")
+            _close(store)
+
+            store = factory(f"{backend}_load")
+            result["load"] = _bench_load(store, run_id, sorted(args.rows), args.events_per_task, args.batch)
+            _close(store)
+
+            store = factory(f"{backend}_writers")
+            result["writers"] = _bench_writers(store, run_id, args.writers, args.per_writer)
+            _close(store)
+            report[backend] = result
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
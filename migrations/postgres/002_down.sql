@@ -0,0 +1,3 @@
+BEGIN;
+DROP INDEX IF EXISTS idx_tasks_status;
+COMMIT;
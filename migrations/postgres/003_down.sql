@@ -0,0 +1,4 @@
+BEGIN;
+DROP INDEX IF EXISTS idx_events_task_seq;
+ALTER TABLE events DROP COLUMN IF EXISTS seq;
+COMMIT;
@@ -0,0 +1,20 @@
+BEGIN;
+
+ALTER TABLE events ADD COLUMN IF NOT EXISTS seq BIGINT;
+
+WITH numbered AS (
+    SELECT
+        event_id,
+        (SELECT COALESCE(MAX(seq), 0) FROM events) + ROW_NUMBER() OVER (ORDER BY created_at, event_id) AS seq
+    FROM events
+    WHERE seq IS NULL
+)
+UPDATE events
+SET seq = numbered.seq,
+    payload = jsonb_set(events.payload::jsonb, '{seq}', to_jsonb(numbered.seq))::text
+FROM numbered
+WHERE events.event_id = numbered.event_id;
+
+CREATE INDEX IF NOT EXISTS idx_events_task_seq ON events(task_id, seq);
+
+COMMIT;
@@ -0,0 +1,20 @@
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS audit_counters (
+    name TEXT PRIMARY KEY,
+    value BIGINT NOT NULL
+);
+
+INSERT INTO audit_counters(name, value)
+SELECT 'events', COUNT(*) FROM events WHERE true
+ON CONFLICT(name) DO NOTHING;
+
+INSERT INTO audit_counters(name, value)
+SELECT 'events:' || event_type, COUNT(*) FROM events WHERE true GROUP BY event_type
+ON CONFLICT(name) DO NOTHING;
+
+INSERT INTO audit_counters(name, value)
+SELECT 'approvals:' || status, COUNT(*) FROM approvals WHERE true GROUP BY status
+ON CONFLICT(name) DO NOTHING;
+
+COMMIT;
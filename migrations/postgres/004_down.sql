@@ -0,0 +1,3 @@
+BEGIN;
+DROP TABLE IF EXISTS audit_counters;
+COMMIT;
@@ -0,0 +1,7 @@
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_approvals_status_group_page ON approvals(status, approver_group, updated_at, queue_id);
+-- Superseded: the new index has the same leading columns.
+DROP INDEX IF EXISTS idx_approvals_status_group;
+
+COMMIT;
@@ -0,0 +1,4 @@
+BEGIN;
+CREATE INDEX IF NOT EXISTS idx_approvals_status_group ON approvals(status, approver_group);
+DROP INDEX IF EXISTS idx_approvals_status_group_page;
+COMMIT;
@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+CREATE INDEX IF NOT EXISTS idx_events_task_created ON events(task_id, created_at);
@@ -0,0 +1,16 @@
+ALTER TABLE events ADD COLUMN seq BIGINT;
+
+WITH numbered AS (
+    SELECT
+        event_id,
+        (SELECT COALESCE(MAX(seq), 0) FROM events) + ROW_NUMBER() OVER (ORDER BY created_at, rowid) AS seq
+    FROM events
+    WHERE seq IS NULL
+)
+UPDATE events
+SET seq = numbered.seq,
+    payload = json_set(events.payload, '$.seq', numbered.seq)
+FROM numbered
+WHERE events.event_id = numbered.event_id;
+
+CREATE INDEX IF NOT EXISTS idx_events_task_seq ON events(task_id, seq);
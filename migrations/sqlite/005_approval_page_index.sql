@@ -0,0 +1 @@
+CREATE INDEX IF NOT EXISTS idx_approvals_status_group_page ON approvals(status, approver_group, updated_at, queue_id);
@@ -16,10 +16,14 @@ fi
 
 case "$ACTION" in
   up)
-    psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f migrations/postgres/001_init.sql
+    for migration in $(ls migrations/postgres/[0-9][0-9][0-9]_*.sql | grep -v '_down\.sql$' | sort); do
+      psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f "$migration"
+    done
     ;;
   down)
-    psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f migrations/postgres/001_down.sql
+    for migration in $(ls migrations/postgres/[0-9][0-9][0-9]_down.sql | sort -r); do
+      psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f "$migration"
+    done
     ;;
   *)
     echo "Usage: $0 [up|down] [database_url]"
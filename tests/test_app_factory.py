@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Fresh interpreter, so modules other tests already imported do not hide import-time work.
+PROBE = """
+import json, sys
+sys.path.insert(0, {root!r})
+import app.main as main
+state = {{"ready_after_import": main._RUNTIME_READY}}
+state["heavy_modules"] = sorted(name for name in ("psycopg", "cryptography", "boto3") if name in sys.modules)
+state["db_after_import"] = __import__("os").path.exists({db!r})
+from fastapi.testclient import TestClient
+with TestClient(main.create_app()) as client:
+    state["ready_after_startup"] = main._RUNTIME_READY
+    state["health"] = client.get("/health").status_code
+state["db_after_startup"] = __import__("os").path.exists({db!r})
+print(json.dumps(state))
+"""
+
+# Without lifespan the first request initializes the runtime; that must not block the loop.
+LAZY_PROBE = """
+import asyncio, json, sys
+sys.path.insert(0, {root!r})
+import app.main as main
+state = {{}}
+real_init = main.init_runtime
+
+def probe_init():
+    try:
+        asyncio.get_running_loop()
+        state["init_on_event_loop"] = True
+    except RuntimeError:
+        state["init_on_event_loop"] = False
+    real_init()
+
+main.init_runtime = probe_init
+from fastapi.testclient import TestClient
+client = TestClient(main.create_app())
+state["health"] = client.get("/health").status_code
+state["ready_after_request"] = main._RUNTIME_READY
+print(json.dumps(state))
+"""
+
+
+class TestAppFactory(unittest.TestCase):
+    def _run_probe(self, probe: str) -> dict:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = str(Path(tmp) / "state.db")
+            env = dict(
+                os.environ,
+                NEWCLAW_DB_BACKEND="sqlite",
+                NEWCLAW_DB_PATH=db_path,
+                NEWCLAW_REPORTS_ROOT=str(Path(tmp) / "reports"),
+            )
+            proc = subprocess.run(
+                [sys.executable, "-c", probe.format(root=str(ROOT), db=db_path)],
+                env=env,
+                cwd=tmp,
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            return json.loads(proc.stdout.strip().splitlines()[-1])
+
+    def test_import_defers_store_and_heavy_dependencies(self) -> None:
+        state = self._run_probe(PROBE)
+
+        self.assertFalse(state["ready_after_import"])
+        self.assertFalse(state["db_after_import"])
+        self.assertEqual(state["heavy_modules"], [])
+        self.assertTrue(state["ready_after_startup"])
+        self.assertEqual(state["health"], 200)
+        self.assertTrue(state["db_after_startup"])
+
+    def test_first_request_initializes_runtime_off_the_event_loop(self) -> None:
+        state = self._run_probe(LAZY_PROBE)
+        self.assertEqual(state["health"], 200)
+        self.assertTrue(state["ready_after_request"])
+        self.assertFalse(state["init_on_event_loop"])
+
+    def test_runtime_names_resolve_on_first_access(self) -> None:
+        import app.main as main
+
+        self.assertIsInstance(main.TASKS, dict)
+        self.assertTrue(main._RUNTIME_READY)
+        with self.assertRaises(AttributeError):
+            getattr(main, "NOT_A_RUNTIME_NAME")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.approval_index import ApprovalIndex, approval_page_key
+from app.persistence import SQLiteStateStore
+
+
+def _approval(queue_id: str, status: str, group: str, created_at: str, resolved_at: str | None = None) -> dict:
+    return {
+        "queue_id": queue_id,
+        "task_id": f"task_{queue_id}",
+        "status": status,
+        "approver_group": group,
+        "created_at": created_at,
+        "resolved_at": resolved_at,
+    }
+
+
+def _seed() -> list[dict]:
+    return [
+        _approval("aq_3", "PENDING", "ops_team", "2026-03-01T00:00:03+00:00"),
+        _approval("aq_1", "PENDING", "ops_team", "2026-03-01T00:00:01+00:00"),
+        _approval("aq_2", "PENDING", "legal", "2026-03-01T00:00:02+00:00"),
+        _approval("aq_0", "REJECTED", "ops_team", "2026-03-01T00:00:00+00:00", "2026-03-01T00:00:05+00:00"),
+    ]
+
+
+class TestApprovalIndex(unittest.TestCase):
+    def test_filters_and_keyset_pages(self) -> None:
+        index = ApprovalIndex(_seed())
+        self.assertEqual(index.page("PENDING", None), ["aq_1", "aq_2", "aq_3"])
+        self.assertEqual(index.page("PENDING", "ops_team"), ["aq_1", "aq_3"])
+        self.assertEqual(index.page(None, "ops_team"), ["aq_1", "aq_3", "aq_0"])
+
+        first = index.page("PENDING", None, limit=2)
+        self.assertEqual(first, ["aq_1", "aq_2"])
+        after = approval_page_key(_seed()[2])
+        self.assertEqual(index.page("PENDING", None, after=after, limit=2), ["aq_3"])
+
+    def test_status_change_moves_item_between_buckets(self) -> None:
+        items = _seed()
+        index = ApprovalIndex(items)
+        resolved = dict(items[1], status="APPROVED", resolved_at="2026-03-01T00:00:09+00:00")
+        index.update(resolved)
+        index.update(resolved)
+        self.assertEqual(index.page("PENDING", "ops_team"), ["aq_3"])
+        self.assertEqual(index.page("APPROVED", None), ["aq_1"])
+        self.assertEqual(len(index), 4)
+
+    def test_remove_drops_item_and_empty_bucket(self) -> None:
+        index = ApprovalIndex(_seed())
+        index.remove("aq_2")
+        index.remove("aq_2")
+        self.assertEqual(index.page("PENDING", None), ["aq_1", "aq_3"])
+        self.assertEqual(index.page(None, "legal"), [])
+        self.assertEqual(len(index), 3)
+
+    def test_store_pages_in_the_same_order(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        store = SQLiteStateStore(str(Path(tmp.name) / "state.db"))
+        for item in _seed():
+            store.save_approval(item)
+
+        index = ApprovalIndex(_seed())
+        for status, group in (("PENDING", None), (None, "ops_team"), (None, None)):
+            stored = [item["queue_id"] for item in store.list_approvals(status, group)]
+            self.assertEqual(stored, index.page(status, group))
+
+        after = ("2026-03-01T00:00:01+00:00", "aq_1")
+        page = store.list_approvals("PENDING", None, after=after, limit=1)
+        self.assertEqual([item["queue_id"] for item in page], ["aq_2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
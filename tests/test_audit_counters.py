@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from app.audit_counters import AuditCounters, approval_deltas, event_deltas
+from app.persistence import SQLiteStateStore
+
+
+def _event(event_id: str, event_type: str, seq: int) -> dict:
+    return {
+        "event_id": event_id,
+        "task_id": "task_a",
+        "event_type": event_type,
+        "created_at": "2026-03-01T00:00:00+00:00",
+        "seq": seq,
+    }
+
+
+def _approval(queue_id: str, status: str) -> dict:
+    return {
+        "queue_id": queue_id,
+        "task_id": "task_a",
+        "status": status,
+        "approver_group": "ops_team",
+        "created_at": "2026-03-01T00:00:00+00:00",
+        "resolved_at": None,
+    }
+
+
+class TestAuditCounters(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = Path(tmp.name) / "state.db"
+
+    def test_deltas_follow_events_and_approval_moves(self) -> None:
+        self.assertEqual(event_deltas("BLOCKED_POLICY"), {"events": 1, "events:BLOCKED_POLICY": 1})
+        self.assertEqual(approval_deltas(None, "PENDING"), {"approvals:PENDING": 1})
+        self.assertEqual(
+            approval_deltas("PENDING", "APPROVED"), {"approvals:APPROVED": 1, "approvals:PENDING": -1}
+        )
+        self.assertEqual(approval_deltas("PENDING", "PENDING"), {})
+
+        counters = AuditCounters({"events": 5, "approvals:PENDING": 2})
+        counters.apply(event_deltas("BLOCKED_POLICY"))
+        counters.apply(approval_deltas("PENDING", "REJECTED"))
+        counters.apply({})
+        self.assertEqual(
+            counters.snapshot(),
+            {"events": 6, "events:BLOCKED_POLICY": 1, "approvals:PENDING": 1, "approvals:REJECTED": 1},
+        )
+        self.assertEqual(counters.stats()["applied"], 2)
+
+    def test_counters_commit_with_their_writes_and_survive_a_crash(self) -> None:
+        store = SQLiteStateStore(str(self.db_path), group_commit=True)
+        with store.transaction():
+            store.save_event(_event("evt_1", "BLOCKED_POLICY", 1))
+            store.add_audit_counters(event_deltas("BLOCKED_POLICY"))
+            store.save_approval(_approval("aq_1", "PENDING"))
+            store.add_audit_counters(approval_deltas(None, "PENDING"))
+        with self.assertRaises(RuntimeError):
+            with store.transaction():
+                store.save_event(_event("evt_2", "BLOCKED_POLICY", 2))
+                store.add_audit_counters(event_deltas("BLOCKED_POLICY"))
+                raise RuntimeError("handler failed")
+
+        # No shutdown hook runs: whatever committed is already counted.
+        reopened = SQLiteStateStore(str(self.db_path))
+        expected = {"events": 1, "events:BLOCKED_POLICY": 1, "approvals:PENDING": 1}
+        self.assertEqual(reopened.load_audit_counters(), expected)
+        self.assertEqual(AuditCounters(reopened.load_audit_counters()).snapshot(), expected)
+
+    def test_existing_history_is_counted_once(self) -> None:
+        store = SQLiteStateStore(str(self.db_path))
+        store.save_event(_event("evt_1", "BLOCKED_POLICY", 1))
+        store.save_approval(_approval("aq_1", "REJECTED"))
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("DELETE FROM audit_counters")
+        conn.commit()
+        conn.close()
+
+        counters = SQLiteStateStore(str(self.db_path)).load_audit_counters()
+        self.assertEqual(counters, {"events": 1, "events:BLOCKED_POLICY": 1, "approvals:REJECTED": 1})
+        self.assertEqual(SQLiteStateStore(str(self.db_path)).load_audit_counters(), counters)
+
+    def test_concurrent_startup_seeds_once(self) -> None:
+        store = SQLiteStateStore(str(self.db_path))
+        for idx in range(5):
+            store.save_event(_event(f"evt_{idx}", "STATUS_CHANGED", idx + 1))
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("DELETE FROM audit_counters")
+        conn.commit()
+        conn.close()
+
+        errors: list[BaseException] = []
+
+        def open_store() -> None:
+            try:
+                SQLiteStateStore(str(self.db_path))
+            except BaseException as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=open_store) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(store.load_audit_counters(), {"events": 5, "events:STATUS_CHANGED": 5})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,7 +10,15 @@ import time
 import unittest
 
 try:
-    from app.auth import issue_dev_jwt, resolve_actor_context
+    from app.auth import (
+        _JWKS_CACHE,
+        TOKEN_CACHE,
+        ActorContext,
+        TokenCache,
+        issue_dev_jwt,
+        reload_auth_settings,
+        resolve_actor_context,
+    )
 except Exception as exc:  # pragma: no cover - environment dependent
     issue_dev_jwt = None
     resolve_actor_context = None
@@ -39,6 +47,7 @@ class TestAuthIdP(unittest.TestCase):
     def tearDown(self) -> None:
         os.environ.clear()
         os.environ.update(self._env)
+        reload_auth_settings()
 
     def test_idp_token_via_sso_header(self) -> None:
         secret = "idp-shared-secret"
@@ -72,6 +81,7 @@ class TestAuthIdP(unittest.TestCase):
         os.environ["NEWCLAW_IDP_JWKS_PATH"] = jwks_path
         os.environ["NEWCLAW_IDP_ISSUER"] = "https://idp.example"
         os.environ["NEWCLAW_IDP_AUDIENCE"] = "new_claw"
+        reload_auth_settings()
 
         actor = resolve_actor_context(None, None, None, None, None, token)
         self.assertEqual(actor.actor_id, "idp_user")
@@ -89,6 +99,7 @@ class TestAuthIdP(unittest.TestCase):
     def test_idp_mode_rejects_header_only_auth(self) -> None:
         os.environ["NEWCLAW_AUTH_MODE"] = "idp"
         os.environ["NEWCLAW_ALLOW_COMPAT_HEADERS"] = "1"
+        reload_auth_settings()
 
         with self.assertRaises(Exception) as ctx:
             resolve_actor_context(None, "user1", "requester", None, None, None)
@@ -112,6 +123,7 @@ class TestAuthIdP(unittest.TestCase):
         os.environ["NEWCLAW_IDP_JWKS_PATH"] = jwks_path
         os.environ["NEWCLAW_IDP_ISSUER"] = "https://idp.example"
         os.environ["NEWCLAW_IDP_AUDIENCE"] = "new_claw"
+        reload_auth_settings()
 
         token_new = _sign_hs256(
             {"alg": "HS256", "typ": "JWT", "kid": "kid-new"},
@@ -146,6 +158,7 @@ class TestAuthIdP(unittest.TestCase):
         os.environ["NEWCLAW_IDP_JWKS_PATH"] = jwks_path
         os.environ["NEWCLAW_IDP_ISSUER"] = "https://idp.example"
         os.environ["NEWCLAW_IDP_AUDIENCE"] = "new_claw"
+        reload_auth_settings()
 
         token_old = _sign_hs256(
             {"alg": "HS256", "typ": "JWT", "kid": "kid-old"},
@@ -191,5 +204,113 @@ class TestAuthIdP(unittest.TestCase):
         self.assertEqual(actor_after_rotation.source, "idp")
 
 
+    def _idp_token(self, kid: str, secret: str) -> str:
+        return _sign_hs256(
+            {"alg": "HS256", "typ": "JWT", "kid": kid},
+            {"sub": f"user_{kid}", "role": "reviewer", "exp": int(time.time()) + 600},
+            secret,
+        )
+
+    def _write_jwks(self, path: str, kid: str, secret: str, mtime_ns: int) -> None:
+        jwks = {"keys": [{"kid": kid, "kty": "oct", "alg": "HS256", "k": _b64url(secret.encode("utf-8"))}]}
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(json.dumps(jwks))
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_jwks_parse_is_cached_until_the_file_changes(self) -> None:
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as fh:
+            jwks_path = fh.name
+        self.addCleanup(lambda: os.path.exists(jwks_path) and os.unlink(jwks_path))
+        os.environ["NEWCLAW_IDP_JWKS_PATH"] = jwks_path
+        reload_auth_settings()
+        old_mtime = time.time_ns() - 3600 * 1_000_000_000
+        self._write_jwks(jwks_path, "kid-a", "secret-aaaa", old_mtime)
+
+        resolve_actor_context(None, None, None, None, None, self._idp_token("kid-a", "secret-aaaa"))
+        entry = _JWKS_CACHE[jwks_path]
+        resolve_actor_context(None, None, None, None, None, self._idp_token("kid-a", "secret-aaaa"))
+        self.assertIs(_JWKS_CACHE[jwks_path], entry)
+        self.assertEqual(list(entry.prepared), [(0, "HS256")])
+
+        # Same size, new mtime: re-parsed, and the rotated-out key stops verifying.
+        self._write_jwks(jwks_path, "kid-b", "secret-bbbb", old_mtime + 1_000_000_000)
+        with self.assertRaises(Exception) as ctx:
+            resolve_actor_context(None, None, None, None, None, self._idp_token("kid-a", "secret-aaaa"))
+        self.assertEqual(getattr(ctx.exception, "status_code", None), 401)
+        self.assertIsNot(_JWKS_CACHE[jwks_path], entry)
+
+    def test_jwks_rewrite_within_one_timestamp_tick_is_detected(self) -> None:
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as fh:
+            jwks_path = fh.name
+        self.addCleanup(lambda: os.path.exists(jwks_path) and os.unlink(jwks_path))
+        os.environ["NEWCLAW_IDP_JWKS_PATH"] = jwks_path
+        reload_auth_settings()
+        now = time.time_ns()
+        self._write_jwks(jwks_path, "kid-a", "secret-aaaa", now)
+        resolve_actor_context(None, None, None, None, None, self._idp_token("kid-a", "secret-aaaa"))
+
+        # Identical (mtime, size, inode) but different content.
+        self._write_jwks(jwks_path, "kid-b", "secret-bbbb", now)
+        actor = resolve_actor_context(None, None, None, None, None, self._idp_token("kid-b", "secret-bbbb"))
+        self.assertEqual(actor.actor_id, "user_kid-b")
+
+
+    def test_verified_tokens_are_served_from_cache(self) -> None:
+        token = issue_dev_jwt("cached_user", "reviewer")
+        bearer = f"Bearer {token}"
+        before = TOKEN_CACHE.stats()
+        first = resolve_actor_context(bearer, None, None, None, None, None)
+        second = resolve_actor_context(bearer, None, None, None, None, None)
+        self.assertEqual(first, second)
+        after = TOKEN_CACHE.stats()
+        self.assertEqual(after["misses"] - before["misses"], 1)
+        self.assertEqual(after["hits"] - before["hits"], 1)
+
+        # Settings are a snapshot: an environment change alone does not apply, a reload does
+        # and drops entries verified under the old secret.
+        os.environ["NEWCLAW_JWT_SECRET"] = "another-secret"
+        self.assertEqual(resolve_actor_context(bearer, None, None, None, None, None), first)
+        reload_auth_settings()
+        self.assertEqual(TOKEN_CACHE.stats()["entries"], 0)
+        with self.assertRaises(Exception) as ctx:
+            resolve_actor_context(bearer, None, None, None, None, None)
+        self.assertEqual(getattr(ctx.exception, "status_code", None), 401)
+
+    def test_cached_token_expires_at_exp(self) -> None:
+        cache = TokenCache(max_entries=2, ttl_seconds=60)
+        actor = ActorContext(actor_id="u", actor_role="reviewer", source="jwt")
+        now = int(time.time())
+        cache.put("live", (actor, {"exp": now + 60}, None), 0.001)
+        cache.put("expired", (actor, {"exp": now - 2}, None), 0.001)
+        self.assertEqual(cache.get("live"), actor)
+        self.assertIsNone(cache.get("expired"))
+        self.assertEqual(cache.stats()["invalidations"], 1)
+
+        cache.put("no_exp", (actor, {}, None), 0.001)
+        cache.put("third", (actor, {"exp": now + 60}, None), 0.001)
+        self.assertEqual(cache.stats()["entries"], 2)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_cached_idp_token_is_invalidated_by_jwks_change(self) -> None:
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as fh:
+            jwks_path = fh.name
+        self.addCleanup(lambda: os.path.exists(jwks_path) and os.unlink(jwks_path))
+        os.environ["NEWCLAW_IDP_JWKS_PATH"] = jwks_path
+        reload_auth_settings()
+        old_mtime = time.time_ns() - 3600 * 1_000_000_000
+        self._write_jwks(jwks_path, "kid-a", "secret-aaaa", old_mtime)
+        token = self._idp_token("kid-a", "secret-aaaa")
+
+        resolve_actor_context(None, None, None, None, None, token)
+        hits = TOKEN_CACHE.stats()["hits"]
+        resolve_actor_context(None, None, None, None, None, token)
+        self.assertEqual(TOKEN_CACHE.stats()["hits"], hits + 1)
+
+        self._write_jwks(jwks_path, "kid-b", "secret-bbbb", old_mtime + 1_000_000_000)
+        with self.assertRaises(Exception) as ctx:
+            resolve_actor_context(None, None, None, None, None, token)
+        self.assertEqual(getattr(ctx.exception, "status_code", None), 401)
+
+
 if __name__ == "__main__":
     unittest.main()
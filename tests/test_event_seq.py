@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.persistence import SQLiteStateStore
+
+
+def _event(event_id: str, task_id: str, seq: int | None = None) -> dict:
+    event = {"event_id": event_id, "task_id": task_id, "event_type": "STATUS_CHANGED", "created_at": "2026-03-01T00:00:00+00:00"}
+    if seq is not None:
+        event["seq"] = seq
+    return event
+
+
+class TestEventSeq(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = Path(tmp.name) / "state.db"
+
+    def test_cursor_pages_in_seq_order(self) -> None:
+        store = SQLiteStateStore(str(self.db_path))
+        for seq in (3, 1, 2, 4):
+            store.save_event(_event(f"evt_{seq}", "task_a", seq))
+        store.save_event(_event("evt_other", "task_b", 5))
+
+        self.assertEqual(store.max_event_seq(), 5)
+        self.assertEqual([event["seq"] for event in store.load_task_events("task_a")], [1, 2, 3, 4])
+        self.assertEqual([event["seq"] for event in store.load_task_events("task_a", after_seq=1, limit=2)], [2, 3])
+        self.assertEqual(store.load_task_events("task_a", after_seq=4), [])
+
+    def test_legacy_events_are_backfilled_in_insert_order(self) -> None:
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute(
+            """
+            CREATE TABLE events (
+                event_id TEXT PRIMARY KEY,
+                task_id TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                payload TEXT NOT NULL
+            )
+            """
+        )
+        for event_id in ("evt_z", "evt_a", "evt_m"):
+            conn.execute(
+                "INSERT INTO events VALUES(?,?,?,?,?)",
+                (event_id, "task_a", "STATUS_CHANGED", "2026-03-01T00:00:00+00:00", f'{{"event_id":"{event_id}","task_id":"task_a"}}'),
+            )
+        conn.commit()
+        conn.close()
+
+        store = SQLiteStateStore(str(self.db_path))
+        events = store.load_task_events("task_a")
+        self.assertEqual([(event["event_id"], event["seq"]) for event in events], [("evt_z", 1), ("evt_a", 2), ("evt_m", 3)])
+        self.assertEqual(store.max_event_seq(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
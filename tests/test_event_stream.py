@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import unittest
+from threading import Thread
+
+from app.event_stream import EventBroker, StreamCapacityExceeded
+
+
+class TestEventBroker(unittest.TestCase):
+    def test_wait_returns_immediately_when_items_exist(self) -> None:
+        broker = EventBroker()
+        self.assertEqual(asyncio.run(broker.wait_for("task_a", lambda: [1], timeout=5)), [1])
+        self.assertEqual(broker.stats()["waiters"], 0)
+
+    def test_publish_from_another_thread_wakes_waiter(self) -> None:
+        broker = EventBroker()
+        log: list[int] = []
+
+        def _publish() -> None:
+            time.sleep(0.05)
+            log.append(1)
+            broker.publish("task_a")
+
+        Thread(target=_publish).start()
+        started = time.monotonic()
+        self.assertEqual(asyncio.run(broker.wait_for("task_a", lambda: list(log), timeout=5)), [1])
+        self.assertLess(time.monotonic() - started, 1.0)
+
+    def test_wait_times_out_and_unsubscribes(self) -> None:
+        broker = EventBroker()
+        broker.publish("task_b")
+        self.assertEqual(asyncio.run(broker.wait_for("task_a", lambda: [], timeout=0.05)), [])
+        self.assertEqual(broker.stats(), {"watched_keys": 0, "waiters": 0, "max_waiters": 1000})
+
+    def test_waiters_beyond_capacity_are_refused(self) -> None:
+        broker = EventBroker(max_waiters=2)
+
+        async def scenario() -> list[object]:
+            waits = [asyncio.ensure_future(broker.wait_for(f"task_{n}", lambda: [], timeout=0.2)) for n in range(3)]
+            return await asyncio.gather(*waits, return_exceptions=True)
+
+        results = asyncio.run(scenario())
+        self.assertEqual(results[:2], [[], []])
+        self.assertIsInstance(results[2], StreamCapacityExceeded)
+        self.assertFalse(broker.at_capacity())
+
+    def test_cancelled_waiter_unsubscribes(self) -> None:
+        broker = EventBroker()
+
+        async def scenario() -> None:
+            wait = asyncio.ensure_future(broker.wait_for("task_a", lambda: [], timeout=5))
+            await asyncio.sleep(0.01)
+            self.assertEqual(broker.stats()["waiters"], 1)
+            wait.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await wait
+
+        asyncio.run(scenario())
+        self.assertEqual(broker.stats()["waiters"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
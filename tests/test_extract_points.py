@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import unittest
+
+try:
+    from app.main import _extract_points, _render_meeting_summary
+except Exception as exc:  # pragma: no cover - environment dependent
+    _extract_points = None
+    IMPORT_ERROR = exc
+else:
+    IMPORT_ERROR = None
+
+
+@unittest.skipIf(_extract_points is None, f"runtime dependencies unavailable: {IMPORT_ERROR}")
+class TestExtractPoints(unittest.TestCase):
+    def test_skips_blank_lines_and_strips_bullets(self) -> None:
+        notes = "\r\n  \n- 업무A 진행\r\n* 업무B 리스크\r\r\t업무C 일정  \n"
+        self.assertEqual(_extract_points(notes), ["업무A 진행", "업무B 리스크", "업무C 일정"])
+
+    def test_stops_after_limit(self) -> None:
+        notes = "\n".join(f"line {idx}" for idx in range(100_000))
+        self.assertEqual(_extract_points(notes, limit=2), ["line 0", "line 1"])
+        self.assertEqual(_extract_points(notes, limit=0), [])
+
+    def test_render_uses_first_points_of_large_notes(self) -> None:
+        notes = "첫 논점\n둘째 논점\n" + ("x" * 80 + "\n") * 50_000
+        report = _render_meeting_summary(
+            {"meeting_title": "대용량", "meeting_date": "2026-03-04", "participants": ["Kim"], "notes": notes}
+        )
+        self.assertIn("- 첫 논점", report)
+        self.assertEqual(report.count("| Action "), 5)
+
+    def test_blank_notes_are_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            _render_meeting_summary({"participants": [], "notes": " \n\t\r\n"})
+
+
+if __name__ == "__main__":
+    unittest.main()
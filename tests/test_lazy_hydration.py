@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import itertools
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.persistence import SQLiteStateStore
+
+
+def _task(task_id: str, status: str) -> dict:
+    return {"task_id": task_id, "status": status, "requested_by": "qa_user", "updated_at": "2026-03-01T00:00:00+00:00"}
+
+
+_SEQ = itertools.count(1)
+
+
+def _event(event_id: str, task_id: str, event_type: str = "STATUS_CHANGED") -> dict:
+    return {
+        "event_id": event_id,
+        "task_id": task_id,
+        "event_type": event_type,
+        "created_at": "2026-03-01T00:00:00+00:00",
+        "seq": next(_SEQ),
+    }
+
+
+def _approval(queue_id: str, task_id: str, status: str) -> dict:
+    return {
+        "queue_id": queue_id,
+        "task_id": task_id,
+        "status": status,
+        "approver_group": "ops_team",
+        "created_at": "2026-03-01T00:00:00+00:00",
+        "resolved_at": None,
+    }
+
+
+class TestLazyHydration(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = SQLiteStateStore(str(Path(tmp.name) / "state.db"))
+
+        self.store.save_task(_task("task_done", "DONE"))
+        self.store.save_task(_task("task_waiting", "NEEDS_HUMAN_APPROVAL"))
+        self.store.save_event(_event("evt_done_1", "task_done"))
+        self.store.save_event(_event("evt_done_2", "task_done", "BLOCKED_POLICY"))
+        self.store.save_event(_event("evt_waiting_1", "task_waiting"))
+        self.store.save_approval(_approval("aq_resolved", "task_done", "REJECTED"))
+        self.store.save_approval(_approval("aq_pending", "task_waiting", "PENDING"))
+        self.store.save_idempotency("task_done", "idem_done", "task_done")
+        self.store.save_idempotency("task_waiting", "idem_waiting", "task_waiting")
+
+    def test_active_state_skips_terminal_history(self) -> None:
+        tasks, events, approvals, actions, idempotency = self.store.load_active_state()
+        self.assertEqual(set(tasks), {"task_waiting"})
+        self.assertEqual([event["event_id"] for event in events], ["evt_waiting_1"])
+        self.assertEqual(set(approvals), {"aq_pending"})
+        self.assertEqual(actions, [])
+        self.assertEqual(idempotency, {("task_waiting", "idem_waiting"): "task_waiting"})
+
+    def test_terminal_history_is_available_on_demand(self) -> None:
+        self.assertEqual(self.store.get_task("task_done")["status"], "DONE")
+        self.assertIsNone(self.store.get_task("task_missing"))
+        self.assertEqual(
+            [event["event_id"] for event in self.store.load_task_events("task_done")],
+            ["evt_done_1", "evt_done_2"],
+        )
+        self.assertEqual(self.store.get_approval("aq_resolved")["status"], "REJECTED")
+        self.assertEqual(self.store.get_idempotency("task_done", "idem_done"), "task_done")
+        self.assertIsNone(self.store.get_idempotency("task_done", "idem_other"))
+
+    def test_store_queries_back_list_approvals(self) -> None:
+        resolved = self.store.list_approvals("REJECTED", "ops_team")
+        self.assertEqual([item["queue_id"] for item in resolved], ["aq_resolved"])
+        self.assertEqual(len(self.store.list_approvals(None, None)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+import unittest
+
+from app.locking import StripedLock
+
+
+class TestStripedLock(unittest.TestCase):
+    def test_same_task_maps_to_same_stripe(self) -> None:
+        locks = StripedLock(8)
+        self.assertIs(locks.for_key("task_a"), locks.for_key("task_a"))
+
+    def test_rejects_invalid_stripe_count(self) -> None:
+        with self.assertRaises(ValueError):
+            StripedLock(0)
+
+    def test_unrelated_tasks_do_not_block_each_other(self) -> None:
+        locks = StripedLock(64)
+        first = "task_a"
+        second = next(f"task_{idx}" for idx in range(1000) if locks.for_key(f"task_{idx}") is not locks.for_key(first))
+        acquired = threading.Event()
+
+        def worker() -> None:
+            with locks.hold(second):
+                acquired.set()
+
+        with locks.hold(first):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            self.assertTrue(acquired.wait(timeout=1.0))
+        thread.join()
+
+    def test_same_task_is_serialized(self) -> None:
+        locks = StripedLock(4)
+        acquired = threading.Event()
+
+        def worker() -> None:
+            with locks.hold("task_a"):
+                acquired.set()
+
+        with locks.hold("task_a"):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            self.assertFalse(acquired.wait(timeout=0.1))
+        thread.join()
+        self.assertTrue(acquired.is_set())
+
+    def test_hold_many_takes_every_stripe_once(self) -> None:
+        locks = StripedLock(4)
+        keys = [f"task_{idx}" for idx in range(20)]
+        with locks.hold_many(keys + keys):
+            self.assertTrue(all(locks.for_key(key).locked() for key in keys))
+        self.assertFalse(any(locks.for_key(key).locked() for key in keys))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import gc
+import threading
+import unittest
+from contextlib import contextmanager
+
+from app.metrics import GaugeCallback, Histogram, InstrumentedStateStore, MetricsRegistry
+
+
+class _FakeStore:
+    def __init__(self) -> None:
+        self.saved: list[str] = []
+        self.committed = 0
+
+    def save_task(self, task_id: str) -> None:
+        self.saved.append(task_id)
+
+    @contextmanager
+    def transaction(self):
+        yield
+        self.committed += 1
+
+
+class TestMetrics(unittest.TestCase):
+    def test_histogram_exposition_is_cumulative(self) -> None:
+        histogram = Histogram("demo_seconds", "Demo.", ("stage",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, "planner")
+        histogram.observe(0.5, "planner")
+        histogram.observe(5.0, "planner")
+        lines = histogram.collect()
+        self.assertIn("# TYPE demo_seconds histogram", lines)
+        self.assertIn('demo_seconds_bucket{stage="planner",le="0.1"} 1', lines)
+        self.assertIn('demo_seconds_bucket{stage="planner",le="1"} 2', lines)
+        self.assertIn('demo_seconds_bucket{stage="planner",le="+Inf"} 3', lines)
+        self.assertIn('demo_seconds_sum{stage="planner"} 5.55', lines)
+        self.assertIn('demo_seconds_count{stage="planner"} 3', lines)
+
+    def test_histogram_rejects_wrong_label_count(self) -> None:
+        histogram = Histogram("demo_seconds", "Demo.", ("stage",))
+        with self.assertRaises(ValueError):
+            histogram.observe(0.1)
+
+    def test_per_thread_shards_merge_on_collect(self) -> None:
+        histogram = Histogram("demo_seconds", "Demo.")
+
+        def worker() -> None:
+            for _ in range(1000):
+                histogram.observe(0.001)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertIn("demo_seconds_count 8000", histogram.collect())
+
+    def test_exited_threads_fold_into_retired_total(self) -> None:
+        histogram = Histogram("demo_seconds", "Demo.", ("stage",))
+        histogram.observe(0.5, "planner")
+
+        def worker(stage: str) -> None:
+            histogram.observe(0.001, stage)
+
+        for idx in range(50):
+            thread = threading.Thread(target=worker, args=("planner" if idx % 2 else "reporter",))
+            thread.start()
+            thread.join()
+        gc.collect()
+        # Only this thread's shards are still live; the exited threads' counts are kept.
+        self.assertEqual(list(histogram._threads.values()), [histogram._local.shards.by_labels])
+        self.assertEqual(set(histogram._retired), {("planner",), ("reporter",)})
+        lines = histogram.collect()
+        self.assertIn('demo_seconds_count{stage="planner"} 26', lines)
+        self.assertIn('demo_seconds_count{stage="reporter"} 25', lines)
+
+    def test_registry_renders_gauges(self) -> None:
+        registry = MetricsRegistry()
+        registry.register(GaugeCallback("demo_tasks", "Demo.", lambda: [(("DONE",), 3)], ("status",)))
+        self.assertIn('demo_tasks{status="DONE"} 3\n', registry.render())
+
+    def test_instrumented_store_times_methods_and_transactions(self) -> None:
+        histogram = Histogram("store_seconds", "Demo.", ("method",))
+        store = _FakeStore()
+        instrumented = InstrumentedStateStore(store, histogram)
+        with instrumented.transaction():
+            instrumented.save_task("task_1")
+        instrumented.save_task("task_2")
+        self.assertEqual(store.saved, ["task_1", "task_2"])
+        self.assertEqual(store.committed, 1)
+        lines = histogram.collect()
+        self.assertIn('store_seconds_count{method="save_task"} 2', lines)
+        self.assertIn('store_seconds_count{method="transaction"} 1', lines)
+
+
+if __name__ == "__main__":
+    unittest.main()
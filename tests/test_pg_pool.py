@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import unittest
+from uuid import uuid4
+
+from app.pg_pool import ConnectionPool, PoolTimeout
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.closed = False
+        self.broken = False
+        self.rollbacks = 0
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestConnectionPool(unittest.TestCase):
+    def test_reuses_released_connection(self) -> None:
+        pool = ConnectionPool(_FakeConnection, min_size=0, max_size=2)
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+        self.assertIs(first, second)
+        self.assertEqual(pool.stats()["created"], 1)
+
+    def test_min_size_is_opened_eagerly(self) -> None:
+        pool = ConnectionPool(_FakeConnection, min_size=3, max_size=5)
+        stats = pool.stats()
+        self.assertEqual(stats["size"], 3)
+        self.assertEqual(stats["idle"], 3)
+
+    def test_acquire_times_out_when_exhausted(self) -> None:
+        pool = ConnectionPool(_FakeConnection, min_size=0, max_size=1, acquire_timeout=0.05)
+        held = pool.acquire()
+        with self.assertRaises(PoolTimeout):
+            pool.acquire()
+        self.assertEqual(pool.stats()["timeouts"], 1)
+        pool.release(held)
+
+    def test_waiter_gets_connection_on_release(self) -> None:
+        pool = ConnectionPool(_FakeConnection, min_size=0, max_size=1, acquire_timeout=2.0)
+        held = pool.acquire()
+        got: list[object] = []
+
+        def waiter() -> None:
+            with pool.connection() as conn:
+                got.append(conn)
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.05)
+        pool.release(held)
+        thread.join(timeout=2.0)
+        self.assertEqual(got, [held])
+
+    def test_broken_connection_is_replaced(self) -> None:
+        pool = ConnectionPool(_FakeConnection, min_size=0, max_size=1)
+        with pool.connection() as conn:
+            conn.broken = True
+        with pool.connection() as replacement:
+            self.assertIsNot(conn, replacement)
+        stats = pool.stats()
+        self.assertEqual(stats["discarded"], 1)
+        self.assertEqual(stats["size"], 1)
+
+    def test_discarded_connections_are_replaced_up_to_min_size(self) -> None:
+        pool = ConnectionPool(_FakeConnection, min_size=2, max_size=4)
+        held = [pool.acquire() for _ in range(3)]
+        for conn in held:
+            conn.broken = True
+            pool.release(conn)
+        stats = pool.stats()
+        self.assertEqual(stats["discarded"], 3)
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["idle"], 2)
+        self.assertEqual(stats["created"], 5)
+
+    def test_replacement_connect_failure_is_not_raised_on_release(self) -> None:
+        attempts: list[int] = []
+
+        def connect() -> _FakeConnection:
+            attempts.append(1)
+            if len(attempts) > 1:
+                raise OSError("server went away")
+            return _FakeConnection()
+
+        pool = ConnectionPool(connect, min_size=1, max_size=1)
+        with pool.connection() as conn:
+            conn.broken = True
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(pool.stats()["size"], 0)
+
+    def test_failed_health_check_discards_idle_connection(self) -> None:
+        def check(_conn: object) -> None:
+            raise RuntimeError("server went away")
+
+        pool = ConnectionPool(_FakeConnection, min_size=1, max_size=1, health_check_interval=0.0, check=check)
+        with pool.connection():
+            pass
+        self.assertEqual(pool.stats()["health_check_failures"], 1)
+
+    def test_error_inside_block_rolls_back(self) -> None:
+        pool = ConnectionPool(_FakeConnection, min_size=0, max_size=1)
+        with self.assertRaises(ValueError):
+            with pool.connection() as conn:
+                raise ValueError("statement failed")
+        self.assertGreaterEqual(conn.rollbacks, 1)
+        self.assertEqual(pool.stats()["in_use"], 0)
+
+
+try:
+    import psycopg  # noqa: F401
+except Exception:  # pragma: no cover - optional dependency
+    PSYCOPG_AVAILABLE = False
+else:
+    PSYCOPG_AVAILABLE = True
+
+TEST_DATABASE_URL = os.getenv("NEWCLAW_TEST_DATABASE_URL", "").strip()
+
+
+@unittest.skipUnless(
+    PSYCOPG_AVAILABLE and TEST_DATABASE_URL,
+    "set NEWCLAW_TEST_DATABASE_URL (e.g. from scripts/manage_local_postgres.sh dsn) and install psycopg",
+)
+class TestPostgresPooledStore(unittest.TestCase):
+    def test_concurrent_writers_share_the_pool(self) -> None:
+        from app.persistence import PostgresStateStore
+
+        store = PostgresStateStore(TEST_DATABASE_URL, pool_min_size=1, pool_max_size=4)
+        self.addCleanup(store.pool.close)
+        task_id = f"task_pool_{uuid4().hex}"
+
+        def writer(offset: int) -> None:
+            for idx in range(10):
+                store.save_event(
+                    {
+                        "event_id": f"evt_pool_{task_id}_{offset}_{idx}",
+                        "task_id": task_id,
+                        "event_type": "STAGE_CHANGED",
+                        "created_at": "2026-03-01T00:00:00+00:00",
+                    }
+                )
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        _, events, _, _, _ = store.load_state()
+        self.assertEqual(sum(1 for event in events if event["task_id"] == task_id), 80)
+        stats = store.stats()["pool"]
+        self.assertLessEqual(stats["size"], 4)
+        self.assertEqual(stats["in_use"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
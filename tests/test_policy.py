@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.policy import DEFAULT_POLICY_RULES_PATH, PolicyMatcher, PolicyRule, PolicyStore, load_policy_rules
+
+
+class TestPolicyMatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.matcher = PolicyMatcher(
+            (
+                PolicyRule("external_send_requested", ("외부 전송", "http://", "https://")),
+                PolicyRule("destructive_command", ("rm -rf", "http://internal/delete")),
+            )
+        )
+
+    def test_walks_nested_values_case_insensitively(self) -> None:
+        payload = {"meeting": {"notes": ["내부 논의", {"link": "See HTTPS://example.com"}]}, "count": 3}
+        self.assertEqual(self.matcher.detect(payload), "external_send_requested")
+        self.assertIsNone(self.matcher.detect({"notes": "내부 논의", "participants": ["Kim", "Lee"]}))
+
+    def test_rule_order_decides_and_approved_reasons_are_skipped(self) -> None:
+        payload = {"notes": "run rm -rf then 외부 전송"}
+        self.assertEqual(self.matcher.detect(payload), "external_send_requested")
+        self.assertEqual(self.matcher.detect(payload, {"external_send_requested"}), "destructive_command")
+        self.assertIsNone(self.matcher.detect(payload, {"external_send_requested", "destructive_command"}))
+
+    def test_overlapping_and_prefix_patterns_are_all_seen(self) -> None:
+        # "http://internal/delete" contains the shorter "http://" from the first rule.
+        payload = {"notes": "call http://internal/delete"}
+        self.assertEqual(self.matcher.detect(payload, {"external_send_requested"}), "destructive_command")
+        self.assertEqual(self.matcher.detect(payload), "external_send_requested")
+
+    def test_values_are_not_joined_across_fields(self) -> None:
+        matcher = PolicyMatcher((PolicyRule("external_send_requested", ("external send",)),))
+        self.assertIsNone(matcher.detect({"a": "external", "b": "send"}))
+
+    def test_loads_default_rule_file(self) -> None:
+        rules = load_policy_rules(DEFAULT_POLICY_RULES_PATH)
+        self.assertIn("external_send_requested", {rule.reason_code for rule in rules})
+
+    def test_rejects_invalid_rule_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rules.json"
+            path.write_text(json.dumps({"blocked_patterns": [{"reason_code": "x", "patterns": []}]}), encoding="utf-8")
+            with self.assertRaises(RuntimeError):
+                load_policy_rules(path)
+            with self.assertRaises(RuntimeError):
+                load_policy_rules(Path(tmp) / "missing.json")
+
+
+class TestPolicyStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "policy_rules.json"
+        self._write(1, ["external send"], ["notes"])
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write(self, version: int, patterns: list[str], required: list[str]) -> None:
+        doc = {
+            "version": version,
+            "templates": {"meeting_summary": {"required_fields": required}},
+            "blocked_patterns": [{"reason_code": "external_send_requested", "patterns": patterns}],
+        }
+        self.path.write_text(json.dumps(doc), encoding="utf-8")
+        # Bump mtime explicitly; two writes within one timestamp tick would look unchanged.
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000 * version))
+
+    def test_reloads_changed_file_into_a_new_snapshot(self) -> None:
+        store = PolicyStore(self.path, check_interval=0)
+        before = store.current()
+        self.assertEqual(before.matcher.detect({"notes": "webhook call"}), None)
+        self.assertEqual(before.template_required_fields["meeting_summary"], ("notes",))
+
+        self._write(2, ["external send", "webhook"], ["notes", "meeting_title"])
+        after = store.current()
+        self.assertNotEqual(after.version, before.version)
+        self.assertTrue(after.version.startswith("2-"))
+        self.assertEqual(after.matcher.detect({"notes": "webhook call"}), "external_send_requested")
+        self.assertEqual(after.template_required_fields["meeting_summary"], ("notes", "meeting_title"))
+        # Snapshots already handed out are never mutated.
+        self.assertIsNone(before.matcher.detect({"notes": "webhook call"}))
+        self.assertEqual(store.stats()["reloads"], 1)
+
+    def test_broken_file_keeps_previous_snapshot(self) -> None:
+        store = PolicyStore(self.path, check_interval=0)
+        version = store.current().version
+        self.path.write_text("{not json", encoding="utf-8")
+        os.utime(self.path, ns=(0, 10**18))
+        self.assertEqual(store.current().version, version)
+        self.assertIsNotNone(store.stats()["last_error"])
+
+    def test_same_size_rewrite_within_one_timestamp_tick_is_reloaded(self) -> None:
+        store = PolicyStore(self.path, check_interval=0)
+        before = store.current()
+        stat = self.path.stat()
+        content = self.path.read_text(encoding="utf-8")
+        self.path.write_text(content.replace("external send", "external sent"), encoding="utf-8")
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(self.path.stat().st_size, stat.st_size)
+
+        after = store.current()
+        self.assertNotEqual(after.version, before.version)
+        self.assertEqual(after.matcher.detect({"notes": "external sent"}), "external_send_requested")
+        # Same bytes again: nothing to recompile.
+        self.assertIs(store.current(), after)
+
+    def test_unchanged_file_is_not_recompiled(self) -> None:
+        store = PolicyStore(self.path, check_interval=3600)
+        snapshot = store.current()
+        self._write(3, ["webhook"], ["notes"])
+        self.assertIs(store.current(), snapshot)
+        self.assertTrue(store.reload())
+        self.assertIsNot(store.current(), snapshot)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+import pstats
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.auth import ActorContext, actor_context_dependency, issue_dev_jwt
+from app.profiling import _ACTIVE_PROFILE, PROFILE_ID_HEADER, ProfileArtifacts, RequestProfiler, create_profiler
+from app.scheduler import SchedulerSaturated
+
+
+def _busy() -> int:
+    return sum(idx * idx for idx in range(2000))
+
+
+def _run_in(context: Any) -> None:
+    with context():
+        _busy()
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.pipelines: list[str] = []
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _client(self, profiler: RequestProfiler) -> TestClient:
+        app = FastAPI()
+        app.router.route_class = profiler.route_class()
+
+        @app.post("/run/{task_id}")
+        def run(task_id: str, actor: ActorContext = Depends(actor_context_dependency)) -> dict[str, Any]:
+            _busy()
+            profiler.follow(task_id)
+            self.pipelines.append(task_id)
+            return {"task_id": task_id, "actor": actor.actor_id}
+
+        return TestClient(app)
+
+    def _headers(self, role: str, profile: bool = True) -> dict[str, str]:
+        headers = {"Authorization": f"Bearer {issue_dev_jwt('qa_' + role, role)}"}
+        if profile:
+            headers["X-Newclaw-Profile"] = "1"
+        return headers
+
+    def test_admin_header_profiles_handler_and_followed_pipeline(self) -> None:
+        profiler = RequestProfiler(ProfileArtifacts(self.root, 10))
+        client = self._client(profiler)
+
+        resp = client.post("/run/task_1", headers=self._headers("admin"))
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), {"task_id": "task_1", "actor": "qa_admin"})
+        profile_id = resp.headers[PROFILE_ID_HEADER]
+
+        request_path = profiler.artifacts.path_for(profile_id)
+        self.assertIsNotNone(request_path)
+        functions = {func[2] for func in pstats.Stats(str(request_path)).stats}
+        self.assertIn("_busy", functions)
+
+        with profiler.pipeline("task_1"):
+            _busy()
+        self.assertIsNotNone(profiler.artifacts.path_for(f"{profile_id}_pipeline"))
+        kinds = {item["kind"]: item["target"] for item in profiler.artifacts.list(10)}
+        self.assertEqual(kinds, {"request": "/run/{task_id}", "pipeline": "task_1"})
+        self.assertEqual(profiler.stats()["profiled"], 2)
+
+    def test_pipeline_handoff_profiles_report_stage_on_its_own_thread(self) -> None:
+        profiler = RequestProfiler(ProfileArtifacts(self.root, 10))
+        client = self._client(profiler)
+        profile_id = client.post("/run/task_5", headers=self._headers("admin")).headers[PROFILE_ID_HEADER]
+
+        with profiler.pipeline("task_5"):
+            _busy()
+            handoff = profiler.handoff("task_5")
+        worker = threading.Thread(target=lambda: _run_in(handoff), name="report-io-test")
+        worker.start()
+        worker.join()
+
+        report_path = profiler.artifacts.path_for(f"{profile_id}_pipeline_report")
+        self.assertIsNotNone(report_path)
+        functions = {func[2] for func in pstats.Stats(str(report_path)).stats}
+        self.assertIn("_busy", functions)
+        items = {item["kind"]: item for item in profiler.artifacts.list(10)}
+        self.assertEqual(items["pipeline_report"]["target"], "task_5")
+        self.assertEqual(items["pipeline_report"]["thread"], "report-io-test")
+        self.assertEqual(items["pipeline"]["thread"], threading.current_thread().name)
+        # Outside a profiled pipeline there is nothing to hand off.
+        with profiler.handoff("task_5")():
+            pass
+        self.assertEqual(profiler.stats()["profiled"], 3)
+
+    def test_header_from_non_admin_is_ignored(self) -> None:
+        profiler = RequestProfiler(ProfileArtifacts(self.root, 10))
+        client = self._client(profiler)
+
+        resp = client.post("/run/task_2", headers=self._headers("requester"))
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotIn(PROFILE_ID_HEADER, resp.headers)
+        self.assertEqual(profiler.artifacts.list(10), [])
+        # No profiled request started it, so the pipeline run is not profiled either.
+        with profiler.pipeline("task_2"):
+            pass
+        self.assertEqual(profiler.artifacts.list(10), [])
+
+    def test_sample_rate_profiles_without_header(self) -> None:
+        profiler = RequestProfiler(ProfileArtifacts(self.root, 10), sample_rate=1.0, allow_header=False)
+        client = self._client(profiler)
+
+        resp = client.post("/run/task_3", headers=self._headers("requester", profile=False))
+        self.assertIn(PROFILE_ID_HEADER, resp.headers)
+
+    def test_artifacts_keep_only_newest(self) -> None:
+        profiler = RequestProfiler(ProfileArtifacts(self.root, 2))
+        client = self._client(profiler)
+        for idx in range(4):
+            client.post(f"/run/task_{idx}", headers=self._headers("admin"))
+        self.assertEqual(len(list(self.root.glob("*.prof"))), 2)
+        self.assertIsNone(profiler.artifacts.path_for("../../etc/passwd"))
+
+    def test_refused_handoff_does_not_leave_a_followed_entry(self) -> None:
+        from app import main as runtime
+
+        profiler = RequestProfiler(ProfileArtifacts(self.root, 10))
+        token = _ACTIVE_PROFILE.set("prof_0123456789abcdef")
+        try:
+            with patch.object(runtime, "PROFILER", profiler), patch.object(
+                runtime.SCHEDULER, "submit", side_effect=SchedulerSaturated("full")
+            ):
+                with self.assertRaises(HTTPException) as ctx:
+                    runtime._start_pipeline("task_refused")
+        finally:
+            _ACTIVE_PROFILE.reset(token)
+        self.assertEqual(ctx.exception.status_code, 503)
+        self.assertEqual(profiler.stats()["pending_pipelines"], 0)
+
+    def test_disabled_by_default(self) -> None:
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("NEWCLAW_PROFILING", None)
+            os.environ.pop("NEWCLAW_PROFILE_SAMPLE_RATE", None)
+            self.assertIsNone(create_profiler())
+            os.environ["NEWCLAW_PROFILING"] = "1"
+            self.assertIsNotNone(create_profiler())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.render_cache import RenderCache, link_or_write, render_cache_key
+
+
+class TestRenderCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.renders = 0
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _render(self, text: str):
+        def render() -> str:
+            self.renders += 1
+            return text
+
+        return render
+
+    def test_key_is_canonical_over_input_ordering(self) -> None:
+        first = render_cache_key("meeting_summary", {"a": 1, "b": ["x", {"c": 2, "d": 3}]}, "v1")
+        second = render_cache_key("meeting_summary", {"b": ["x", {"d": 3, "c": 2}], "a": 1}, "v1")
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, render_cache_key("other_template", {"a": 1, "b": ["x", {"c": 2, "d": 3}]}, "v1"))
+        self.assertNotEqual(first, render_cache_key("meeting_summary", {"a": 1, "b": ["x", {"c": 2, "d": 4}]}, "v1"))
+
+    def test_key_changes_with_renderer_version(self) -> None:
+        payload = {"meeting_title": "t", "notes": "a"}
+        self.assertNotEqual(
+            render_cache_key("meeting_summary", payload, "v1"), render_cache_key("meeting_summary", payload, "v2")
+        )
+
+    def test_hit_skips_render_and_reports_share_the_object(self) -> None:
+        cache = RenderCache(self.root / "_cache", max_entries=4)
+        first_text, first_path = cache.get_or_render("k1", self._render("# report\n"))
+        second_text, second_path = cache.get_or_render("k1", self._render("unused\n"))
+        self.assertEqual((first_text, second_text), ("# report\n", "# report\n"))
+        self.assertEqual(first_path, second_path)
+        self.assertEqual(self.renders, 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+        link_or_write(first_path, self.root / "task_a" / "report.md", first_text)
+        link_or_write(second_path, self.root / "task_b" / "report.md", second_text)
+        # Re-linking over an existing report (a retried task) replaces it.
+        link_or_write(second_path, self.root / "task_b" / "report.md", second_text)
+        a_stat = (self.root / "task_a" / "report.md").stat()
+        b_stat = (self.root / "task_b" / "report.md").stat()
+        self.assertEqual(a_stat.st_ino, b_stat.st_ino)
+
+    def test_lru_eviction_keeps_linked_reports(self) -> None:
+        cache = RenderCache(self.root / "_cache", max_entries=2)
+        _, k1_path = cache.get_or_render("k1", self._render("one\n"))
+        link_or_write(k1_path, self.root / "task_1" / "report.md", "one\n")
+        cache.get_or_render("k2", self._render("two\n"))
+        cache.get_or_render("k1", self._render("one\n"))
+        cache.get_or_render("k3", self._render("three\n"))
+
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertTrue(k1_path.exists())
+        self.assertFalse((self.root / "_cache" / "k2.md").exists())
+        self.assertEqual((self.root / "task_1" / "report.md").read_text(encoding="utf-8"), "one\n")
+        link_or_write(self.root / "_cache" / "k2.md", self.root / "task_2" / "report.md", "two\n")
+        self.assertEqual((self.root / "task_2" / "report.md").read_text(encoding="utf-8"), "two\n")
+
+    def test_adopts_objects_from_previous_run(self) -> None:
+        cache = RenderCache(self.root / "_cache", max_entries=2)
+        for key in ("k1", "k2", "k3"):
+            cache.get_or_render(key, self._render(f"{key}\n"))
+        os.utime(self.root / "_cache" / "k2.md", ns=(0, 1))
+
+        restarted = RenderCache(self.root / "_cache", max_entries=1)
+        self.assertEqual(restarted.stats()["entries"], 1)
+        self.assertFalse((self.root / "_cache" / "k2.md").exists())
+        text, _ = restarted.get_or_render("k3", self._render("unused\n"))
+        self.assertEqual(text, "k3\n")
+        self.assertEqual(self.renders, 3)
+
+    def test_zero_entries_disables_cache(self) -> None:
+        cache = RenderCache(self.root / "_cache", max_entries=0)
+        self.assertEqual(cache.get_or_render("k1", self._render("one\n")), ("one\n", None))
+        cache.get_or_render("k1", self._render("one\n"))
+        self.assertEqual(self.renders, 2)
+        self.assertFalse((self.root / "_cache").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import gzip
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.report_storage import (
+    LocalObjectClient,
+    LocalReportStorage,
+    ReportWriter,
+    S3ReportStorage,
+    create_report_storage,
+)
+
+
+class TestReportStorage(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_local_layout_is_sharded_and_writes_replace_atomically(self) -> None:
+        storage = LocalReportStorage(self.root / "reports", shard_depth=2)
+        ref = storage.put("task_a", "# first\n")
+        path = Path(ref)
+        self.assertEqual(path.relative_to(self.root / "reports").parts[2:], ("task_a", "report.md"))
+        self.assertTrue(all(len(part) == 2 for part in path.relative_to(self.root / "reports").parts[:2]))
+
+        self.assertEqual(storage.put("task_a", "# second\n"), ref)
+        self.assertEqual(storage.read(ref), "# second\n")
+        self.assertEqual([entry.name for entry in path.parent.iterdir()], ["report.md"])
+
+    def test_local_links_cached_object_when_uncompressed(self) -> None:
+        cached = self.root / "object.md"
+        cached.write_text("# cached\n", encoding="utf-8")
+        ref = LocalReportStorage(self.root / "reports").put("task_a", "# cached\n", cached)
+        self.assertEqual(os.stat(ref).st_ino, cached.stat().st_ino)
+
+    def test_local_compression_and_fsync(self) -> None:
+        storage = LocalReportStorage(self.root / "reports", compress=True, fsync=True)
+        ref = storage.put("task_a", "# 회의 결과 요약\n")
+        self.assertTrue(ref.endswith("report.md.gz"))
+        self.assertEqual(gzip.decompress(Path(ref).read_bytes()).decode("utf-8"), "# 회의 결과 요약\n")
+        self.assertEqual(storage.read(ref), "# 회의 결과 요약\n")
+
+    def test_s3_adapter_against_local_stand_in(self) -> None:
+        client = LocalObjectClient(self.root / "objects")
+        storage = S3ReportStorage("reports-bucket", prefix="/newclaw/", compress=True, client=client)
+        ref = storage.put("task_a", "# report\n")
+        self.assertTrue(ref.startswith("s3://reports-bucket/newclaw/"))
+        self.assertTrue(ref.endswith("/task_a/report.md.gz"))
+        self.assertEqual(storage.read(ref), "# report\n")
+
+    def test_factory_selects_backend_from_env(self) -> None:
+        env = {
+            "NEWCLAW_REPORT_BACKEND": "s3-local",
+            "NEWCLAW_REPORT_S3_BUCKET": "b",
+            "NEWCLAW_REPORT_S3_LOCAL_ROOT": str(self.root / "objects"),
+        }
+        with mock.patch.dict(os.environ, env):
+            self.assertIsInstance(create_report_storage(self.root), S3ReportStorage)
+        with mock.patch.dict(os.environ, {"NEWCLAW_REPORT_BACKEND": "s3-local", "NEWCLAW_REPORT_S3_BUCKET": ""}):
+            with self.assertRaises(RuntimeError):
+                create_report_storage(self.root)
+        with mock.patch.dict(os.environ, {"NEWCLAW_REPORT_BACKEND": "ftp"}):
+            with self.assertRaises(RuntimeError):
+                create_report_storage(self.root)
+
+
+class TestReportWriter(unittest.TestCase):
+    def test_writes_off_thread_and_reports_results(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = ReportWriter(LocalReportStorage(Path(tmp)), workers=2)
+            results: list[tuple[str | None, BaseException | None, str]] = []
+            done = threading.Event()
+
+            def callback(ref: str | None, error: BaseException | None) -> None:
+                results.append((ref, error, threading.current_thread().name))
+                done.set()
+
+            writer.submit("task_a", "# report\n", None, callback).result(timeout=5)
+            self.assertTrue(done.wait(5))
+            ref, error, thread_name = results[0]
+            self.assertIsNone(error)
+            self.assertEqual(Path(ref).read_text(encoding="utf-8"), "# report\n")
+            self.assertTrue(thread_name.startswith("report-io"))
+            self.assertEqual(writer.stats()["written"], 1)
+            self.assertEqual(writer.stats()["pending"], 0)
+
+    def test_failed_write_reaches_callback(self) -> None:
+        class BrokenStorage(LocalReportStorage):
+            def put(self, task_id: str, report_text: str, cached_path: Path | None = None) -> str:
+                raise OSError("disk full")
+
+        writer = ReportWriter(BrokenStorage(Path(".")), workers=1)
+        errors: list[BaseException | None] = []
+        done = threading.Event()
+
+        def callback(ref: str | None, error: BaseException | None) -> None:
+            errors.append(error)
+            done.set()
+
+        writer.submit("task_a", "# report\n", None, callback)
+        self.assertTrue(done.wait(5))
+        self.assertIsInstance(errors[0], OSError)
+        self.assertEqual(writer.stats()["failed"], 1)
+
+    def test_submit_waits_once_max_pending_writes_are_queued(self) -> None:
+        release = threading.Event()
+
+        class SlowStorage(LocalReportStorage):
+            def put(self, task_id: str, report_text: str, cached_path: Path | None = None) -> str:
+                release.wait(5)
+                return task_id
+
+        writer = ReportWriter(SlowStorage(Path(".")), workers=1, max_pending=2)
+        callback = lambda ref, error: None  # noqa: E731
+        writer.submit("task_a", "# report\n", None, callback)
+        writer.submit("task_b", "# report\n", None, callback)
+        third = threading.Thread(target=writer.submit, args=("task_c", "# report\n", None, callback))
+        third.start()
+        third.join(0.2)
+        self.assertTrue(third.is_alive())
+        self.assertEqual(writer.stats()["pending"], 2)
+
+        release.set()
+        third.join(5)
+        self.assertFalse(third.is_alive())
+        self.assertEqual(writer.stats()["submit_waits"], 1)
+        with self.assertRaises(ValueError):
+            ReportWriter(SlowStorage(Path(".")), workers=1, max_pending=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
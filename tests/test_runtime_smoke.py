@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import json
 import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from unittest import mock
 
 
 try:
     from fastapi.testclient import TestClient
-    from app.main import APP
+    from app import main as runtime
+    from app.main import APP, EVENT_BROKER, POLICY_STORE, SCHEDULER
     from app.auth import issue_dev_jwt
 except Exception as exc:  # pragma: no cover - environment dependent
     TestClient = None
@@ -25,14 +30,23 @@ class TestRuntimeSmoke(unittest.TestCase):
 
     def _wait_status(self, task_id: str, expected: set[str], timeout: float = 5.0) -> dict | None:
         deadline = time.time() + timeout
-        while time.time() < deadline:
-            status_resp = self.client.get(f"/api/v1/task/status/{task_id}", headers=self.req_headers)
-            self.assertEqual(status_resp.status_code, 200)
-            payload = status_resp.json()
-            if payload["status"] in expected:
-                return payload
-            time.sleep(0.1)
-        return None
+        after_seq = 0
+        while True:
+            remaining = deadline - time.time()
+            poll_resp = self.client.get(
+                f"/api/v1/task/events/{task_id}/poll",
+                params={"after_seq": after_seq, "timeout": max(remaining, 0.0)},
+                headers=self.req_headers,
+            )
+            self.assertEqual(poll_resp.status_code, 200)
+            poll_payload = poll_resp.json()
+            if poll_payload["status"] in expected:
+                status_resp = self.client.get(f"/api/v1/task/status/{task_id}", headers=self.req_headers)
+                self.assertEqual(status_resp.status_code, 200)
+                return status_resp.json()
+            if remaining <= 0:
+                return None
+            after_seq = poll_payload["next_after_seq"]
 
     def test_create_run_done_flow(self) -> None:
         create_resp = self.client.post(
@@ -98,6 +112,26 @@ class TestRuntimeSmoke(unittest.TestCase):
         self.assertEqual(approval_payload["status"], "NEEDS_HUMAN_APPROVAL")
         self.assertIn("approval_queue_id", approval_payload)
 
+        seen: list[str] = []
+        cursor = None
+        while True:
+            params = {"status": "PENDING", "approver_group": "ops_team", "limit": 1}
+            if cursor:
+                params["cursor"] = cursor
+            page = self.client.get("/api/v1/approvals", params=params, headers=self.approver_headers)
+            self.assertEqual(page.status_code, 200)
+            page_payload = page.json()
+            self.assertLessEqual(page_payload["count"], 1)
+            seen.extend(item["queue_id"] for item in page_payload["items"])
+            cursor = page_payload["next_cursor"]
+            if cursor is None:
+                break
+        self.assertIn(approval_payload["approval_queue_id"], seen)
+        self.assertEqual(len(seen), len(set(seen)))
+
+        bad_cursor = self.client.get("/api/v1/approvals", params={"cursor": "not-a-cursor"}, headers=self.approver_headers)
+        self.assertEqual(bad_cursor.status_code, 400)
+
     def test_retry_exhausted_to_approval_flow(self) -> None:
         create_resp = self.client.post(
             "/api/v1/task/create",
@@ -203,6 +237,21 @@ class TestRuntimeSmoke(unittest.TestCase):
         self.assertEqual(events_resp.status_code, 200)
         events_payload = events_resp.json()
         self.assertGreaterEqual(events_payload["count"], 2)
+        seqs = [event["seq"] for event in events_payload["items"]]
+        self.assertEqual(seqs, sorted(set(seqs)))
+
+        first_page = self.client.get(
+            f"/api/v1/task/events/{task_id}", params={"limit": 1}, headers=self.reviewer_headers
+        ).json()
+        self.assertEqual([event["seq"] for event in first_page["items"]], seqs[:1])
+        self.assertTrue(first_page["has_more"])
+        rest = self.client.get(
+            f"/api/v1/task/events/{task_id}",
+            params={"after_seq": first_page["next_after_seq"]},
+            headers=self.reviewer_headers,
+        ).json()
+        self.assertEqual([event["seq"] for event in rest["items"]], seqs[1:])
+        self.assertFalse(rest["has_more"])
 
         audit_resp = self.client.get("/api/v1/audit/summary", headers=self.reviewer_headers)
         self.assertEqual(audit_resp.status_code, 200)
@@ -299,6 +348,450 @@ class TestRuntimeSmoke(unittest.TestCase):
         self.assertEqual(status_payload.get("final_reason"), "rejected_by_human")
         self.assertIn("completed_at", status_payload)
 
+    def _blocked_task(self, idempotency_key: str) -> tuple[str, str]:
+        create_resp = self.client.post(
+            "/api/v1/task/create",
+            json={
+                "title": "일괄 승인 검증",
+                "template_type": "meeting_summary",
+                "input": {
+                    "meeting_title": "일괄 승인",
+                    "meeting_date": "2026-03-02",
+                    "participants": ["Ops"],
+                    "notes": "external send required",
+                },
+                "requested_by": "qa_user",
+            },
+            headers=self.req_headers,
+        )
+        self.assertEqual(create_resp.status_code, 201)
+        task_id = create_resp.json()["task_id"]
+        run_resp = self.client.post(
+            "/api/v1/task/run",
+            json={"task_id": task_id, "idempotency_key": idempotency_key, "run_mode": "standard"},
+            headers=self.req_headers,
+        )
+        self.assertEqual(run_resp.status_code, 202)
+        approval_payload = self._wait_status(task_id, {"NEEDS_HUMAN_APPROVAL"})
+        self.assertIsNotNone(approval_payload)
+        return task_id, approval_payload["approval_queue_id"]
+
+    def test_bulk_decisions_report_per_item_results(self) -> None:
+        first_task, first_queue = self._blocked_task("bulk_1")
+        second_task, second_queue = self._blocked_task("bulk_2")
+        events = self.client.get(f"/api/v1/task/events/{first_task}", headers=self.reviewer_headers).json()["items"]
+        blocked = [event for event in events if event["event_type"] == "BLOCKED_POLICY"]
+        self.assertEqual(blocked[0]["reason_code"], "external_send_requested")
+        self.assertEqual(blocked[0]["policy_version"], POLICY_STORE.current().version)
+
+        mismatch = self.client.post(
+            "/api/v1/approvals/bulk",
+            json={"queue_ids": [first_queue], "action": "REJECT", "acted_by": "spoofed_user"},
+            headers=self.approver_headers,
+        )
+        self.assertEqual(mismatch.status_code, 403)
+
+        resp = self.client.post(
+            "/api/v1/approvals/bulk",
+            json={
+                "queue_ids": [first_queue, "aq_missing", second_queue, first_queue],
+                "action": "REJECT",
+                "acted_by": "qa_approver",
+                "comment": "backlog cleanup",
+            },
+            headers=self.approver_headers,
+        )
+        self.assertEqual(resp.status_code, 200)
+        payload = resp.json()
+        self.assertEqual((payload["requested"], payload["succeeded"], payload["failed"]), (3, 2, 1))
+        self.assertEqual([item["queue_id"] for item in payload["results"]], [first_queue, "aq_missing", second_queue])
+        self.assertEqual(payload["results"][0]["task_status"], "DONE")
+        self.assertEqual(payload["results"][1]["error"]["code"], "APPROVAL_NOT_FOUND")
+
+        again = self.client.post(
+            "/api/v1/approvals/bulk",
+            json={"queue_ids": [second_queue], "action": "APPROVE", "acted_by": "qa_approver"},
+            headers=self.approver_headers,
+        ).json()
+        self.assertEqual(again["results"][0]["error"]["code"], "INVALID_APPROVAL_STATE")
+
+        for task_id in (first_task, second_task):
+            status_resp = self.client.get(f"/api/v1/task/status/{task_id}", headers=self.req_headers)
+            self.assertEqual(status_resp.json()["final_reason"], "rejected_by_human")
+
+        third_task, third_queue = self._blocked_task("bulk_3")
+        approved = self.client.post(
+            "/api/v1/approvals/bulk",
+            json={"queue_ids": [third_queue], "action": "APPROVE", "acted_by": "qa_approver"},
+            headers=self.approver_headers,
+        ).json()
+        self.assertEqual(approved["succeeded"], 1)
+        self.assertEqual(approved["results"][0]["status"], "APPROVED")
+        final_payload = self._wait_status(third_task, {"DONE"})
+        self.assertIsNotNone(final_payload)
+
+    def _blocked_tasks(self, count: int) -> list[tuple[str, str]]:
+        item = {
+            "title": "대량 승인 검증",
+            "template_type": "meeting_summary",
+            "input": {
+                "meeting_title": "대량 승인",
+                "meeting_date": "2026-03-02",
+                "participants": ["Ops"],
+                "notes": "external send required",
+            },
+            "requested_by": "qa_user",
+        }
+        resp = self.client.post(
+            "/api/v1/task/create/batch", json={"items": [item] * count, "start": True}, headers=self.req_headers
+        )
+        self.assertEqual(resp.json()["started"], count)
+        task_ids = [result["task_id"] for result in resp.json()["results"]]
+        deadline = time.time() + 30
+        while time.time() < deadline:
+            if all(runtime.TASKS[task_id]["status"] == "NEEDS_HUMAN_APPROVAL" for task_id in task_ids):
+                break
+            time.sleep(0.05)
+        return [(task_id, runtime.TASKS[task_id]["approval_queue_id"]) for task_id in task_ids]
+
+    def test_lazy_hydration_drops_finished_tasks_and_resolved_approvals(self) -> None:
+        with mock.patch.object(runtime, "LAZY_HYDRATION", True):
+            (rejected_id, rejected_queue), (approved_id, approved_queue) = self._blocked_tasks(2)
+            before = {name: len(getattr(runtime, name)) for name in ("TASKS", "TASK_EVENT_INDEX", "APPROVAL_QUEUE")}
+
+            body = {"acted_by": "qa_approver"}
+            resp = self.client.post(f"/api/v1/approvals/{rejected_queue}/reject", json=body, headers=self.approver_headers)
+            self.assertEqual(resp.status_code, 200)
+            resp = self.client.post(f"/api/v1/approvals/{approved_queue}/approve", json=body, headers=self.approver_headers)
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(self._wait_status(approved_id, {"DONE"})["status"], "DONE")
+
+            for name, size in before.items():
+                self.assertLessEqual(len(getattr(runtime, name)), size - 2, name)
+            for task_id in (rejected_id, approved_id):
+                self.assertNotIn(task_id, runtime.TASKS)
+                self.assertNotIn(task_id, runtime.TASK_EVENT_INDEX)
+            self.assertNotIn(rejected_queue, runtime.APPROVAL_QUEUE)
+
+            # The store serves them from here on.
+            status = self.client.get(f"/api/v1/task/status/{rejected_id}", headers=self.req_headers).json()
+            self.assertEqual(status["final_reason"], "rejected_by_human")
+            events = self.client.get(f"/api/v1/task/events/{rejected_id}", headers=self.req_headers).json()
+            self.assertEqual(events["items"][-1]["event_type"], "HUMAN_REJECTED")
+            pending = self.client.get("/api/v1/approvals", params={"status": "PENDING"}, headers=self.approver_headers)
+            self.assertNotIn(approved_queue, [item["queue_id"] for item in pending.json()["items"]])
+
+    def test_bulk_approve_beyond_queue_capacity_starts_every_item(self) -> None:
+        # More items than the pipeline queue holds (NEWCLAW_SCHEDULER_QUEUE_SIZE, default 256).
+        count = SCHEDULER.queue_size + 44
+        blocked = self._blocked_tasks(count)
+        resp = self.client.post(
+            "/api/v1/approvals/bulk",
+            json={"queue_ids": [queue_id for _, queue_id in blocked], "action": "APPROVE", "acted_by": "qa_approver"},
+            headers=self.approver_headers,
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["succeeded"], count)
+
+        deadline = time.time() + 60
+        while time.time() < deadline:
+            if all(runtime.TASKS[task_id]["status"] == "DONE" for task_id, _ in blocked):
+                break
+            time.sleep(0.05)
+        self.assertTrue(all(runtime.TASKS[task_id]["status"] == "DONE" for task_id, _ in blocked))
+
+    def test_failed_bulk_commit_leaves_memory_and_scheduler_untouched(self) -> None:
+        blocked = self._blocked_tasks(2)
+        events_before = {task_id: len(runtime.TASK_EVENT_INDEX[task_id]) for task_id, _ in blocked}
+        submitted_before = SCHEDULER.stats()["submitted"]
+
+        @contextmanager
+        def failing_transaction():
+            yield
+            raise RuntimeError("commit failed")
+
+        client = TestClient(APP, raise_server_exceptions=False)
+        with mock.patch.object(runtime.STATE_STORE, "transaction", failing_transaction):
+            queue_ids = [queue_id for _, queue_id in blocked]
+            resp = client.post(
+                "/api/v1/approvals/bulk",
+                json={"queue_ids": queue_ids, "action": "APPROVE", "acted_by": "qa_approver"},
+                headers=self.approver_headers,
+            )
+            self.assertEqual(resp.status_code, 500)
+            tasks_before = len(runtime.TASKS)
+            item = {
+                "title": "커밋 실패",
+                "template_type": "meeting_summary",
+                "input": {"meeting_title": "실패", "meeting_date": "2026-03-02", "participants": ["Kim"], "notes": "업무A"},
+                "requested_by": "qa_user",
+            }
+            batch = client.post(
+                "/api/v1/task/create/batch", json={"items": [item, item], "start": True}, headers=self.req_headers
+            )
+            self.assertEqual(batch.status_code, 500)
+            self.assertEqual(len(runtime.TASKS), tasks_before)
+
+        for task_id, queue_id in blocked:
+            self.assertEqual(runtime.TASKS[task_id]["status"], "NEEDS_HUMAN_APPROVAL")
+            self.assertEqual(runtime.APPROVAL_QUEUE[queue_id]["status"], "PENDING")
+            self.assertEqual(len(runtime.TASK_EVENT_INDEX[task_id]), events_before[task_id])
+        self.assertEqual(SCHEDULER.stats()["submitted"], submitted_before)
+        # Reserved slots were handed back.
+        self.assertEqual(SCHEDULER.reserve(SCHEDULER.backlog_size), SCHEDULER.backlog_size)
+        SCHEDULER.release(SCHEDULER.backlog_size)
+
+    def test_batch_create_reports_per_item_results(self) -> None:
+        valid = {
+            "title": "일괄 생성",
+            "template_type": "meeting_summary",
+            "input": {
+                "meeting_title": "일괄 생성 회의",
+                "meeting_date": "2026-03-02",
+                "participants": ["Kim"],
+                "notes": "업무A 진행",
+            },
+            "requested_by": "qa_user",
+        }
+        resp = self.client.post(
+            "/api/v1/task/create/batch",
+            json={
+                "items": [
+                    valid,
+                    {**valid, "input": {"meeting_title": "누락"}},
+                    {**valid, "requested_by": "someone_else"},
+                    valid,
+                ],
+                "start": True,
+            },
+            headers=self.req_headers,
+        )
+        self.assertEqual(resp.status_code, 200)
+        payload = resp.json()
+        self.assertEqual((payload["requested"], payload["created"], payload["failed"]), (4, 2, 2))
+        self.assertEqual(payload["started"], 2)
+        results = payload["results"]
+        self.assertEqual([item["ok"] for item in results], [True, False, False, True])
+        self.assertEqual(results[1]["error"]["code"], "INVALID_REQUEST")
+        self.assertEqual(results[2]["error"]["code"], "FORBIDDEN")
+        self.assertEqual(results[0]["status"], "RUNNING")
+
+        for item in (results[0], results[3]):
+            final_payload = self._wait_status(item["task_id"], {"DONE"})
+            self.assertIsNotNone(final_payload)
+
+        ready = self.client.post("/api/v1/task/create/batch", json={"items": [valid]}, headers=self.req_headers).json()
+        self.assertEqual(ready["results"][0]["status"], "READY")
+        self.assertEqual(ready["started"], 0)
+
+    def test_event_stream_pushes_status_changes(self) -> None:
+        create_resp = self.client.post(
+            "/api/v1/task/create",
+            json={
+                "title": "스트림 검증",
+                "template_type": "meeting_summary",
+                "input": {
+                    "meeting_title": "스트림회의",
+                    "meeting_date": "2026-02-24",
+                    "participants": ["Kim", "Lee"],
+                    "notes": "업무A 진행",
+                },
+                "requested_by": "qa_user",
+            },
+            headers=self.req_headers,
+        )
+        self.assertEqual(create_resp.status_code, 201)
+        task_id = create_resp.json()["task_id"]
+
+        run_resp = self.client.post(
+            "/api/v1/task/run",
+            json={"task_id": task_id, "idempotency_key": "stream_1", "run_mode": "standard"},
+            headers=self.req_headers,
+        )
+        self.assertEqual(run_resp.status_code, 202)
+
+        # The stream closes by itself once the task is DONE and every event was delivered.
+        with self.client.stream("GET", f"/api/v1/task/events/{task_id}/stream", headers=self.req_headers) as stream:
+            self.assertEqual(stream.status_code, 200)
+            self.assertTrue(stream.headers["content-type"].startswith("text/event-stream"))
+            body = "".join(stream.iter_text())
+
+        events = [
+            json.loads(line[len("data: "):]) for line in body.splitlines() if line.startswith("data: ")
+        ]
+        self.assertTrue(events)
+        self.assertTrue(all(event["event_type"] in {"STATUS_CHANGED", "STAGE_CHANGED"} for event in events))
+        statuses = [event["to_status"] for event in events if event["event_type"] == "STATUS_CHANGED"]
+        self.assertEqual(statuses[-1], "DONE")
+
+        poll_resp = self.client.get(
+            f"/api/v1/task/events/{task_id}/poll",
+            params={"after_seq": events[-1]["seq"], "timeout": 5},
+            headers=self.req_headers,
+        )
+        self.assertEqual(poll_resp.status_code, 200)
+        self.assertEqual(poll_resp.json()["status"], "DONE")
+        self.assertEqual(poll_resp.json()["items"], [])
+
+    def test_waiting_long_polls_do_not_starve_sync_endpoints(self) -> None:
+        create_resp = self.client.post(
+            "/api/v1/task/create",
+            json={
+                "title": "롱폴 동시성",
+                "template_type": "meeting_summary",
+                "input": {"meeting_title": "대기회의", "meeting_date": "2026-02-24", "participants": ["Kim"], "notes": "업무A"},
+                "requested_by": "qa_user",
+            },
+            headers=self.req_headers,
+        )
+        task_id = create_resp.json()["task_id"]
+        url = f"/api/v1/task/events/{task_id}/poll"
+        after_seq = self.client.get(url, params={"timeout": 0}, headers=self.req_headers).json()["next_after_seq"]
+
+        # More waiters than the default threadpool (40 threads) could hold.
+        watchers = 50
+        with TestClient(APP) as client, ThreadPoolExecutor(max_workers=watchers) as pool:
+            polls = [
+                pool.submit(client.get, url, params={"after_seq": after_seq, "timeout": 3}, headers=self.req_headers)
+                for _ in range(watchers)
+            ]
+            deadline = time.time() + 5
+            while EVENT_BROKER.stats()["waiters"] < watchers and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertGreaterEqual(EVENT_BROKER.stats()["waiters"], watchers)
+
+            started = time.monotonic()
+            self.assertEqual(client.get("/health").status_code, 200)
+            status = client.get(f"/api/v1/task/status/{task_id}", headers=self.req_headers)
+            self.assertEqual(status.status_code, 200)
+            self.assertLess(time.monotonic() - started, 1.0)
+            self.assertTrue(all(poll.result().status_code == 200 for poll in polls))
+
+    def test_ops_stats_requires_admin(self) -> None:
+        forbidden = self.client.get("/api/v1/ops/stats", headers=self.reviewer_headers)
+        self.assertEqual(forbidden.status_code, 403)
+
+        admin_headers = {"Authorization": f"Bearer {issue_dev_jwt('qa_admin', 'admin')}"}
+        ok = self.client.get("/api/v1/ops/stats", headers=admin_headers)
+        self.assertEqual(ok.status_code, 200)
+        scheduler = ok.json()["scheduler"]
+        self.assertIn("queue_depth", scheduler)
+        self.assertIn("wait_seconds_avg", scheduler)
+
+    def test_metrics_exposes_pipeline_histograms(self) -> None:
+        forbidden = self.client.get("/metrics", headers=self.reviewer_headers)
+        self.assertEqual(forbidden.status_code, 403)
+
+        create_resp = self.client.post(
+            "/api/v1/task/create",
+            json={
+                "title": "지표 확인",
+                "template_type": "meeting_summary",
+                "input": {
+                    "meeting_title": "지표 점검",
+                    "meeting_date": "2026-03-04",
+                    "participants": ["Kim"],
+                    "notes": "단계별 소요 시간 확인",
+                },
+                "requested_by": "qa_user",
+            },
+            headers=self.req_headers,
+        )
+        self.assertEqual(create_resp.status_code, 201)
+        task_id = create_resp.json()["task_id"]
+        run_resp = self.client.post(
+            "/api/v1/task/run",
+            json={"task_id": task_id, "idempotency_key": "metrics_run", "run_mode": "standard"},
+            headers=self.req_headers,
+        )
+        self.assertEqual(run_resp.status_code, 202)
+        self.assertIsNotNone(self._wait_status(task_id, {"DONE"}))
+
+        admin_headers = {"Authorization": f"Bearer {issue_dev_jwt('qa_admin', 'admin')}"}
+        resp = self.client.get("/metrics", headers=admin_headers)
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.headers["content-type"].startswith("text/plain"))
+        body = resp.text
+        for stage in ("planner", "executor", "reviewer", "reporter"):
+            self.assertIn(f'newclaw_stage_duration_seconds_count{{stage="{stage}"}}', body)
+        self.assertIn('newclaw_run_duration_seconds_count{outcome="DONE"}', body)
+        self.assertIn("newclaw_task_lock_wait_seconds_count", body)
+        self.assertIn('newclaw_state_store_seconds_count{method="transaction"}', body)
+        self.assertIn('newclaw_tasks{status="DONE"}', body)
+        self.assertIn("newclaw_scheduler_queue_depth", body)
+
+    def test_duplicate_input_reuses_rendered_report(self) -> None:
+        admin_headers = {"Authorization": f"Bearer {issue_dev_jwt('qa_admin', 'admin')}"}
+        payload = {
+            "title": "중복 제출",
+            "template_type": "meeting_summary",
+            "input": {
+                "meeting_title": "캐시 검증",
+                "meeting_date": "2026-03-03",
+                "participants": ["Kim"],
+                "notes": "동일 입력\n두 번 제출",
+            },
+            "requested_by": "qa_user",
+        }
+        report_paths = []
+        hits_before = self.client.get("/api/v1/ops/stats", headers=admin_headers).json()["render_cache"]["hits"]
+        for idx in range(2):
+            task_id = self.client.post("/api/v1/task/create", json=payload, headers=self.req_headers).json()["task_id"]
+            run_resp = self.client.post(
+                "/api/v1/task/run",
+                json={"task_id": task_id, "idempotency_key": f"render_cache_{idx}", "run_mode": "standard"},
+                headers=self.req_headers,
+            )
+            self.assertEqual(run_resp.status_code, 202)
+            final_payload = self._wait_status(task_id, {"DONE"})
+            self.assertIsNotNone(final_payload)
+            report_paths.append(final_payload["result"]["report_path"])
+
+        self.assertNotEqual(report_paths[0], report_paths[1])
+        with open(report_paths[0], encoding="utf-8") as first, open(report_paths[1], encoding="utf-8") as second:
+            self.assertEqual(first.read(), second.read())
+        stats = self.client.get("/api/v1/ops/stats", headers=admin_headers).json()["render_cache"]
+        self.assertGreaterEqual(stats["hits"], hits_before + 1)
+
+        result = self.client.get(f"/api/v1/task/result/{task_id}", headers=self.req_headers)
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(result.json()["report_path"], report_paths[1])
+        self.assertIn("# 회의 결과 요약", result.json()["content"])
+
+    def test_result_requires_a_report(self) -> None:
+        create_resp = self.client.post(
+            "/api/v1/task/create",
+            json={
+                "title": "미실행",
+                "template_type": "meeting_summary",
+                "input": {"meeting_title": "대기", "meeting_date": "2026-03-03", "participants": ["Kim"], "notes": "a"},
+                "requested_by": "qa_user",
+            },
+            headers=self.req_headers,
+        )
+        task_id = create_resp.json()["task_id"]
+        resp = self.client.get(f"/api/v1/task/result/{task_id}", headers=self.req_headers)
+        self.assertEqual(resp.status_code, 409)
+        self.assertEqual(resp.json()["detail"]["error"]["code"], "INVALID_TASK_STATE")
+
+    def test_retry_requeues_through_scheduler_not_inline(self) -> None:
+        with mock.patch.object(runtime, "_run_pipeline") as run_pipeline, mock.patch.object(runtime, "Timer") as timer:
+            with mock.patch.object(runtime.SCHEDULER, "reserve", return_value=1):
+                with mock.patch.object(runtime.SCHEDULER, "submit_reserved") as submit_reserved:
+                    runtime._requeue_pipeline("task_requeue")
+            submit_reserved.assert_called_once_with(run_pipeline, [("task_requeue",)])
+
+            # Backlog full as well: back off and try again later, still never inline.
+            with mock.patch.object(runtime.SCHEDULER, "reserve", return_value=0):
+                runtime._requeue_pipeline("task_requeue", attempt=3)
+            run_pipeline.assert_not_called()
+            timer.assert_called_once_with(
+                min(runtime.REQUEUE_BACKOFF_SECONDS * 8, runtime.REQUEUE_BACKOFF_MAX_SECONDS),
+                runtime._requeue_pipeline,
+                ("task_requeue", 4),
+            )
+            timer.return_value.start.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
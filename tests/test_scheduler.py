@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+import unittest
+
+from app.scheduler import PipelineScheduler, SchedulerSaturated
+
+
+class TestPipelineScheduler(unittest.TestCase):
+    def test_runs_submitted_jobs(self) -> None:
+        scheduler = PipelineScheduler(workers=2, queue_size=8)
+        done = threading.Event()
+        seen: list[str] = []
+
+        def job(task_id: str) -> None:
+            seen.append(task_id)
+            done.set()
+
+        scheduler.submit(job, "task_a")
+        self.assertTrue(done.wait(timeout=2.0))
+        self.assertEqual(seen, ["task_a"])
+
+    def test_rejects_when_queue_is_full(self) -> None:
+        scheduler = PipelineScheduler(workers=1, queue_size=1)
+        release = threading.Event()
+        running = threading.Event()
+
+        def blocker() -> None:
+            running.set()
+            release.wait(timeout=5.0)
+
+        scheduler.submit(blocker)
+        self.assertTrue(running.wait(timeout=2.0))
+        scheduler.submit(blocker)
+        with self.assertRaises(SchedulerSaturated):
+            scheduler.submit(blocker)
+
+        stats = scheduler.stats()
+        self.assertEqual(stats["queue_depth"], 1)
+        self.assertEqual(stats["busy_workers"], 1)
+        self.assertEqual(stats["rejected"], 1)
+        release.set()
+
+    def test_reserved_batch_larger_than_queue_runs_whole(self) -> None:
+        scheduler = PipelineScheduler(workers=2, queue_size=4, backlog_size=100)
+        seen: list[int] = []
+        lock = threading.Lock()
+        done = threading.Event()
+
+        def job(idx: int) -> None:
+            with lock:
+                seen.append(idx)
+                if len(seen) == 50:
+                    done.set()
+
+        self.assertEqual(scheduler.reserve(50), 50)
+        scheduler.submit_reserved(job, [(idx,) for idx in range(50)])
+        self.assertTrue(done.wait(timeout=5.0))
+        self.assertEqual(sorted(seen), list(range(50)))
+        self.assertEqual(scheduler.stats()["submitted"], 50)
+
+    def test_reserve_is_bounded_by_backlog_and_released_slots_return(self) -> None:
+        scheduler = PipelineScheduler(workers=1, queue_size=1, backlog_size=10)
+        self.assertEqual(scheduler.reserve(6), 6)
+        self.assertEqual(scheduler.reserve(6), 4)
+        self.assertEqual(scheduler.stats()["rejected"], 2)
+        scheduler.release(4)
+        self.assertEqual(scheduler.reserve(10), 4)
+
+    def test_failed_job_does_not_kill_worker(self) -> None:
+        scheduler = PipelineScheduler(workers=1, queue_size=4)
+        done = threading.Event()
+
+        def broken() -> None:
+            raise RuntimeError("boom")
+
+        with self.assertLogs("app.scheduler", level="ERROR"):
+            scheduler.submit(broken)
+            scheduler.submit(done.set)
+            self.assertTrue(done.wait(timeout=2.0))
+        self.assertEqual(scheduler.stats()["failed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from app.persistence import SQLiteStateStore
+
+
+def _event(idx: int, task_id: str = "task_gc") -> dict:
+    return {
+        "event_id": f"evt_gc_{idx}",
+        "task_id": task_id,
+        "event_type": "STAGE_CHANGED",
+        "created_at": "2026-03-01T00:00:00+00:00",
+        "stage": "planner",
+    }
+
+
+class _FailingConnection:
+    # Every statement fails and so does the rollback, like a disk that went away.
+    def execute(self, *args: object) -> None:
+        raise sqlite3.OperationalError("disk I/O error")
+
+    def commit(self) -> None:
+        raise sqlite3.OperationalError("disk I/O error")
+
+    def rollback(self) -> None:
+        raise sqlite3.OperationalError("disk I/O error")
+
+
+class _SlowConnection:
+    # Commits normally, but only after the caller's commit timeout has passed.
+    def __init__(self, conn: sqlite3.Connection, delay: float) -> None:
+        self._conn = conn
+        self._delay = delay
+
+    def execute(self, *args: object) -> sqlite3.Cursor:
+        return self._conn.execute(*args)
+
+    def commit(self) -> None:
+        time.sleep(self._delay)
+        self._conn.commit()
+
+    def rollback(self) -> None:
+        self._conn.rollback()
+
+
+class TestSQLiteGroupCommit(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = str(Path(tmp.name) / "state.db")
+
+    def _event_count(self) -> int:
+        # A fresh connection only sees committed rows.
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def test_concurrent_writers_are_all_durable(self) -> None:
+        store = SQLiteStateStore(self.db_path, group_commit=True, commit_window_ms=5)
+
+        def writer(offset: int) -> None:
+            for idx in range(25):
+                store.save_event(_event(offset * 100 + idx))
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # A fresh connection only sees committed rows.
+        with sqlite3.connect(self.db_path) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        self.assertEqual(count, 200)
+
+    def test_failed_statement_only_fails_its_caller(self) -> None:
+        store = SQLiteStateStore(self.db_path, group_commit=True, commit_window_ms=20)
+        errors: list[BaseException] = []
+
+        def good() -> None:
+            store.save_event(_event(1))
+
+        def bad() -> None:
+            try:
+                store.save_task({"task_id": "task_bad", "status": "READY", "requested_by": None, "updated_at": "x"})
+            except sqlite3.IntegrityError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=good), threading.Thread(target=bad)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(errors), 1)
+        _, events, _, _, _ = store.load_state()
+        self.assertEqual([event["event_id"] for event in events], ["evt_gc_1"])
+
+    def test_failed_rollback_releases_callers_and_fails_fast(self) -> None:
+        store = SQLiteStateStore(self.db_path, group_commit=True, commit_timeout_seconds=5)
+        real_conn = store.conn
+        self.addCleanup(real_conn.close)
+        store.conn = _FailingConnection()  # type: ignore[assignment]
+
+        errors: list[BaseException] = []
+
+        def writer(idx: int) -> None:
+            try:
+                store.save_event(_event(idx))
+            except BaseException as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertEqual(len(errors), 4)
+        self.assertTrue(all(isinstance(exc, sqlite3.OperationalError) for exc in errors))
+        self.assertTrue(store.stats()["broken"])
+        with self.assertRaises(sqlite3.OperationalError):
+            store.save_event(_event(99))
+
+    def test_timed_out_write_is_cancelled_before_the_committer_runs_it(self) -> None:
+        store = SQLiteStateStore(self.db_path, commit_timeout_seconds=0.05)
+        self.addCleanup(store.conn.close)
+        # Group commit without a committer thread: the write stays queued until flushed here.
+        store.group_commit = True
+        with self.assertRaises(TimeoutError):
+            store.save_event(_event(1))
+        pending = store._pending.get_nowait()
+        self.assertTrue(pending.cancelled)
+
+        store._flush([pending])
+        self.assertFalse(pending.claimed)
+        self.assertEqual(self._event_count(), 0)
+
+    def test_timeout_after_the_committer_started_waits_for_the_outcome(self) -> None:
+        store = SQLiteStateStore(self.db_path, group_commit=True, commit_timeout_seconds=0.05)
+        real_conn = store.conn
+        self.addCleanup(real_conn.close)
+        store.conn = _SlowConnection(real_conn, delay=0.3)  # type: ignore[assignment]
+
+        store.save_event(_event(1))
+        self.assertEqual(self._event_count(), 1)
+
+    def test_transaction_commits_buffered_writes_together(self) -> None:
+        for group_commit in (False, True):
+            store = SQLiteStateStore(str(Path(self.db_path).with_suffix(f".{group_commit}.db")), group_commit=group_commit)
+            with store.transaction():
+                store.save_event(_event(1))
+                with store.transaction():
+                    store.save_event(_event(2))
+                self.assertEqual(store.load_state()[1], [])
+            self.assertEqual(len(store.load_state()[1]), 2)
+
+    def test_transaction_discards_writes_on_error(self) -> None:
+        store = SQLiteStateStore(self.db_path)
+        with self.assertRaises(RuntimeError):
+            with store.transaction():
+                store.save_event(_event(1))
+                raise RuntimeError("abort")
+        self.assertEqual(store.load_state()[1], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import importlib
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Any, Callable
+from uuid import uuid4
+
+from app.persistence import SQLiteStateStore, StateStore
+
+TEST_DATABASE_URL = os.getenv("NEWCLAW_TEST_DATABASE_URL", "").strip()
+# "package.module:callable" returning a StateStore, to run this suite against a new backend.
+TEST_STORE_FACTORY = os.getenv("NEWCLAW_TEST_STORE_FACTORY", "").strip()
+
+
+def _load_factory(spec: str) -> Callable[[], StateStore]:
+    module_name, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+class StateStoreConformance:
+    # Behaviour every StateStore must share. Subclasses provide make_store(); ids are unique
+    # per test so the suite can also run against a shared database.
+    def make_store(self) -> StateStore:
+        raise NotImplementedError
+
+    def setUp(self) -> None:
+        self.store = self.make_store()
+        self.prefix = uuid4().hex[:12]
+
+    def _task(self, name: str, status: str = "RUNNING", **extra: Any) -> dict[str, Any]:
+        return {
+            "task_id": f"task_{self.prefix}_{name}",
+            "title": "conformance",
+            "template_type": "meeting_summary",
+            "input": {"notes": "한글 입력"},
+            "requested_by": "conformance_user",
+            "status": status,
+            "updated_at": "2026-03-01T00:00:00+00:00",
+            **extra,
+        }
+
+    def _event(self, task_id: str, idx: int, seq: int, event_type: str = "STAGE_CHANGED") -> dict[str, Any]:
+        return {
+            "event_id": f"evt_{self.prefix}_{idx}",
+            "task_id": task_id,
+            "event_type": event_type,
+            "created_at": "2026-03-01T00:00:00+00:00",
+            "seq": seq,
+        }
+
+    def _approval(self, name: str, status: str, updated_at: str, group: str) -> dict[str, Any]:
+        return {
+            "queue_id": f"aq_{self.prefix}_{name}",
+            "task_id": f"task_{self.prefix}_{name}",
+            "status": status,
+            "approver_group": group,
+            "reason_code": "external_send_requested",
+            "created_at": updated_at,
+            "resolved_at": None,
+        }
+
+    def test_task_round_trip_and_upsert(self) -> None:
+        task = self._task("a")
+        self.store.save_task(task)
+        self.assertEqual(self.store.get_task(task["task_id"]), task)
+
+        updated = {**task, "status": "DONE", "result": {"report_path": "reports/x.md"}}
+        self.store.save_task(updated)
+        self.assertEqual(self.store.get_task(task["task_id"]), updated)
+        self.assertIsNone(self.store.get_task(f"task_{self.prefix}_missing"))
+
+        tasks = self.store.load_state()[0]
+        self.assertEqual(tasks[task["task_id"]], updated)
+
+    def test_events_are_read_in_seq_order(self) -> None:
+        task_id = self._task("events")["task_id"]
+        base = self.store.max_event_seq() + 1000
+        for idx, seq in enumerate((base + 3, base + 1, base + 2)):
+            self.store.save_event(self._event(task_id, idx, seq))
+
+        events = self.store.load_task_events(task_id)
+        self.assertEqual([event["seq"] for event in events], [base + 1, base + 2, base + 3])
+        after = self.store.load_task_events(task_id, after_seq=base + 1)
+        self.assertEqual([event["seq"] for event in after], [base + 2, base + 3])
+        self.assertEqual(len(self.store.load_task_events(task_id, limit=1)), 1)
+        self.assertEqual(self.store.max_event_seq(), base + 3)
+
+        loaded = [event for event in self.store.load_state()[1] if event["task_id"] == task_id]
+        self.assertEqual([event["seq"] for event in loaded], [base + 1, base + 2, base + 3])
+
+    def test_audit_counter_deltas_add_up(self) -> None:
+        name = f"events:TEST_{self.prefix}"
+        self.store.add_audit_counters({name: 2, f"approvals:TEST_{self.prefix}": 1})
+        self.store.add_audit_counters({name: 3})
+        self.store.add_audit_counters({name: -1})
+        counters = self.store.load_audit_counters()
+        self.assertEqual(counters[name], 4)
+        self.assertEqual(counters[f"approvals:TEST_{self.prefix}"], 1)
+
+    def test_audit_counter_deltas_commit_with_their_transaction(self) -> None:
+        name = f"events:TEST_{self.prefix}"
+        with self.assertRaises(RuntimeError):
+            with self.store.transaction():
+                self.store.add_audit_counters({name: 1})
+                raise RuntimeError("rolled back")
+        self.assertNotIn(name, self.store.load_audit_counters())
+
+        with self.store.transaction():
+            self.store.add_audit_counters({name: 1})
+            self.store.add_audit_counters({name: 2})
+            self.assertNotIn(name, self.store.load_audit_counters())
+        self.assertEqual(self.store.load_audit_counters()[name], 3)
+
+    def test_concurrent_audit_counter_deltas_are_not_lost(self) -> None:
+        name = f"events:TEST_{self.prefix}"
+
+        def flusher() -> None:
+            for _ in range(20):
+                self.store.add_audit_counters({name: 1})
+
+        threads = [threading.Thread(target=flusher) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.store.load_audit_counters()[name], 80)
+
+    def test_approval_upserts_and_pages_by_key(self) -> None:
+        group = f"group_{self.prefix}"
+        for idx in range(5):
+            self.store.save_approval(self._approval(str(idx), "PENDING", f"2026-03-01T00:00:0{idx}+00:00", group))
+        resolved = {
+            **self._approval("0", "APPROVED", "2026-03-01T00:00:00+00:00", group),
+            "resolved_at": "2026-03-02T00:00:00+00:00",
+        }
+        self.store.save_approval(resolved)
+        self.assertEqual(self.store.get_approval(resolved["queue_id"]), resolved)
+
+        first = self.store.list_approvals("PENDING", group, limit=2)
+        self.assertEqual([item["queue_id"] for item in first], [f"aq_{self.prefix}_1", f"aq_{self.prefix}_2"])
+        last = first[-1]
+        rest = self.store.list_approvals("PENDING", group, after=(last["created_at"], last["queue_id"]))
+        self.assertEqual([item["queue_id"] for item in rest], [f"aq_{self.prefix}_3", f"aq_{self.prefix}_4"])
+
+    def test_idempotency_keys(self) -> None:
+        task_id = self._task("idem")["task_id"]
+        self.store.save_idempotency(task_id, "key_1", task_id)
+        self.assertEqual(self.store.get_idempotency(task_id, "key_1"), task_id)
+        self.assertIsNone(self.store.get_idempotency(task_id, "key_2"))
+        self.assertEqual(self.store.load_state()[4][(task_id, "key_1")], task_id)
+
+    def test_transaction_commits_together_or_not_at_all(self) -> None:
+        committed = self._task("tx_ok")
+        with self.store.transaction():
+            self.store.save_task(committed)
+            with self.store.transaction():
+                self.store.save_idempotency(committed["task_id"], "nested", committed["task_id"])
+        self.assertIsNotNone(self.store.get_task(committed["task_id"]))
+        self.assertEqual(self.store.get_idempotency(committed["task_id"], "nested"), committed["task_id"])
+
+        discarded = self._task("tx_fail")
+        with self.assertRaises(RuntimeError):
+            with self.store.transaction():
+                self.store.save_task(discarded)
+                raise RuntimeError("abort")
+        self.assertIsNone(self.store.get_task(discarded["task_id"]))
+
+    def test_active_state_skips_terminal_history(self) -> None:
+        group = f"group_{self.prefix}"
+        running = self._task("running")
+        done = self._task("done", status="DONE")
+        seq = self.store.max_event_seq() + 1
+        with self.store.transaction():
+            self.store.save_task(running)
+            self.store.save_task(done)
+            self.store.save_event(self._event(running["task_id"], 0, seq))
+            self.store.save_event(self._event(done["task_id"], 1, seq + 1))
+            self.store.save_idempotency(running["task_id"], "k", running["task_id"])
+            self.store.save_idempotency(done["task_id"], "k", done["task_id"])
+            self.store.save_approval(self._approval("pending", "PENDING", "2026-03-01T00:00:00+00:00", group))
+            self.store.save_approval(self._approval("rejected", "REJECTED", "2026-03-01T00:00:00+00:00", group))
+
+        tasks, events, approvals, actions, idempotency = self.store.load_active_state()
+        self.assertIn(running["task_id"], tasks)
+        self.assertNotIn(done["task_id"], tasks)
+        task_ids = {event["task_id"] for event in events}
+        self.assertIn(running["task_id"], task_ids)
+        self.assertNotIn(done["task_id"], task_ids)
+        self.assertIn(f"aq_{self.prefix}_pending", approvals)
+        self.assertNotIn(f"aq_{self.prefix}_rejected", approvals)
+        self.assertEqual(actions, [])
+        self.assertIn((running["task_id"], "k"), idempotency)
+        self.assertNotIn((done["task_id"], "k"), idempotency)
+
+    def test_concurrent_writers_are_all_persisted(self) -> None:
+        task_id = self._task("concurrent")["task_id"]
+        base = self.store.max_event_seq() + 1
+
+        def writer(offset: int) -> None:
+            for idx in range(25):
+                number = offset * 25 + idx
+                self.store.save_event(self._event(task_id, number, base + number))
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.store.load_task_events(task_id)), 200)
+
+
+class TestSQLiteStateStoreConformance(StateStoreConformance, unittest.TestCase):
+    def make_store(self) -> StateStore:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        store = SQLiteStateStore(str(Path(tmp.name) / "state.db"))
+        self.addCleanup(store.conn.close)
+        return store
+
+
+class TestSQLiteGroupCommitConformance(StateStoreConformance, unittest.TestCase):
+    def make_store(self) -> StateStore:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        store = SQLiteStateStore(str(Path(tmp.name) / "state.db"), group_commit=True, commit_window_ms=1)
+        self.addCleanup(store.conn.close)
+        return store
+
+
+@unittest.skipUnless(TEST_DATABASE_URL, "set NEWCLAW_TEST_DATABASE_URL and install psycopg")
+class TestPostgresStateStoreConformance(StateStoreConformance, unittest.TestCase):
+    def make_store(self) -> StateStore:
+        from app.persistence import PostgresStateStore
+
+        store = PostgresStateStore(TEST_DATABASE_URL, pool_min_size=1, pool_max_size=8)
+        self.addCleanup(store.pool.close)
+        return store
+
+
+@unittest.skipUnless(TEST_STORE_FACTORY, "set NEWCLAW_TEST_STORE_FACTORY=package.module:callable")
+class TestCustomStateStoreConformance(StateStoreConformance, unittest.TestCase):
+    def make_store(self) -> StateStore:
+        return _load_factory(TEST_STORE_FACTORY)()
+
+
+if __name__ == "__main__":
+    unittest.main()